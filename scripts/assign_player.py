@@ -4,33 +4,37 @@ Assign a player to a club by calling overgoal_game.assign_player_to_club()
 This will:
 1. Update the Universe player's user_id
 2. Create a SeasonPlayer entry
+
+With --file, many assignments are read from a CSV file
+(player_id,user_id,club_id) and sent through the transaction pipeline,
+keeping up to --window transactions in flight. --accounts N or
+--accounts-file shard the assignments over several accounts.
 """
 
-import json
-import subprocess
+import asyncio
+import csv
 import sys
 import argparse
 
+from manifest import load_manifest
+from starknet_client import StarknetClient, TransactionError
+from tx_pipeline import DEFAULT_WINDOW, ShardedPipeline, shard_clients
+
 def get_contract_addresses():
     """Get contract addresses from manifest"""
-    with open('manifest_dev.json', 'r') as f:
-        manifest = json.load(f)
+    manifest = load_manifest()
     
-    overgoal_world = manifest['world']['address']
-    overgoal_game_address = None
+    overgoal_world = manifest.world_address
     
-    for contract in manifest['contracts']:
-        if contract['tag'] == 'overgoal-overgoal_game':
-            overgoal_game_address = contract['address']
-            break
-    
-    if not overgoal_game_address:
+    try:
+        overgoal_game_address = manifest.contract_address('overgoal-overgoal_game')
+    except KeyError:
         print("❌ overgoal_game contract not found!")
         sys.exit(1)
     
     return overgoal_world, overgoal_game_address
 
-def assign_player(overgoal_player_id, user_id, club_id):
+async def assign_player(overgoal_player_id, user_id, club_id):
     """Assign a player to a club"""
     overgoal_world, overgoal_game_address = get_contract_addresses()
     
@@ -39,50 +43,93 @@ def assign_player(overgoal_player_id, user_id, club_id):
     print(f"   Contract: {overgoal_game_address}")
     
     calldata = [
-        hex(overgoal_player_id),
-        hex(user_id),
-        hex(club_id),
-    ]
-    
-    cmd = [
-        'sozo', 'execute',
-        '--world', overgoal_world,
-        overgoal_game_address,
-        'assign_player_to_club',
-        *calldata,
-        '--wait'
+        overgoal_player_id,
+        user_id,
+        club_id,
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        async with StarknetClient.from_config() as client:
+            tx_hash = await client.invoke(overgoal_game_address, 'assign_player_to_club', calldata)
         print("\n✅ Player assigned successfully!")
+        print(f"   • Transaction: {hex(tx_hash)}")
         print(f"   • Universe Player {overgoal_player_id} now has user_id = {user_id}")
         print(f"   • SeasonPlayer created (ID: {10000 + overgoal_player_id})")
         print(f"   • Linked to Season 1, Club {club_id} (SeasonClub {100 + club_id})")
         return True
-    except subprocess.CalledProcessError as e:
+    except TransactionError as e:
         print(f"\n❌ Error: {e}")
-        print(f"Stdout: {e.stdout}")
-        print(f"Stderr: {e.stderr}")
         return False
 
-def main():
+def load_assignments(path):
+    """Read (player_id, user_id, club_id) rows from a CSV file with a header"""
+    with open(path, 'r', newline='') as f:
+        return [
+            (int(row['player_id']), int(row['user_id']), int(row['club_id']))
+            for row in csv.DictReader(f)
+        ]
+
+async def assign_players_bulk(assignments, window, accounts=1, accounts_file=None):
+    """Assign many players through the transaction pipeline"""
+    _, overgoal_game_address = get_contract_addresses()
+    
+    print(f"\n🎯 Assigning {len(assignments)} players (window: {window})...")
+    
+    def on_done(job):
+        player_id, user_id, club_id = job.tag
+        if job.succeeded:
+            print(f"   ✅ Player {player_id} → Club {club_id} (User {user_id})")
+        else:
+            print(f"   ❌ Player {player_id} → Club {club_id}: {job.error}")
+    
+    async with StarknetClient.from_config() as client:
+        clients = await shard_clients(client, accounts, accounts_file)
+        pipeline = ShardedPipeline(clients, window=window, on_done=on_done)
+        for assignment in assignments:
+            pipeline.submit([(overgoal_game_address, 'assign_player_to_club', list(assignment))], tag=assignment)
+        jobs = await pipeline.run()
+    
+    failed = [job for job in jobs if not job.succeeded]
+    elapsed = pipeline.stats.elapsed()
+    print(f"\n✅ Assigned: {len(jobs) - len(failed)}/{len(jobs)} in {elapsed:.1f}s "
+          f"({pipeline.stats.retried} retries, {pipeline.stats.resyncs} nonce resyncs)")
+    if len(clients) > 1:
+        for account_address, succeeded, failed_count in pipeline.shard_summary():
+            print(f"   👤 {account_address}: {succeeded} ✅  {failed_count} ❌")
+    if failed:
+        print(f"❌ Failed: {len(failed)}")
+    return not failed
+
+async def main():
     parser = argparse.ArgumentParser(description='Assign a player to a club')
-    parser.add_argument('--player-id', type=int, required=True, help='Overgoal Player ID')
-    parser.add_argument('--user-id', type=int, required=True, help='User ID to assign')
-    parser.add_argument('--club-id', type=int, required=True, help='Club ID (1-4)')
+    parser.add_argument('--player-id', type=int, help='Overgoal Player ID')
+    parser.add_argument('--user-id', type=int, help='User ID to assign')
+    parser.add_argument('--club-id', type=int, help='Club ID (1-4)')
+    parser.add_argument('--file', help='CSV of player_id,user_id,club_id rows to assign in bulk')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW,
+                        help=f'Transactions kept in flight per account in bulk mode (default: {DEFAULT_WINDOW})')
+    parser.add_argument('--accounts', type=int, default=1,
+                        help='Shard bulk assignments over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Shard bulk assignments over the accounts in a JSON file ([{"address", "private_key"}, ...])')
     
     args = parser.parse_args()
     
+    if not args.file and None in (args.player_id, args.user_id, args.club_id):
+        parser.error('--player-id, --user-id and --club-id are required without --file')
+    
     print("=" * 70)
     print("ASSIGN PLAYER TO CLUB")
     print("=" * 70)
     
-    if not assign_player(args.player_id, args.user_id, args.club_id):
+    if args.file:
+        ok = await assign_players_bulk(load_assignments(args.file), args.window, args.accounts, args.accounts_file)
+    else:
+        ok = await assign_player(args.player_id, args.user_id, args.club_id)
+    if not ok:
         sys.exit(1)
     
     print("\n💡 Run show_season_players.py to verify the assignment")
 
 if __name__ == '__main__':
-    main()
-
+    asyncio.run(main())
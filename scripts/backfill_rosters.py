@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Index the season clubs and season players of a season seeded before the
+roster index existed, with admin.backfill_rosters.
+
+On such worlds the SEASON_CLUBS and SEASON_PLAYERS rosters are empty:
+get_season_snapshot lists no clubs or players, create_fixtures finds no clubs
+and seed_players.py sees no season club. The season clubs (--season-club-ids,
+season 1's by default) and the season players of players.json that exist
+on-chain (10000 + user_id) are sent --ids-per-tx at a time. The contract skips
+ids it already indexed, so the script can be re-run at any time.
+
+Usage:
+    ./scripts/backfill_rosters.py
+    ./scripts/backfill_rosters.py --season-club-ids 101 102 103 104 --ids-per-tx 100
+"""
+
+import argparse
+import asyncio
+import sys
+
+from models import (
+    MULTI_GET_BATCH, ROSTER_SCOPE_SEASON_CLUBS, ROSTER_SCOPE_SEASON_PLAYERS, SEASON_1_CLUBS, Roster,
+    read_record, read_season_players,
+)
+from seed_players import SEASON_ID, get_contract_addresses, load_players, season_player_id_of
+from starknet_client import StarknetClient, TransactionError
+
+# Configuration
+DEFAULT_IDS_PER_TX = 100                # Each season player costs up to 3 roster writes and a slot write
+
+async def existing_season_player_ids(client, manifest, ids):
+    """The ids of `ids` with a SeasonPlayer on-chain (backfill_rosters reverts on a missing one)"""
+    chunks = await asyncio.gather(*[
+        read_season_players(client, manifest, ids[i:i + MULTI_GET_BATCH])
+        for i in range(0, len(ids), MULTI_GET_BATCH)
+    ])
+    season_players = [season_player for chunk in chunks for season_player in chunk]
+    return [season_player.id for season_player in season_players if season_player is not None]
+
+async def roster_counts(client, manifest, season_id):
+    """(season clubs, season players) roster sizes"""
+    rosters = await asyncio.gather(*[
+        read_record(client, manifest, Roster, [scope, season_id])
+        for scope in (ROSTER_SCOPE_SEASON_CLUBS, ROSTER_SCOPE_SEASON_PLAYERS)
+    ])
+    return tuple(roster.count if roster is not None else 0 for roster in rosters)
+
+async def main():
+    parser = argparse.ArgumentParser(description='Index the season clubs and players of a pre-roster season')
+    parser.add_argument('--season-club-ids', type=int, nargs='+', default=list(SEASON_1_CLUBS),
+                        help=f'Season clubs to index (default: {" ".join(map(str, SEASON_1_CLUBS))})')
+    parser.add_argument('--ids-per-tx', type=int, default=DEFAULT_IDS_PER_TX,
+                        help=f'Season players per backfill_rosters call (default: {DEFAULT_IDS_PER_TX})')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"SEASON {SEASON_ID} ROSTER BACKFILL")
+    print("=" * 60)
+    
+    players = load_players()
+    manifest, admin_address = get_contract_addresses()
+    
+    async with StarknetClient.from_config() as client:
+        before = await roster_counts(client, manifest, SEASON_ID)
+        print(f"📋 Rosters before: {before[0]} season clubs, {before[1]} season players")
+        
+        ids = await existing_season_player_ids(
+            client, manifest, [season_player_id_of(player) for player in players]
+        )
+        print(f"🔍 {len(ids)}/{len(players)} season players of players.json exist on-chain")
+        
+        # The season clubs go with the first chunk
+        chunks = [ids[i:i + args.ids_per_tx] for i in range(0, len(ids), args.ids_per_tx)] or [[]]
+        for number, chunk in enumerate(chunks):
+            season_club_ids = args.season_club_ids if number == 0 else []
+            calldata = [SEASON_ID, len(season_club_ids), *season_club_ids, len(chunk), *chunk]
+            try:
+                tx_hash = await client.invoke(admin_address, 'backfill_rosters', calldata)
+            except TransactionError as e:
+                print(f"❌ Chunk {number}: backfill_rosters failed: {e}")
+                sys.exit(1)
+            print(f"   ✅ Chunk {number}: {len(season_club_ids)} season clubs, {len(chunk)} season players ({hex(tx_hash)})")
+        
+        after = await roster_counts(client, manifest, SEASON_ID)
+    
+    print("\n" + "=" * 60)
+    print(f"✅ Season clubs indexed: {after[0]} (+{after[0] - before[0]})")
+    print(f"✅ Season players indexed: {after[1]} (+{after[1] - before[1]})")
+    print("=" * 60)
+
+if __name__ == '__main__':
+    asyncio.run(main())
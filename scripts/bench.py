@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Transaction throughput and latency benchmarks against a local katana.
+
+Each scenario sends --txs invokes of one entrypoint through the transaction
+pipeline at every --concurrency level (the number of transactions kept in
+flight), and records:
+- throughput (confirmed transactions per second);
+- latency percentiles, from send to receipt;
+- the L2 gas, steps and fee of the receipts, averaged per transaction.
+
+Scenarios:
+- seed_player                    admin, one new player per transaction
+- seed_season_player             admin, on players seeded beforehand
+- assign_player_to_club          overgoal_game, on players seeded beforehand
+                                 (needs the Universe world deployed, see restart_fresh.sh)
+- add_goal_currency              overgoal_game
+- update_overgoal_player_stats   overgoal_game
+
+Players a scenario needs are seeded with seed_players_batch before the timer
+starts. Every run uses its own block of RUN_ID_STRIDE ids between
+BENCH_ID_BASE and BENCH_ID_LIMIT, far from players.json's and below
+load_gen.py's. A run claims the lowest free block on chain by seeding the
+block's first id as a marker (a block whose marker exists is taken), so runs
+never collide, even concurrent ones, and can be repeated on the same chain.
+
+With --script, a script of this directory runs as a subprocess against the
+same node, timed as a whole, and its transactions are counted from the
+blocks it produced (e.g. `--script "seed_players.py --window 16"`).
+
+With --boot, katana is started from katana.toml, the world is built and
+migrated with sozo and seed_season_1 is called before benchmarking; katana is
+stopped at the end. Otherwise the node in dojo_dev.toml is used as is.
+
+Results are written as JSON (--out). --baseline compares the run against a
+saved result file and exits with 1 on regressions; --compare OLD NEW compares
+two result files without running anything.
+
+Usage:
+    ./scripts/bench.py --boot --out bench.json
+    ./scripts/bench.py --scenarios seed_player add_goal_currency --concurrency 1 8 32 --txs 200
+    ./scripts/bench.py --script "seed_players.py --window 16 --batch-size 25" --out seed.json
+    ./scripts/bench.py --baseline bench.json
+    ./scripts/bench.py --compare bench.json new.json
+"""
+
+import argparse
+import asyncio
+import json
+import shlex
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from manifest import load_manifest
+from models import read_overgoal_players
+from seed_players import player_calldata, seed_batch_calldata
+from starknet_client import ROOT_PATH, StarknetClient, TransactionError
+from tx_pipeline import ShardedPipeline, shard_clients
+
+# Configuration
+SCRIPTS_PATH = Path(__file__).parent
+KATANA_CONFIG_PATH = ROOT_PATH / "katana.toml"
+KATANA_LOG_PATH = Path("/tmp/katana_bench.log")
+KATANA_BOOT_TIMEOUT = 30
+DEFAULT_TXS = 100
+DEFAULT_CONCURRENCY = (1, 4, 16)
+DEFAULT_TOLERANCE = 0.10                # Throughput and latency are noisy
+DEFAULT_GAS_TOLERANCE = 0.01            # Gas and steps are deterministic
+POLL_INTERVAL = 0.05                    # Receipt polling, bounds the latency resolution
+SETUP_BATCH = 25                        # Players per seed_players_batch during setup
+RECEIPT_BATCH = 100
+BENCH_ID_BASE = 10**7                   # First player id of the benchmark runs
+BENCH_ID_LIMIT = 10**12                 # End of the benchmark ids, load_gen.py's start here
+RUN_ID_STRIDE = 10**5                   # Ids reserved per run, marker included (so --txs stays below it)
+RUN_BLOCKS = (BENCH_ID_LIMIT - BENCH_ID_BASE) // RUN_ID_STRIDE
+SEASON_ID = 1
+SEASON_CLUB_COUNT = 4                   # Season 1 clubs 101-104
+PERCENTILES = (50, 90, 99)
+
+def synthetic_player(player_id):
+    """A players.json-shaped player for the benchmarks"""
+    return {
+        'user_id': player_id,
+        'team_id': player_id % SEASON_CLUB_COUNT,
+        'body_type': 0, 'skin_color': 0, 'beard_type': 0, 'hair_type': 0, 'hair_color': 0,
+        'energy': 100, 'speed': 50, 'leadership': 50, 'pass': 50, 'shoot': 50, 'freekick': 50,
+        'visor_type': 0, 'visor_color': 0,
+    }
+
+# --------- Scenarios ---------
+# name -> (contract tag, entrypoint, needs seeded players, calldata of the i-th player id)
+
+SCENARIOS = {
+    'seed_player': (
+        'overgoal-admin', 'seed_player', False,
+        lambda player_id: player_calldata(synthetic_player(player_id)),
+    ),
+    'seed_season_player': (
+        'overgoal-admin', 'seed_season_player', True,
+        lambda player_id: [10000 + player_id, SEASON_ID, 101 + player_id % SEASON_CLUB_COUNT, player_id],
+    ),
+    'assign_player_to_club': (
+        'overgoal-overgoal_game', 'assign_player_to_club', True,
+        lambda player_id: [player_id, player_id, 1 + player_id % SEASON_CLUB_COUNT],
+    ),
+    'add_goal_currency': (
+        'overgoal-overgoal_game', 'add_goal_currency', True,
+        lambda player_id: [player_id, 100],
+    ),
+    'update_overgoal_player_stats': (
+        'overgoal-overgoal_game', 'update_overgoal_player_stats', True,
+        lambda player_id: [player_id, *[(player_id + field) % 100 for field in range(5)]],
+    ),
+}
+
+# --------- Node ---------
+
+async def wait_for_node(client, timeout=KATANA_BOOT_TIMEOUT):
+    """Poll the node until it answers, exits after `timeout` seconds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await client.rpc('starknet_chainId', [])
+            return
+        except Exception:
+            if time.monotonic() > deadline:
+                print(f"❌ Node at {client.rpc_url} not answering after {timeout}s (see {KATANA_LOG_PATH})")
+                sys.exit(1)
+            await asyncio.sleep(0.5)
+
+def run_command(cmd):
+    """Run a command from the project root, exits on failure"""
+    print(f"   $ {' '.join(cmd)}")
+    result = subprocess.run(cmd, cwd=ROOT_PATH, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"❌ {' '.join(cmd)} failed:\n{result.stderr or result.stdout}")
+        sys.exit(1)
+
+async def boot(client):
+    """Start katana from katana.toml, build and migrate the world, seed season 1; returns the katana process"""
+    print(f"🚀 Starting katana (logs: {KATANA_LOG_PATH})...")
+    # katana keeps its own copy of the log descriptor, ours is closed right away
+    with open(KATANA_LOG_PATH, 'w') as log:
+        katana = subprocess.Popen(
+            ['katana', '--config', str(KATANA_CONFIG_PATH)], cwd=ROOT_PATH, stdout=log, stderr=subprocess.STDOUT
+        )
+    
+    # wait_for_node and run_command exit on failure: don't leave katana running behind
+    try:
+        await wait_for_node(client)
+        
+        print("📦 Deploying...")
+        run_command(['sozo', 'build'])
+        run_command(['sozo', 'migrate'])
+        
+        manifest = load_manifest()
+        await client.invoke(manifest.contract_address('overgoal-admin'), 'seed_season_1', [])
+    except BaseException as e:
+        if not isinstance(e, SystemExit):
+            print(f"❌ Deployment failed: {e}")
+        stop_katana(katana)
+        raise
+    print("✅ World deployed and season 1 seeded")
+    return katana
+
+def stop_katana(katana):
+    katana.terminate()
+    katana.wait()
+
+# --------- Measurements ---------
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+def mean(values):
+    return sum(values) / len(values) if values else None
+
+def receipt_costs(receipt):
+    """(l2_gas, steps, fee) of a receipt, None where the node doesn't report it"""
+    resources = receipt.get('execution_resources') or {}
+    fee = receipt.get('actual_fee') or {}
+    l2_gas = resources.get('l2_gas')
+    steps = resources.get('steps')
+    amount = fee.get('amount')
+    return (
+        int(l2_gas, 16) if isinstance(l2_gas, str) else l2_gas,
+        int(steps, 16) if isinstance(steps, str) else steps,
+        int(amount, 16) if amount is not None else None,
+    )
+
+async def read_costs(client, tx_hashes):
+    """[(l2_gas, steps, fee)] of the transactions, receipts read in batches"""
+    costs = []
+    for i in range(0, len(tx_hashes), RECEIPT_BATCH):
+        receipts = await client.get_receipts(tx_hashes[i:i + RECEIPT_BATCH])
+        costs += [receipt_costs(receipt) for receipt in receipts.values() if receipt is not None]
+    return costs
+
+def summarize(latencies, costs, succeeded, failed, elapsed):
+    """Result entry of one run"""
+    result = {
+        'txs': succeeded,
+        'failed': failed,
+        'elapsed_s': round(elapsed, 3),
+        'tps': round(succeeded / elapsed, 2) if elapsed > 0 else None,
+    }
+    if latencies:
+        result['latency_ms'] = {f'p{p}': round(percentile(latencies, p) * 1000, 1) for p in PERCENTILES}
+        result['latency_ms']['max'] = round(max(latencies) * 1000, 1)
+    for index, name in enumerate(('l2_gas', 'steps', 'fee')):
+        values = [cost[index] for cost in costs if cost[index] is not None]
+        if values:
+            result[name] = round(mean(values))
+    return result
+
+# --------- Runs ---------
+
+async def seed_bench_players(clients, admin_address, player_ids, window):
+    """Create the players a scenario needs (not timed)"""
+    pipeline = ShardedPipeline(clients, window=window)
+    for i in range(0, len(player_ids), SETUP_BATCH):
+        players = [synthetic_player(player_id) for player_id in player_ids[i:i + SETUP_BATCH]]
+        pipeline.submit([(admin_address, 'seed_players_batch', seed_batch_calldata(players, []))])
+    jobs = await pipeline.run()
+    failed = [job for job in jobs if not job.succeeded]
+    if failed:
+        print(f"❌ Setup failed: {failed[0].error}")
+        sys.exit(1)
+
+def run_first_id(block):
+    """Marker id of a run block, the run's own players follow it"""
+    return BENCH_ID_BASE + block * RUN_ID_STRIDE
+
+async def block_taken(client, manifest, block):
+    [marker] = await read_overgoal_players(client, manifest, [run_first_id(block)])
+    return marker is not None
+
+async def claim_run_block(client, manifest, start=0):
+    """Claim the lowest free run block from `start` on by seeding its marker, returns the block"""
+    admin_address = manifest.contract_address('overgoal-admin')
+    while True:
+        # Blocks are claimed lowest first, so the taken ones form a prefix
+        low, high = start, RUN_BLOCKS
+        while low < high:
+            middle = (low + high) // 2
+            if await block_taken(client, manifest, middle):
+                low = middle + 1
+            else:
+                high = middle
+        if low == RUN_BLOCKS:
+            raise TransactionError(f"all {RUN_BLOCKS} benchmark id blocks are taken")
+        
+        marker = synthetic_player(run_first_id(low))
+        try:
+            await client.invoke(admin_address, 'seed_players_batch', seed_batch_calldata([marker], []))
+        except TransactionError:
+            if not await block_taken(client, manifest, low):
+                raise
+            # Claimed by a concurrent run in the meantime
+            start = low + 1
+            continue
+        return low
+
+async def run_scenario(client, clients, manifest, name, concurrency, txs, first_id):
+    """Send `txs` invokes of a scenario with `concurrency` in flight, returns its result entry"""
+    tag, entrypoint, needs_players, calldata_of = SCENARIOS[name]
+    address = manifest.contract_address(tag)
+    player_ids = list(range(first_id, first_id + txs))
+    if needs_players:
+        await seed_bench_players(clients, manifest.contract_address('overgoal-admin'), player_ids, concurrency)
+    
+    latencies = []
+    
+    def on_done(job):
+        if job.succeeded:
+            latencies.append(time.monotonic() - job.sent_at)
+    
+    pipeline = ShardedPipeline(clients, window=concurrency, on_done=on_done, poll_interval=POLL_INTERVAL)
+    for player_id in player_ids:
+        pipeline.submit([(address, entrypoint, calldata_of(player_id))])
+    
+    start = time.perf_counter()
+    jobs = await pipeline.run()
+    elapsed = time.perf_counter() - start
+    
+    succeeded = [job for job in jobs if job.succeeded]
+    failed = [job for job in jobs if not job.succeeded]
+    if failed:
+        print(f"   ⚠️  {len(failed)} failed, first: {failed[0].error}")
+    costs = await read_costs(client, [job.tx_hash for job in succeeded])
+    return summarize(latencies, costs, len(succeeded), len(failed), elapsed)
+
+async def block_transaction_count(client, first_block, last_block):
+    """Transactions in blocks first_block..last_block"""
+    results = await client.rpc_batch([
+        ('starknet_getBlockTransactionCount', {'block_id': {'block_number': number}})
+        for number in range(first_block, last_block + 1)
+    ])
+    return sum(result or 0 for result, _ in results)
+
+async def run_script(client, command):
+    """Run a script of this directory against the node, timed as a whole, returns its result entry"""
+    args = shlex.split(command)
+    before = await client.rpc('starknet_blockNumber', [])
+    
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(SCRIPTS_PATH / args[0]), *args[1:], cwd=ROOT_PATH,
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    elapsed = time.perf_counter() - start
+    
+    after = await client.rpc('starknet_blockNumber', [])
+    txs = await block_transaction_count(client, before + 1, after)
+    if process.returncode != 0:
+        print(f"   ⚠️  exited with {process.returncode}: {stderr.decode().strip()[-500:]}")
+    return {
+        'txs': txs,
+        'exit_code': process.returncode,
+        'elapsed_s': round(elapsed, 3),
+        'tps': round(txs / elapsed, 2) if elapsed > 0 else None,
+    }
+
+def print_result(key, result):
+    latency = result.get('latency_ms')
+    line = f"   {key:<36} {result['txs']:>6} txs  {result['tps'] or 0:>8.2f} tx/s"
+    if latency:
+        line += f"  p50 {latency['p50']:>7.1f}ms  p99 {latency['p99']:>7.1f}ms"
+    if 'l2_gas' in result:
+        line += f"  l2_gas {result['l2_gas']}"
+    elif 'steps' in result:
+        line += f"  steps {result['steps']}"
+    print(line)
+
+# --------- Compare ---------
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE, gas_tolerance=DEFAULT_GAS_TOLERANCE):
+    """Regressions of `current` against `baseline` as a list of messages"""
+    regressions = []
+    for key, base in baseline['results'].items():
+        result = current['results'].get(key)
+        if result is None:
+            continue
+        
+        def check(label, old, new, limit, higher_is_worse=True):
+            if old is None or new is None or old == 0:
+                return
+            change = (new - old) / old
+            if (change > limit) if higher_is_worse else (change < -limit):
+                regressions.append(f"{key}: {label} {old} → {new} ({change:+.1%})")
+        
+        check('tps', base.get('tps'), result.get('tps'), tolerance, higher_is_worse=False)
+        for p in ('p50', 'p99'):
+            check(f'latency {p}', base.get('latency_ms', {}).get(p), result.get('latency_ms', {}).get(p), tolerance)
+        for name in ('l2_gas', 'steps', 'fee'):
+            check(name, base.get(name), result.get(name), gas_tolerance)
+    return regressions
+
+def report_comparison(baseline_path, current, args):
+    """Print the regressions against a result file, exits with 1 if any"""
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, current, args.tolerance, args.gas_tolerance)
+    
+    print("\n" + "=" * 60)
+    print(f"Compared with {baseline_path}")
+    print("=" * 60)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions:")
+        for regression in regressions:
+            print(f"   • {regression}")
+        sys.exit(1)
+    print("✅ No regressions")
+
+# --------- Main ---------
+
+def git_commit():
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_PATH, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+async def run(args):
+    results = {}
+    async with StarknetClient.from_config() as client:
+        katana = await boot(client) if args.boot else None
+        try:
+            manifest = load_manifest()
+            clients = await shard_clients(client, args.accounts, args.accounts_file)
+            
+            print("\n" + "=" * 60)
+            print(f"BENCHMARK ({args.txs} txs per run, {len(clients)} accounts)")
+            print("=" * 60)
+            
+            block = 0
+            for name in args.scenarios:
+                for concurrency in args.concurrency:
+                    key = f"{name}@{concurrency}"
+                    try:
+                        # Each run gets its own id block, claimed on chain so runs never collide
+                        block = await claim_run_block(client, manifest, block)
+                        results[key] = await run_scenario(
+                            client, clients, manifest, name, concurrency, args.txs, run_first_id(block) + 1
+                        )
+                    except TransactionError as e:
+                        print(f"   ❌ {key}: {e}")
+                        continue
+                    print_result(key, results[key])
+            
+            for command in args.script or []:
+                key = f"script:{command}"
+                results[key] = await run_script(client, command)
+                print_result(key, results[key])
+        finally:
+            if katana is not None:
+                stop_katana(katana)
+    
+    return {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'rpc_url': client.rpc_url,
+            'txs': args.txs,
+            'concurrency': args.concurrency,
+            'accounts': len(clients),
+        },
+        'results': results,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description='Benchmark transaction throughput and latency against katana')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help='Scenarios to run (default: all)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=list(DEFAULT_CONCURRENCY),
+                        help=f'Transactions in flight, one run per level (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--txs', type=int, default=DEFAULT_TXS,
+                        help=f'Transactions per run (default: {DEFAULT_TXS})')
+    parser.add_argument('--script', action='append', metavar='COMMAND',
+                        help='Also time a script of this directory, e.g. "seed_players.py --window 16"')
+    parser.add_argument('--no-scenarios', action='store_true', help='Only run the --script commands')
+    parser.add_argument('--accounts', type=int, default=0,
+                        help='Shard transactions over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Shard transactions over the accounts in a JSON file ([{"address", "private_key"}, ...])')
+    parser.add_argument('--boot', action='store_true',
+                        help='Start katana from katana.toml and deploy with sozo before benchmarking')
+    parser.add_argument('--out', type=Path, help='Write the results to this JSON file')
+    parser.add_argument('--baseline', type=Path, help='Compare the results with a saved result file')
+    parser.add_argument('--compare', type=Path, nargs=2, metavar=('OLD', 'NEW'),
+                        help='Compare two result files without running anything')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed throughput / latency change (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--gas-tolerance', type=float, default=DEFAULT_GAS_TOLERANCE,
+                        help=f'Allowed gas / steps / fee increase (default: {DEFAULT_GAS_TOLERANCE})')
+    
+    args = parser.parse_args()
+    
+    if args.compare:
+        old, new = args.compare
+        with open(new, 'r') as f:
+            report_comparison(old, json.load(f), args)
+        return
+    
+    if args.txs >= RUN_ID_STRIDE:
+        print(f"❌ --txs must be below {RUN_ID_STRIDE}")
+        sys.exit(1)
+    if args.no_scenarios:
+        args.scenarios = []
+    
+    current = await run(args)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\n💾 Results written to {args.out}")
+    if args.baseline:
+        report_comparison(args.baseline, current, args)
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Follow the Overgoal model change events (src/events.cairo) incrementally and
+keep a local JSON view of the changed entities up to date.
+
+The world wraps every Dojo event in a Starknet `EventEmitted` event:
+    keys: [selector("EventEmitted"), event selector, system address]
+    data: [len, event keys..., len, event values...]
+
+The follower pages `starknet_getEvents` for those, from a saved block cursor
+up to the block that was latest when the range started, saving the cursor,
+the continuation token and that end block after every page (a token is only
+valid for the filter it came from, so an interrupted range is resumed with the
+same end block). Each event carries the changed
+fields after the change, so applying it is an upsert of the entity keyed by
+`id`: catching up costs one RPC per page of changes, however many entities
+the world holds.
+
+The view is reset when the world address in the manifest changes
+(e.g. after `restart_fresh.sh`).
+
+Usage:
+    ./scripts/event_follower.py            # catch up once
+    ./scripts/event_follower.py --follow   # keep polling for new blocks
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+from manifest import load_manifest
+from models import OvergoalPlayer, SeasonClub, SeasonPlayer, manifest_schema
+from starknet_client import StarknetClient, decode_value, get_selector_from_name, to_int
+
+# Configuration
+VIEW_PATH = Path(__file__).parent / "event_view.json"
+CHUNK_SIZE = 256
+POLL_INTERVAL = 2
+EVENT_EMITTED = get_selector_from_name('EventEmitted')
+
+# Event tag -> model whose entity the event updates
+EVENT_MODELS = {
+    'overgoal-OvergoalPlayerCreated': OvergoalPlayer,
+    'overgoal-OvergoalPlayerUpdated': OvergoalPlayer,
+    'overgoal-GoalCurrencyChanged': OvergoalPlayer,
+    'overgoal-SeasonPlayerCreated': SeasonPlayer,
+    'overgoal-SeasonPlayerTransferred': SeasonPlayer,
+    'overgoal-SeasonPlayerPointsAdded': SeasonPlayer,
+    'overgoal-SeasonPlayerMatchRecorded': SeasonPlayer,
+    'overgoal-SeasonPlayerRelationshipsChanged': SeasonPlayer,
+    'overgoal-SeasonClubMatchRecorded': SeasonClub,
+}
+
+def model_field_names(model):
+    """Cairo field names of a record type (`pass_` is `pass` on-chain)"""
+    return {field.name.rstrip('_') for field in fields(model)}
+
+class EventFollower:
+    """Pages decoded world events from a block cursor"""
+    
+    def __init__(self, client, manifest, from_block=0, continuation_token=None, to_block=None,
+                 chunk_size=CHUNK_SIZE):
+        self.client = client
+        self.manifest = manifest
+        self.from_block = from_block
+        # A token without the end block of its filter can't be resumed: restart the range
+        # (re-applying its events is harmless, they are upserts)
+        self.continuation_token = continuation_token if to_block is not None else None
+        self.to_block = to_block if continuation_token else None
+        self.chunk_size = chunk_size
+        self.tags = {manifest.event_selector(tag): tag for tag in EVENT_MODELS}
+    
+    async def pages(self):
+        """Yield lists of (tag, fields, block_number) up to the latest block, or to the end block of an interrupted range"""
+        if self.to_block is None:
+            self.to_block = await self.client.rpc('starknet_blockNumber', [])
+        to_block = self.to_block
+        if self.from_block > to_block:
+            self.to_block = None
+            return
+        
+        while True:
+            event_filter = {
+                'from_block': {'block_number': self.from_block},
+                'to_block': {'block_number': to_block},
+                'address': self.manifest.world_address,
+                'keys': [[hex(EVENT_EMITTED)], [hex(selector) for selector in self.tags]],
+                'chunk_size': self.chunk_size,
+            }
+            if self.continuation_token:
+                event_filter['continuation_token'] = self.continuation_token
+            result = await self.client.rpc('starknet_getEvents', {'filter': event_filter})
+            
+            events = [await self.decode(event) for event in result['events']]
+            
+            # A continuation token is only valid for the same filter, so the
+            # block range only moves forward once the range is exhausted
+            self.continuation_token = result.get('continuation_token')
+            if self.continuation_token is None:
+                self.from_block = to_block + 1
+                self.to_block = None
+            
+            yield [event for event in events if event is not None]
+            
+            if self.continuation_token is None:
+                break
+    
+    async def decode(self, event):
+        """(tag, fields, block_number) of an EventEmitted, None for events we don't follow"""
+        keys = [to_int(key) for key in event['keys']]
+        data = [to_int(value) for value in event['data']]
+        tag = self.tags.get(keys[1])
+        if tag is None:
+            return None
+        
+        schema = await self.schema(tag, keys[1])
+        keys_len = data[0]
+        key_values = data[1:1 + keys_len]
+        values = data[2 + keys_len:2 + keys_len + data[1 + keys_len]]
+        
+        decoded = {}
+        key_offset = 0
+        value_offset = 0
+        for name, is_key, ty in schema[2]:
+            if is_key:
+                decoded[name], key_offset = decode_value(ty, key_values, key_offset)
+            else:
+                decoded[name], value_offset = decode_value(ty, values, value_offset)
+        return tag, decoded, event.get('block_number')
+    
+    async def schema(self, tag, selector):
+        """Event schema: manifest members first, on-chain `schema()` otherwise"""
+        schema = manifest_schema(self.manifest, tag)
+        if schema is None:
+            schema = await self.client.event_schema(self.manifest.world_address, selector)
+        return schema
+
+def load_view(path, world_address):
+    """Saved view for this world, or an empty one"""
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            view = json.load(f)
+        if view.get('world') == world_address:
+            return view
+        print(f"🔄 World changed ({view.get('world')} → {world_address}), rebuilding the view")
+    return {'world': world_address, 'from_block': 0, 'continuation_token': None, 'to_block': None, 'tables': {}}
+
+def save_view(path, view):
+    """Atomically replace the saved view"""
+    temp = Path(f"{path}.tmp")
+    with open(temp, 'w') as f:
+        json.dump(view, f)
+    os.replace(temp, path)
+
+def apply_event(view, tag, decoded):
+    """Upsert the entity an event describes into the view"""
+    model = EVENT_MODELS[tag]
+    table = view['tables'].setdefault(model.TAG, {})
+    record = table.setdefault(str(decoded['id']), {'id': decoded['id']})
+    names = model_field_names(model)
+    record.update({name: value for name, value in decoded.items() if name in names})
+
+async def catch_up(client, manifest, view, path):
+    """Apply every event since the view's cursor, returns how many were applied"""
+    follower = EventFollower(
+        client, manifest, view['from_block'], view['continuation_token'], view.get('to_block')
+    )
+    applied = 0
+    async for events in follower.pages():
+        for tag, decoded, _block_number in events:
+            apply_event(view, tag, decoded)
+        applied += len(events)
+        view['from_block'] = follower.from_block
+        view['continuation_token'] = follower.continuation_token
+        view['to_block'] = follower.to_block
+        save_view(path, view)
+    return applied
+
+async def main():
+    parser = argparse.ArgumentParser(description='Follow Overgoal model change events')
+    parser.add_argument('--view', type=Path, default=VIEW_PATH, help=f'View file (default: {VIEW_PATH})')
+    parser.add_argument('--follow', action='store_true', help='Keep polling for new events')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL,
+                        help=f'Seconds between polls with --follow (default: {POLL_INTERVAL})')
+    
+    args = parser.parse_args()
+    
+    manifest = load_manifest()
+    try:
+        manifest.event_selector('overgoal-OvergoalPlayerCreated')
+    except KeyError:
+        print("❌ Events not found in manifest_dev.json, run `sozo migrate` first")
+        sys.exit(1)
+    
+    view = load_view(args.view, manifest.world_address)
+    print(f"📍 World: {manifest.world_address}")
+    print(f"📒 Resuming from block {view['from_block']}")
+    
+    async with StarknetClient.from_config() as client:
+        while True:
+            applied = await catch_up(client, manifest, view, args.view)
+            if applied:
+                counts = {tag: len(table) for tag, table in view['tables'].items()}
+                print(f"📥 Applied {applied} events (next block: {view['from_block']}) {counts}")
+            if not args.follow:
+                break
+            await asyncio.sleep(args.interval)
+    
+    print(f"✅ View saved to {args.view}")
+
+if __name__ == '__main__':
+    asyncio.run(main())
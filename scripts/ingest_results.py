@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Ingest match results into the Overgoal world through admin.record_match.
+
+The input is streamed, so memory stays bounded whatever the file size:
+- JSONL: one match per line
+    {"match_id": "md1-1", "season_id": 1, "home": 101, "away": 102,
+     "home_goals": 2, "away_goals": 1,
+     "players": [{"season_player_id": 10001, "points": 5, "team": 10, "fans": -5}, ...]}
+- CSV (header required): one row per player of a match, consecutive rows with
+  the same match_id form one match; season_player_id may be empty for a
+  match without player changes
+    match_id,season_id,home,away,home_goals,away_goals,season_player_id,points,team,fans
+
+`home` / `away` are season club ids. Each match is validated against the
+SeasonClubs and SeasonPlayers of its season (read once per season with
+admin.get_season_snapshot); invalid matches are logged and skipped.
+
+Valid matches are packed into multicall transactions under a calldata and
+an estimated step budget, and sent through the transaction pipeline
+(--window, --accounts). Batches are read and sent --chunk batches at a time.
+Every batch outcome (and every rejected match) is appended to the receipts
+log as one JSON line. Matches whose match_id is already in a succeeded batch
+of the receipts log are skipped, so re-running a file (e.g. after a failure)
+only sends what wasn't recorded yet.
+
+With several accounts, batches touching the same club may land in any
+order; totals are the same, but relationship values clamped at 0 or 100 can
+differ from a sequential run.
+
+Usage:
+    ./scripts/ingest_results.py results.jsonl
+    ./scripts/ingest_results.py results.csv --window 16 --accounts 4
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from itertools import groupby
+from pathlib import Path
+
+from manifest import load_manifest
+from models import Season, read_record, read_season_snapshot
+from starknet_client import StarknetClient, to_felt
+from tx_pipeline import DEFAULT_WINDOW, ShardedPipeline, shard_clients
+
+# Configuration
+RECEIPTS_PATH = Path(__file__).parent / "ingest_receipts.jsonl"
+DEFAULT_CHUNK = 64                      # Batches read and sent per pipeline run
+
+# Per-transaction budget. Starknet caps calldata at 5000 felts and a
+# transaction at 10M steps; the step costs are conservative estimates of
+# record_match (two clubs, then one read + write per player, plus events).
+MAX_CALLDATA = 4000
+MAX_STEPS = 6_000_000
+STEPS_PER_MATCH = 60_000
+STEPS_PER_PLAYER = 25_000
+
+# Cairo integer ranges of the record_match arguments
+U8_MAX = 2**8 - 1
+U32_MAX = 2**32 - 1
+I16_MIN, I16_MAX = -2**15, 2**15 - 1
+
+class InvalidMatch(Exception):
+    """A match that can't be recorded"""
+
+# --------- Input ---------
+
+def read_jsonl(path):
+    """Yield matches from a JSONL file, one per line"""
+    with open(path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                match = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {'match_id': f"line {line_number}", 'error': f"invalid JSON: {e}"}
+                continue
+            match.setdefault('match_id', f"line {line_number}")
+            yield match
+
+def read_csv(path):
+    """Yield matches from a CSV file, grouping consecutive rows with the same match_id"""
+    with open(path, 'r', newline='') as f:
+        for match_id, rows in groupby(csv.DictReader(f), key=lambda row: row['match_id']):
+            rows = list(rows)
+            first = rows[0]
+            yield {
+                'match_id': match_id,
+                'season_id': first['season_id'],
+                'home': first['home'],
+                'away': first['away'],
+                'home_goals': first['home_goals'],
+                'away_goals': first['away_goals'],
+                'players': [
+                    {
+                        'season_player_id': row['season_player_id'],
+                        'points': row.get('points') or 0,
+                        'team': row.get('team') or 0,
+                        'fans': row.get('fans') or 0,
+                    }
+                    for row in rows if row.get('season_player_id')
+                ],
+            }
+
+def read_matches(path):
+    return read_csv(path) if Path(path).suffix.lower() == '.csv' else read_jsonl(path)
+
+def recorded_match_ids(path):
+    """match_ids of the succeeded batches in a receipts log"""
+    recorded = set()
+    if Path(path).exists():
+        with open(path, 'r') as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get('status') == 'succeeded':
+                    recorded.update(str(match_id) for match_id in entry.get('match_ids', []))
+    return recorded
+
+def unrecorded(matches, recorded, log):
+    """Matches whose match_id isn't in `recorded`, the others are counted as skipped"""
+    for match in matches:
+        if str(match.get('match_id')) in recorded:
+            log.skipped += 1
+            continue
+        yield match
+
+# --------- Validation ---------
+
+def bounded_int(name, value, low, high):
+    """`value` as an int within [low, high], raises InvalidMatch"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise InvalidMatch(f"{name} is not an integer: {value!r}")
+    if not low <= value <= high:
+        raise InvalidMatch(f"{name} {value} out of range [{low}, {high}]")
+    return value
+
+class SeasonIndex:
+    """Season club and season player ids of the seasons seen so far, read once per season"""
+    
+    def __init__(self, client, manifest):
+        self.client = client
+        self.manifest = manifest
+        self.seasons = {}
+    
+    async def load(self, season_id):
+        """{season_club_ids}, {season_player_id: season_club_id} of a season, None if it doesn't exist"""
+        if season_id not in self.seasons:
+            # Only a missing Season means "doesn't exist": RPC and decoding errors propagate
+            if await read_record(self.client, self.manifest, Season, [season_id]) is None:
+                self.seasons[season_id] = None
+            else:
+                snapshot = await read_season_snapshot(self.client, self.manifest, season_id)
+                self.seasons[season_id] = (
+                    {season_club.id for season_club, _ in snapshot.season_clubs},
+                    {season_player.id: season_player.season_club_id for season_player, _ in snapshot.season_players},
+                )
+        return self.seasons[season_id]
+
+async def validate(index, match):
+    """(record_match calldata, player count) of a match, raises InvalidMatch"""
+    if 'error' in match:
+        raise InvalidMatch(match['error'])
+    try:
+        season_id = int(match['season_id'])
+        home = int(match['home'])
+        away = int(match['away'])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidMatch(f"missing or invalid field: {e}")
+    home_goals = bounded_int('home_goals', match.get('home_goals'), 0, U8_MAX)
+    away_goals = bounded_int('away_goals', match.get('away_goals'), 0, U8_MAX)
+    
+    season = await index.load(season_id)
+    if season is None:
+        raise InvalidMatch(f"season {season_id} does not exist")
+    season_club_ids, season_players = season
+    for side, season_club_id in (('home', home), ('away', away)):
+        if season_club_id not in season_club_ids:
+            raise InvalidMatch(f"{side} club {season_club_id} is not in season {season_id}")
+    if home == away:
+        raise InvalidMatch("home and away clubs are the same")
+    
+    deltas = []
+    seen = set()
+    for player in match.get('players', []):
+        season_player_id = bounded_int('season_player_id', player.get('season_player_id'), 1, 2**251)
+        if season_player_id in seen:
+            raise InvalidMatch(f"season player {season_player_id} listed twice")
+        seen.add(season_player_id)
+        if season_players.get(season_player_id) not in (home, away):
+            raise InvalidMatch(f"season player {season_player_id} does not play for {home} or {away}")
+        deltas += [
+            season_player_id,
+            bounded_int('points', player.get('points', 0), 0, U32_MAX),
+            to_felt(bounded_int('team', player.get('team', 0), I16_MIN, I16_MAX)),
+            to_felt(bounded_int('fans', player.get('fans', 0), I16_MIN, I16_MAX)),
+        ]
+    
+    return [season_id, home, away, home_goals, away_goals, len(seen), *deltas], len(seen)
+
+# --------- Batching ---------
+
+def call_cost(calldata, players):
+    """(calldata felts in the multicall, estimated steps) of one record_match call"""
+    # Each call of a multicall adds its address, selector and calldata length
+    return 3 + len(calldata), STEPS_PER_MATCH + STEPS_PER_PLAYER * players
+
+async def batches(matches, index, admin_address, log, max_calldata=MAX_CALLDATA, max_steps=MAX_STEPS):
+    """Yield (calls, match_ids) batches of valid matches under the calldata and step budget"""
+    calls, match_ids = [], []
+    calldata_used, steps_used = 1, 0
+    for match in matches:
+        try:
+            calldata, players = await validate(index, match)
+        except InvalidMatch as e:
+            log.write({'match_id': match.get('match_id'), 'status': 'rejected', 'error': str(e)})
+            continue
+        
+        calldata_cost, steps_cost = call_cost(calldata, players)
+        if 1 + calldata_cost > max_calldata or steps_cost > max_steps:
+            log.write({'match_id': match['match_id'], 'status': 'rejected', 'error': 'match exceeds the tx budget'})
+            continue
+        if calls and (calldata_used + calldata_cost > max_calldata or steps_used + steps_cost > max_steps):
+            yield calls, match_ids
+            calls, match_ids = [], []
+            calldata_used, steps_used = 1, 0
+        
+        calls.append((admin_address, 'record_match', calldata))
+        match_ids.append(match['match_id'])
+        calldata_used += calldata_cost
+        steps_used += steps_cost
+    if calls:
+        yield calls, match_ids
+
+async def take(iterator, count):
+    """Up to `count` items of an async iterator"""
+    items = []
+    async for item in iterator:
+        items.append(item)
+        if len(items) == count:
+            break
+    return items
+
+# --------- Receipts ---------
+
+class ReceiptsLog:
+    """Append-only JSONL log of batch outcomes and rejected matches"""
+    
+    def __init__(self, path):
+        self.file = open(path, 'a')
+        self.counts = {'succeeded': 0, 'failed': 0, 'rejected': 0}
+        self.matches = {'succeeded': 0, 'failed': 0}
+        self.skipped = 0
+    
+    def write(self, entry):
+        self.counts[entry['status']] += 1
+        self.file.write(json.dumps(entry) + '\n')
+        self.file.flush()
+    
+    def write_batch(self, job):
+        batch_number, match_ids = job.tag
+        self.matches['succeeded' if job.succeeded else 'failed'] += len(match_ids)
+        self.write({
+            'batch': batch_number,
+            'status': job.status,
+            'tx_hash': hex(job.tx_hash) if job.tx_hash is not None else None,
+            'attempts': job.attempts,
+            'error': job.error,
+            'match_ids': match_ids,
+        })
+    
+    def close(self):
+        self.file.close()
+
+# --------- Main ---------
+
+async def ingest(path, log, window, chunk, accounts=1, accounts_file=None, recorded=frozenset()):
+    """Stream, validate, batch and send the matches of a file, returns the number of failed batches"""
+    manifest = load_manifest()
+    admin_address = manifest.contract_address('overgoal-admin')
+    failed = 0
+    batch_number = 0
+    
+    async with StarknetClient.from_config() as client:
+        index = SeasonIndex(client, manifest)
+        clients = await shard_clients(client, accounts, accounts_file)
+        if len(clients) > 1:
+            print(f"👥 Sharding over {len(clients)} accounts")
+        
+        pending = batches(unrecorded(read_matches(path), recorded, log), index, admin_address, log)
+        while True:
+            chunk_batches = await take(pending, chunk)
+            if not chunk_batches:
+                break
+            
+            pipeline = ShardedPipeline(clients, window=window, on_done=log.write_batch)
+            for calls, match_ids in chunk_batches:
+                pipeline.submit(calls, tag=(batch_number, match_ids))
+                batch_number += 1
+            jobs = await pipeline.run()
+            failed += sum(1 for job in jobs if not job.succeeded)
+            
+            print(f"📤 {batch_number} batches sent: {log.matches['succeeded']} matches recorded, "
+                  f"{log.counts['rejected']} rejected, {failed} batches failed "
+                  f"({pipeline.stats.elapsed():.1f}s for the last {len(jobs)})")
+    return failed
+
+async def main():
+    parser = argparse.ArgumentParser(description='Ingest match results (JSONL or CSV) through admin.record_match')
+    parser.add_argument('file', help='Results file (.jsonl or .csv)')
+    parser.add_argument('--receipts', type=Path, default=RECEIPTS_PATH,
+                        help=f'JSONL log of batch receipts and rejected matches (default: {RECEIPTS_PATH})')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW,
+                        help=f'Transactions kept in flight per account (default: {DEFAULT_WINDOW})')
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK,
+                        help=f'Batches read and sent per pipeline run (default: {DEFAULT_CHUNK})')
+    parser.add_argument('--accounts', type=int, default=1,
+                        help='Shard batches over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Shard batches over the accounts in a JSON file ([{"address", "private_key"}, ...])')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"INGESTING MATCH RESULTS: {args.file}")
+    print("=" * 60)
+    
+    recorded = recorded_match_ids(args.receipts)
+    log = ReceiptsLog(args.receipts)
+    try:
+        failed = await ingest(
+            args.file, log, args.window, args.chunk, args.accounts, args.accounts_file, recorded
+        )
+    finally:
+        log.close()
+    
+    print("\n" + "=" * 60)
+    print(f"✅ Matches recorded: {log.matches['succeeded']}")
+    print(f"⏭️  Matches rejected: {log.counts['rejected']}")
+    print(f"♻️  Matches already recorded (skipped): {log.skipped}")
+    print(f"❌ Matches in failed batches: {log.matches['failed']}")
+    print(f"📒 Receipts: {args.receipts}")
+    print("=" * 60)
+    
+    if failed or log.counts['rejected']:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal of completed on-chain operations.
+
+Each line records one entity that is known to exist on-chain:
+    {"world": "0x...", "kind": "player", "id": 12, "tx_hash": "0x..."}
+
+`tx_hash` is null when the entity was found on-chain by a pre-check rather
+than created by this tool. Entries written against another world address
+(e.g. before a `restart_fresh.sh` redeploy) are ignored on load.
+"""
+
+import json
+import os
+
+class Journal:
+    """Completed (kind, id) pairs for one world, persisted as JSONL"""
+    
+    def __init__(self, path, world_address):
+        self.path = path
+        self.world_address = hex(int(world_address, 16))
+        self.done = {}
+    
+    def load(self):
+        """Read completed entries for this world, returns how many were found"""
+        if not os.path.exists(self.path):
+            return 0
+        
+        with open(self.path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+                if entry.get('world') != self.world_address:
+                    continue
+                self.done[(entry['kind'], entry['id'])] = entry.get('tx_hash')
+        return len(self.done)
+    
+    def is_done(self, kind, entity_id):
+        return (kind, entity_id) in self.done
+    
+    def record(self, kind, entity_id, tx_hash=None):
+        """Append one completed entity and flush it to disk"""
+        entry = {
+            'world': self.world_address,
+            'kind': kind,
+            'id': entity_id,
+            'tx_hash': hex(tx_hash) if isinstance(tx_hash, int) else tx_hash,
+        }
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.done[(kind, entity_id)] = entry['tx_hash']
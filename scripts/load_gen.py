@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator for the overgoal_game entrypoints players call:
+add_goal_currency, spend_goal_currency, set_injury_status and
+assign_player_to_club.
+
+Simulated users (OvergoalPlayers created before the run, each with some
+starting currency) are spread over katana's prefunded accounts (--accounts,
+start katana with at least that many). Operations arrive as a Poisson process
+at --rate per second, drawn from the --mix weights, and are sent when they
+arrive whether or not earlier ones have landed, like real traffic. Every
+account keeps its own local nonce; receipts of everything in flight are polled
+in one batch request.
+
+With --rates, each rate runs for --stage-seconds in turn, and the report
+shows where throughput stops following the offered rate (saturation).
+
+The report gives, per stage and per operation:
+- offered and sustained TPS (receipts per second during the stage);
+- a latency histogram (send to receipt) and percentiles;
+- reverts and rejections grouped by error string (e.g. 'Insufficient currency').
+
+The whole schedule (arrival times, operations, users, amounts) comes from
+--seed, so a run can be replayed exactly against a fresh node (--boot).
+assign_player_to_club calls the Universe contract, so it only succeeds with
+the Universe world deployed (see restart_fresh.sh).
+
+Usage:
+    ./scripts/load_gen.py --boot --accounts 10 --rate 50 --duration 60
+    ./scripts/load_gen.py --accounts 20 --rates 25 50 100 200 400 --stage-seconds 30 --out load.json
+    ./scripts/load_gen.py --mix add_goal_currency=1 spend_goal_currency=1 --users 5000 --seed 7
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from bench import BENCH_ID_BASE, BENCH_ID_LIMIT, boot, percentile, seed_bench_players
+from manifest import load_manifest
+from starknet_client import StarknetClient, TransactionError
+from tx_pipeline import ShardedPipeline, shard_clients
+
+# Configuration
+DEFAULT_MIX = {
+    'add_goal_currency': 40,
+    'spend_goal_currency': 35,
+    'set_injury_status': 20,
+    'assign_player_to_club': 5,
+}
+DEFAULT_USERS = 1000
+DEFAULT_RATE = 20.0
+DEFAULT_DURATION = 30.0
+DEFAULT_SEED = 42
+LOADGEN_ID_BASE = BENCH_ID_LIMIT        # First player id of the simulated users, above all of bench.py's
+STARTING_CURRENCY = 500
+MAX_ADD = 200
+MAX_SPEND = 300                         # Above the average balance, so some spends revert
+CLUB_COUNT = 4                          # assign_player_to_club clubs 1-4 (season 1)
+CALLS_PER_SETUP_TX = 50
+POLL_INTERVAL = 0.05
+RECEIPT_BATCH = 200
+RECEIPT_TIMEOUT = 60
+SATURATION_TOLERANCE = 0.10             # Sustained TPS this far below the offered rate = saturated
+LATENCY_BUCKETS_MS = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+HISTOGRAM_WIDTH = 40
+
+# --------- Schedule ---------
+
+def parse_mix(items):
+    """{operation: weight} from ["add_goal_currency=40", ...]"""
+    mix = {}
+    for item in items:
+        name, _, weight = item.partition('=')
+        if name not in DEFAULT_MIX:
+            print(f"❌ Unknown operation {name} (one of {', '.join(DEFAULT_MIX)})")
+            sys.exit(1)
+        mix[name] = float(weight or 1)
+    return mix
+
+def build_schedule(seed, stages, mix, user_ids):
+    """[(at, stage, operation, calldata)] for every stage (rate, seconds), reproducible from `seed`"""
+    rng = random.Random(seed)
+    operations, weights = list(mix), list(mix.values())
+    unassigned = list(user_ids)
+    rng.shuffle(unassigned)
+    
+    schedule, start = [], 0.0
+    for stage, (rate, seconds) in enumerate(stages):
+        at = start + rng.expovariate(rate)
+        while at < start + seconds:
+            operation = rng.choices(operations, weights)[0]
+            user = rng.choice(user_ids)
+            if operation == 'add_goal_currency':
+                calldata = [user, rng.randint(1, MAX_ADD)]
+            elif operation == 'spend_goal_currency':
+                calldata = [user, rng.randint(1, MAX_SPEND)]
+            elif operation == 'set_injury_status':
+                calldata = [user, rng.randint(0, 1)]
+            else:
+                # Each user joins a club once; afterwards the repeats revert like a real double submit
+                user = unassigned.pop() if unassigned else user
+                calldata = [user, user, rng.randint(1, CLUB_COUNT)]
+            schedule.append((at, stage, operation, calldata))
+            at += rng.expovariate(rate)
+        start += seconds
+    return schedule
+
+# --------- Sending ---------
+
+class Sender:
+    """One account's local nonce; sends are serialized so nonces go out in order"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.nonce = None
+        self.lock = asyncio.Lock()
+    
+    async def send(self, calls):
+        async with self.lock:
+            if self.nonce is None:
+                self.nonce = await self.client.get_nonce()
+            try:
+                tx_hash = await self.client.send_invoke(calls, self.nonce)
+            except TransactionError:
+                # Rejected before the mempool: the nonce wasn't used, but re-read it in case it drifted
+                self.nonce = await self.client.get_nonce()
+                raise
+            self.nonce += 1
+            return tx_hash
+
+class LoadRun:
+    """Outcome of every scheduled operation"""
+    
+    def __init__(self):
+        self.in_flight = {}                     # tx_hash -> (stage, operation, sent_at)
+        self.latencies = defaultdict(list)      # (stage, operation) -> [seconds]
+        self.receipts_at = []                   # Receipt times, to measure sustained TPS per stage
+        self.errors = Counter()                 # (stage, operation, kind, reason) -> count
+        self.sent = Counter()                   # (stage, operation) -> count
+    
+    def record_error(self, stage, operation, kind, error):
+        self.errors[(stage, operation, kind, error_reason(error))] += 1
+
+def error_reason(error):
+    """Short error string of a revert reason or a rejected send (the Cairo panic message when there is one)"""
+    messages = [
+        message for message in re.findall(r"\('([^']*)'\)", error or '')
+        if message not in ('ENTRYPOINT_FAILED', 'argent/multicall-failed')
+    ]
+    if messages:
+        return messages[0]
+    lines = [line.strip() for line in (error or 'unknown').splitlines() if line.strip()]
+    return lines[-1][:80] if lines else 'unknown'
+
+async def send_operation(run, sender, game_address, stage, operation, calldata):
+    run.sent[(stage, operation)] += 1
+    try:
+        tx_hash = await sender.send([(game_address, operation, calldata)])
+    except TransactionError as e:
+        run.record_error(stage, operation, 'rejected', str(e))
+        return
+    run.in_flight[tx_hash] = (stage, operation, time.monotonic())
+
+async def poll_receipts(run, client, done):
+    """Collect receipts of the in-flight transactions until `done` is set and nothing is in flight"""
+    while not done.is_set() or run.in_flight:
+        await asyncio.sleep(POLL_INTERVAL)
+        tx_hashes = list(run.in_flight)
+        for i in range(0, len(tx_hashes), RECEIPT_BATCH):
+            receipts = await client.get_receipts(tx_hashes[i:i + RECEIPT_BATCH])
+            now = time.monotonic()
+            for tx_hash, receipt in receipts.items():
+                stage, operation, sent_at = run.in_flight[tx_hash]
+                if receipt is None:
+                    if now - sent_at > RECEIPT_TIMEOUT:
+                        del run.in_flight[tx_hash]
+                        run.record_error(stage, operation, 'dropped', f"no receipt after {RECEIPT_TIMEOUT}s")
+                    continue
+                del run.in_flight[tx_hash]
+                run.receipts_at.append(now)
+                if receipt.get('execution_status') == 'REVERTED':
+                    run.record_error(stage, operation, 'reverted', receipt.get('revert_reason'))
+                else:
+                    run.latencies[(stage, operation)].append(now - sent_at)
+
+async def drive(clients, game_address, schedule, user_ids):
+    """Send the schedule in real time, returns the LoadRun and the start time"""
+    senders = [Sender(client) for client in clients]
+    sender_of = {user: senders[index % len(senders)] for index, user in enumerate(user_ids)}
+    run = LoadRun()
+    done = asyncio.Event()
+    poller = asyncio.create_task(poll_receipts(run, clients[0], done))
+    
+    tasks = []
+    start = time.monotonic()
+    for at, stage, operation, calldata in schedule:
+        delay = start + at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sender = sender_of[calldata[0]]
+        tasks.append(asyncio.create_task(send_operation(run, sender, game_address, stage, operation, calldata)))
+    await asyncio.gather(*tasks)
+    done.set()
+    await poller
+    return run, start
+
+# --------- Setup ---------
+
+async def setup_users(clients, admin_address, game_address, user_ids):
+    """Create the users and give each STARTING_CURRENCY (not timed)"""
+    print(f"👥 Creating {len(user_ids)} users...")
+    await seed_bench_players(clients, admin_address, user_ids, window=16)
+    
+    pipeline = ShardedPipeline(clients, window=16)
+    for i in range(0, len(user_ids), CALLS_PER_SETUP_TX):
+        pipeline.submit([
+            (game_address, 'add_goal_currency', [user, STARTING_CURRENCY])
+            for user in user_ids[i:i + CALLS_PER_SETUP_TX]
+        ])
+    jobs = await pipeline.run()
+    failed = [job for job in jobs if not job.succeeded]
+    if failed:
+        print(f"❌ Setup failed: {failed[0].error}")
+        sys.exit(1)
+
+async def warm_up(clients, game_address, user_ids):
+    """Estimate fee bounds of every operation per account before the clock starts"""
+    samples = {
+        'add_goal_currency': [user_ids[0], 1],
+        'spend_goal_currency': [user_ids[0], 1],
+        'set_injury_status': [user_ids[0], 0],
+        'assign_player_to_club': [user_ids[-1], user_ids[-1], 1],
+    }
+    for client in clients:
+        for operation, calldata in samples.items():
+            try:
+                await client.resource_bounds([(game_address, operation, calldata)])
+            except Exception as e:
+                print(f"⚠️  Couldn't estimate {operation}: {error_reason(str(e))}")
+
+# --------- Report ---------
+
+def histogram(latencies):
+    """[(bucket label, count)] over LATENCY_BUCKETS_MS"""
+    counts = Counter(bisect.bisect_left(LATENCY_BUCKETS_MS, latency * 1000) for latency in latencies)
+    labels = [f"≤{bucket}ms" for bucket in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+    return [(label, counts.get(index, 0)) for index, label in enumerate(labels)]
+
+def stage_report(run, start, stages, operations):
+    """Summary of every stage, with the sustained TPS measured from the receipts of its window"""
+    report, stage_start = [], start
+    for stage, (rate, seconds) in enumerate(stages):
+        received = sum(1 for at in run.receipts_at if stage_start <= at < stage_start + seconds)
+        latencies = [latency for operation in operations for latency in run.latencies[(stage, operation)]]
+        sent = sum(run.sent[(stage, operation)] for operation in operations)
+        errors = sum(count for key, count in run.errors.items() if key[0] == stage)
+        entry = {
+            'offered_tps': rate,
+            'sent': sent,
+            'sustained_tps': round(received / seconds, 2),
+            'succeeded': len(latencies),
+            'errors': errors,
+            'operations': {},
+        }
+        if latencies:
+            entry['latency_ms'] = {f'p{p}': round(percentile(latencies, p) * 1000, 1) for p in (50, 90, 99)}
+        for operation in operations:
+            operation_latencies = run.latencies[(stage, operation)]
+            entry['operations'][operation] = {
+                'sent': run.sent[(stage, operation)],
+                'succeeded': len(operation_latencies),
+                'p50_ms': round(percentile(operation_latencies, 50) * 1000, 1) if operation_latencies else None,
+                'p99_ms': round(percentile(operation_latencies, 99) * 1000, 1) if operation_latencies else None,
+            }
+        report.append(entry)
+        stage_start += seconds
+    return report
+
+def saturation_point(report):
+    """Offered rate of the first stage whose sustained TPS falls behind it, None if none does"""
+    for entry in report:
+        if entry['sustained_tps'] < entry['offered_tps'] * (1 - SATURATION_TOLERANCE):
+            return entry['offered_tps']
+    return None
+
+def print_report(run, report, operations):
+    print("\n" + "=" * 60)
+    print("LOAD REPORT")
+    print("=" * 60)
+    print(f"{'offered':>8} {'sent':>7} {'sustained':>10} {'ok':>7} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for entry in report:
+        latency = entry.get('latency_ms', {})
+        print(
+            f"{entry['offered_tps']:>8} {entry['sent']:>7} {entry['sustained_tps']:>10} {entry['succeeded']:>7} "
+            f"{entry['errors']:>7} {latency.get('p50', '-'):>8} {latency.get('p99', '-'):>8}"
+        )
+    
+    saturated = saturation_point(report)
+    if saturated is not None:
+        print(f"\n📉 Saturates at {saturated} tx/s offered")
+    elif len(report) > 1:
+        print(f"\n📈 No saturation up to {report[-1]['offered_tps']} tx/s")
+    
+    all_latencies = [latency for values in run.latencies.values() for latency in values]
+    if all_latencies:
+        print("\n⏱️  Latency (all stages)")
+        buckets = histogram(all_latencies)
+        peak = max(count for _, count in buckets)
+        for label, count in buckets:
+            bar = '█' * round(HISTOGRAM_WIDTH * count / peak) if peak else ''
+            print(f"   {label:>10} {count:>7} {bar}")
+    
+    if run.errors:
+        print("\n❌ Errors by reason")
+        by_reason = Counter()
+        for (_, operation, kind, reason), count in run.errors.items():
+            by_reason[(operation, kind, reason)] += count
+        for (operation, kind, reason), count in by_reason.most_common():
+            print(f"   {count:>7}  {operation:<30} {kind:<9} {reason}")
+    
+    for operation in operations:
+        sent = sum(run.sent[(stage, operation)] for stage in range(len(report)))
+        errors = sum(count for key, count in run.errors.items() if key[1] == operation)
+        if sent:
+            print(f"   {operation:<30} {sent:>7} sent, {errors / sent:.1%} errors")
+
+# --------- Main ---------
+
+async def main():
+    parser = argparse.ArgumentParser(description='Generate concurrent user load on overgoal_game')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'Operations per second (default: {DEFAULT_RATE})')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION,
+                        help=f'Seconds at --rate (default: {DEFAULT_DURATION})')
+    parser.add_argument('--rates', type=float, nargs='+', help='Ramp through these rates instead of --rate')
+    parser.add_argument('--stage-seconds', type=float, default=DEFAULT_DURATION,
+                        help=f'Seconds per --rates stage (default: {DEFAULT_DURATION})')
+    parser.add_argument('--mix', nargs='+', metavar='OPERATION=WEIGHT',
+                        help=f'Operation weights (default: {" ".join(f"{k}={v}" for k, v in DEFAULT_MIX.items())})')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS,
+                        help=f'Simulated users (default: {DEFAULT_USERS})')
+    parser.add_argument('--id-base', type=int, default=LOADGEN_ID_BASE,
+                        help=f'First user (player) id (default: {LOADGEN_ID_BASE})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'Random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--accounts', type=int, default=0, help='Spread users over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Spread users over the accounts in a JSON file ([{"address", "private_key"}, ...])')
+    parser.add_argument('--boot', action='store_true',
+                        help='Start katana from katana.toml and deploy with sozo first (see bench.py)')
+    parser.add_argument('--skip-setup', action='store_true', help='Reuse the users of an earlier run')
+    parser.add_argument('--out', type=Path, help='Write the report as JSON')
+    
+    args = parser.parse_args()
+    
+    mix = parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX)
+    stages = [(rate, args.stage_seconds) for rate in args.rates] if args.rates else [(args.rate, args.duration)]
+    if args.id_base < BENCH_ID_LIMIT and args.id_base + args.users > BENCH_ID_BASE:
+        print(f"❌ User ids must stay clear of bench.py's ids ({BENCH_ID_BASE} to {BENCH_ID_LIMIT - 1})")
+        sys.exit(1)
+    user_ids = list(range(args.id_base, args.id_base + args.users))
+    schedule = build_schedule(args.seed, stages, mix, user_ids)
+    
+    print("=" * 60)
+    print(f"LOAD: {len(schedule)} operations over {sum(seconds for _, seconds in stages):.0f}s (seed {args.seed})")
+    print("=" * 60)
+    
+    async with StarknetClient.from_config() as client:
+        katana = await boot(client) if args.boot else None
+        try:
+            manifest = load_manifest()
+            admin_address = manifest.contract_address('overgoal-admin')
+            game_address = manifest.contract_address('overgoal-overgoal_game')
+            clients = await shard_clients(client, args.accounts, args.accounts_file)
+            print(f"👤 {len(clients)} accounts, {len(user_ids)} users")
+            
+            if not args.skip_setup:
+                await setup_users(clients, admin_address, game_address, user_ids)
+            await warm_up(clients, game_address, user_ids)
+            
+            print("🚦 Running...")
+            run, start = await drive(clients, game_address, schedule, user_ids)
+        finally:
+            if katana is not None:
+                katana.terminate()
+                katana.wait()
+    
+    report = stage_report(run, start, stages, list(mix))
+    print_report(run, report, list(mix))
+    
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({
+                'seed': args.seed,
+                'users': args.users,
+                'accounts': len(clients),
+                'mix': mix,
+                'stages': report,
+                'saturated_at': saturation_point(report),
+                'errors': [
+                    {'stage': stage, 'operation': operation, 'kind': kind, 'reason': reason, 'count': count}
+                    for (stage, operation, kind, reason), count in sorted(run.errors.items())
+                ],
+                'latency_histogram': histogram([latency for values in run.latencies.values() for latency in values]),
+            }, f, indent=2)
+        print(f"\n💾 Report written to {args.out}")
+
+if __name__ == '__main__':
+    asyncio.run(main())
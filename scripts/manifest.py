@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Cached, indexed access to the sozo manifests (manifest_dev.json of Overgoal
+and of the sibling Universe project).
+
+Each manifest is parsed once per process and indexed by tag:
+- contracts: tag -> {address, class_hash, selector, systems}
+- models / events: tag -> {selector, class_hash, members}
+- ABI entries: contract tag (or 'world') -> name -> entry, where interface
+  functions are indexed by their own name
+
+The indexes are pickled next to this script (.manifest_cache/) and reused
+until the manifest's mtime or size changes, so scripts skip re-parsing the
+full JSON on startup.
+
+Usage:
+    manifest = load_manifest()
+    admin_address = manifest.contract_address('overgoal-admin')
+    selector = manifest.model_selector('overgoal-OvergoalPlayer')
+"""
+
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+
+# Configuration
+ROOT_PATH = Path(__file__).parent.parent
+MANIFEST_PATH = ROOT_PATH / "manifest_dev.json"
+UNIVERSE_MANIFEST_PATH = ROOT_PATH.parent / "universe" / "manifest_dev.json"
+CACHE_DIR = Path(__file__).parent / ".manifest_cache"
+CACHE_VERSION = 1
+
+class Manifest:
+    """Tag-indexed view of one sozo manifest"""
+    
+    def __init__(self, world, contracts, models, events, abis):
+        self.world = world
+        self.contracts = contracts
+        self.models = models
+        self.events = events
+        self.abis = abis
+    
+    @classmethod
+    def from_json(cls, data):
+        """Build the indexes from a parsed manifest"""
+        world = {
+            'address': data['world']['address'],
+            'class_hash': data['world']['class_hash'],
+            'name': data['world'].get('name'),
+        }
+        abis = {'world': index_abi(data['world'].get('abi', []))}
+        
+        contracts = {}
+        for contract in data.get('contracts', []):
+            contracts[contract['tag']] = {
+                'address': contract['address'],
+                'class_hash': contract['class_hash'],
+                'selector': contract.get('selector'),
+                'systems': contract.get('systems', []),
+            }
+            abis[contract['tag']] = index_abi(contract.get('abi', []))
+        
+        models = {model['tag']: resource_entry(model) for model in data.get('models', [])}
+        events = {event['tag']: resource_entry(event) for event in data.get('events', [])}
+        
+        return cls(world, contracts, models, events, abis)
+    
+    @property
+    def world_address(self):
+        return self.world['address']
+    
+    def contract_address(self, tag):
+        """Address of the contract with the given tag (e.g. `overgoal-admin`)"""
+        if tag not in self.contracts:
+            raise KeyError(f"Contract {tag} not found in manifest")
+        return self.contracts[tag]['address']
+    
+    def model_selector(self, tag):
+        """Selector of the model with the given tag (e.g. `overgoal-OvergoalPlayer`)"""
+        if tag not in self.models:
+            raise KeyError(f"Model {tag} not found in manifest")
+        return int(self.models[tag]['selector'], 16)
+    
+    def event_selector(self, tag):
+        """Selector of the event with the given tag"""
+        if tag not in self.events:
+            raise KeyError(f"Event {tag} not found in manifest")
+        return int(self.events[tag]['selector'], 16)
+    
+    def abi_entry(self, tag, name):
+        """ABI entry (function, struct, enum, event) of a contract by name"""
+        if tag not in self.abis or name not in self.abis[tag]:
+            raise KeyError(f"ABI entry {name} of {tag} not found in manifest")
+        return self.abis[tag][name]
+
+def resource_entry(resource):
+    return {
+        'selector': resource['selector'],
+        'class_hash': resource['class_hash'],
+        'members': resource.get('members', []),
+    }
+
+def index_abi(abi):
+    """name -> entry for an ABI, with interface functions lifted to the top level"""
+    entries = {}
+    for entry in abi:
+        if entry.get('type') == 'interface':
+            for item in entry.get('items', []):
+                entries[item['name']] = item
+        if 'name' in entry:
+            entries.setdefault(entry['name'], entry)
+    return entries
+
+def cache_path(path):
+    return CACHE_DIR / f"{Path(path).resolve().as_posix().strip('/').replace('/', '_')}.pickle"
+
+def read_cache(path, stamp):
+    """Cached indexes for a manifest if they were built from the same file version"""
+    try:
+        with open(cache_path(path), 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if cached.get('version') != CACHE_VERSION or cached.get('stamp') != stamp:
+        return None
+    return Manifest(**cached['indexes'])
+
+def write_cache(path, stamp, manifest):
+    """Persist the indexes; a read-only checkout just means no cache"""
+    target = cache_path(path)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        temp = target.with_suffix('.tmp')
+        with open(temp, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'stamp': stamp, 'indexes': vars(manifest)}, f)
+        os.replace(temp, target)
+    except OSError:
+        pass
+
+@lru_cache(maxsize=None)
+def load_manifest(path=MANIFEST_PATH):
+    """Indexed manifest, parsed at most once per process and cached on disk by mtime"""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    
+    manifest = read_cache(path, stamp)
+    if manifest is None:
+        with open(path, 'r') as f:
+            manifest = Manifest.from_json(json.load(f))
+        write_cache(path, stamp, manifest)
+    return manifest
+
+def load_universe_manifest():
+    """Indexed manifest of the Universe project"""
+    return load_manifest(UNIVERSE_MANIFEST_PATH)
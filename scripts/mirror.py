@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Local SQLite mirror of the Overgoal world state for read-only tooling.
+
+`refresh` reads the entities of the given seasons from the node once and
+stores them in scripts/mirror.sqlite:
+- Season, SeasonClub, Club and SeasonPlayer (from admin.get_season_snapshot),
+- OvergoalPlayer and UniversePlayer of every season player (plus any extra
+  player ids asked for), and User for the given owner addresses.
+
+A refresh only rewrites what it read: the rows of the refreshed seasons and
+ids, other seasons stay as they were. What was read is recorded in `coverage`
+(per table, the season ids or entity keys, with the block and time of the
+refresh), so a missing row is only reported as "does not exist" when its key
+was covered; anything outside the coverage is not known to the mirror.
+
+Every model table is tagged in `sync_state` with the world it was read from,
+the block number of its last refresh, and the time of that refresh. When
+the world address in manifest_dev.json changes (e.g. after
+`restart_fresh.sh`), the rows and coverage of the old world are dropped and
+the mirror must be refreshed before it can answer again.
+
+The reporting scripts (show_season_players.py, check_existing_data.py) read
+through `open_source()`: with `--offline` they only read the mirror and exit
+on anything it does not cover, with `--max-staleness SECONDS` they read the
+mirror when it is fresh enough and fall back to the node otherwise, also for
+single seasons or entities that are not covered or older than that.
+
+Usage:
+    ./scripts/mirror.py refresh --season-id 1
+    ./scripts/mirror.py status
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from pathlib import Path
+
+from manifest import load_manifest, load_universe_manifest
+from models import Club, OvergoalPlayer, Season, SeasonClub, SeasonPlayer, User, read_record, read_season_snapshot
+from starknet_client import StarknetClient, to_int
+
+# Configuration
+MIRROR_PATH = Path(__file__).parent / "mirror.sqlite"
+REFRESH_CONCURRENCY = 32
+UNIVERSE_PLAYER_TAG = 'universe-UniversePlayer'
+
+# Mirrored record types, by tag (UniversePlayer is kept as a plain dict)
+MIRRORED_TYPES = {cls.TAG: cls for cls in (Season, Club, SeasonClub, SeasonPlayer, OvergoalPlayer, User)}
+
+# Tables covered per season id, the others per entity key
+SEASON_SCOPED_TAGS = (SeasonClub.TAG, SeasonPlayer.TAG)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    tag TEXT PRIMARY KEY,
+    world_address TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+"""
+
+class MirrorError(Exception):
+    """The mirror cannot answer (never refreshed, stale, from another world, or not covering the key)"""
+
+class Mirror:
+    """SQLite store of mirrored entities, one JSON row per entity"""
+    
+    def __init__(self, path=MIRROR_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+    
+    def close(self):
+        self.db.close()
+    
+    def sync_state(self, tag):
+        """(world_address, block_number, synced_at) of a table, None if never synced"""
+        return self.db.execute(
+            "SELECT world_address, block_number, synced_at FROM sync_state WHERE tag = ?", (tag,)
+        ).fetchone()
+    
+    def drop_other_worlds(self, tag, world_address):
+        """Forget a table synced from another world, returns True if it was dropped"""
+        state = self.sync_state(tag)
+        if state is None or to_int(state[0]) == to_int(world_address):
+            return False
+        with self.db:
+            self.db.execute("DELETE FROM records WHERE tag = ?", (tag,))
+            self.db.execute("DELETE FROM coverage WHERE tag = ?", (tag,))
+            self.db.execute("DELETE FROM sync_state WHERE tag = ?", (tag,))
+        return True
+    
+    def store(self, tag, world_address, block_number, rows, covered_keys):
+        """Upsert the rows read for `covered_keys` in one transaction, rows is {key: data}
+        
+        Earlier rows of the covered keys (of the covered seasons, for season
+        scoped tables) are dropped first, rows of other keys are kept.
+        """
+        now = time.time()
+        with self.db:
+            if tag in SEASON_SCOPED_TAGS:
+                self.db.executemany(
+                    "DELETE FROM records WHERE tag = ? AND json_extract(data, '$.season_id') = ?",
+                    [(tag, season_id) for season_id in covered_keys]
+                )
+            else:
+                self.db.executemany(
+                    "DELETE FROM records WHERE tag = ? AND key = ?", [(tag, str(key)) for key in covered_keys]
+                )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO records (tag, key, data) VALUES (?, ?, ?)",
+                [(tag, str(key), json.dumps(data)) for key, data in rows.items()]
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO coverage (tag, key, block_number, synced_at) VALUES (?, ?, ?, ?)",
+                [(tag, str(key), block_number, now) for key in covered_keys]
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state (tag, world_address, block_number, synced_at) VALUES (?, ?, ?, ?)",
+                (tag, world_address, block_number, now)
+            )
+    
+    def covered(self, tag, key, max_staleness=None):
+        """True when `key` (a season id for season scoped tables) was read at a refresh, recently enough"""
+        row = self.db.execute(
+            "SELECT synced_at FROM coverage WHERE tag = ? AND key = ?", (tag, str(key))
+        ).fetchone()
+        return row is not None and (max_staleness is None or time.time() - row[0] <= max_staleness)
+    
+    def covered_keys(self, tag):
+        return [row[0] for row in self.db.execute("SELECT key FROM coverage WHERE tag = ?", (tag,))]
+    
+    def get(self, tag, key):
+        """Mirrored data of an entity, None if it was not found at the last refresh"""
+        row = self.db.execute("SELECT data FROM records WHERE tag = ? AND key = ?", (tag, str(key))).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def all(self, tag):
+        return [json.loads(row[0]) for row in self.db.execute("SELECT data FROM records WHERE tag = ?", (tag,))]
+    
+    def check(self, tags, world_addresses, max_staleness=None):
+        """Raise MirrorError unless every table is synced from the current world (and fresh enough)"""
+        for tag in tags:
+            state = self.sync_state(tag)
+            if state is None:
+                raise MirrorError(f"{tag} was never mirrored, run `mirror.py refresh`")
+            world_address = world_addresses[tag]
+            if to_int(state[0]) != to_int(world_address):
+                raise MirrorError(f"{tag} was mirrored from world {state[0]}, the manifest is at {world_address}")
+            age = time.time() - state[2]
+            if max_staleness is not None and age > max_staleness:
+                raise MirrorError(f"{tag} is {age:.0f}s old (max staleness {max_staleness}s)")
+
+def world_addresses(manifest, universe_manifest):
+    """World address each mirrored table is read from"""
+    addresses = {tag: manifest.world_address for tag in MIRRORED_TYPES}
+    addresses[UNIVERSE_PLAYER_TAG] = universe_manifest.world_address
+    return addresses
+
+def record_key(record):
+    return record.owner if isinstance(record, User) else record.id
+
+def universe_player_exists(record):
+    # Keys are always set to the queried value; the entity exists if any other field is set
+    return any(value for name, value in record.items() if name != 'id')
+
+class LiveSource:
+    """Reads from the node"""
+    
+    def __init__(self, client, manifest, universe_manifest):
+        self.client = client
+        self.manifest = manifest
+        self.universe_manifest = universe_manifest
+    
+    async def record(self, cls, keys):
+        return await read_record(self.client, self.manifest, cls, keys)
+    
+    async def season_members(self, season_id):
+        """([(SeasonClub, club name)], [(SeasonPlayer, OvergoalPlayer or None)]) of a season, empty if it doesn't exist"""
+        # get_season_snapshot reverts for a missing season
+        if await self.record(Season, [season_id]) is None:
+            return [], []
+        snapshot = await read_season_snapshot(self.client, self.manifest, season_id)
+        season_players = [
+            (season_player, overgoal_player if overgoal_player.exists() else None)
+            for season_player, overgoal_player in snapshot.season_players
+        ]
+        return snapshot.season_clubs, season_players
+    
+    async def universe_player(self, player_id):
+        selector = self.universe_manifest.model_selector(UNIVERSE_PLAYER_TAG)
+        record = await self.client.read_model(self.universe_manifest.world_address, selector, [player_id])
+        return record if universe_player_exists(record) else None
+
+class MirrorSource:
+    """Reads from the mirror, with the same interface as LiveSource
+    
+    Keys and seasons the mirror does not cover (or covered longer than
+    `max_staleness` ago) are read from `fallback`, a LiveSource, or raise
+    MirrorError without one.
+    """
+    
+    def __init__(self, mirror, max_staleness=None, fallback=None):
+        self.mirror = mirror
+        self.max_staleness = max_staleness
+        self.fallback = fallback
+    
+    def covered(self, tag, key):
+        return self.mirror.covered(tag, key, self.max_staleness)
+    
+    async def outside(self, what, read):
+        if self.fallback is None:
+            raise MirrorError(f"{what} is not in the mirror, run `mirror.py refresh` with it")
+        print(f"⚠️  {what} is not in the mirror, reading it from the node")
+        return await read(self.fallback)
+    
+    async def record(self, cls, keys):
+        data = self.mirror.get(cls.TAG, keys[0])
+        if cls.TAG in SEASON_SCOPED_TAGS:
+            # A missing row may belong to a season that was not mirrored
+            if data is not None and self.covered(cls.TAG, data['season_id']):
+                return cls(**data)
+        elif self.covered(cls.TAG, keys[0]):
+            return cls(**data) if data is not None else None
+        return await self.outside(f"{cls.__name__} {keys[0]}", lambda source: source.record(cls, keys))
+    
+    async def season_members(self, season_id):
+        if not all(self.covered(tag, season_id) for tag in SEASON_SCOPED_TAGS):
+            return await self.outside(f"Season {season_id}", lambda source: source.season_members(season_id))
+        
+        season_clubs = sorted(
+            (SeasonClub(**data) for data in self.mirror.all(SeasonClub.TAG) if data['season_id'] == season_id),
+            key=lambda season_club: season_club.id
+        )
+        clubs = [self.mirror.get(Club.TAG, season_club.club_id) for season_club in season_clubs]
+        club_names = [club['name'] if club is not None else '' for club in clubs]
+        season_players = sorted(
+            (SeasonPlayer(**data) for data in self.mirror.all(SeasonPlayer.TAG) if data['season_id'] == season_id),
+            key=lambda season_player: season_player.id
+        )
+        season_players = [
+            (season_player, await self.record(OvergoalPlayer, [season_player.overgoal_player_id]))
+            for season_player in season_players
+        ]
+        return list(zip(season_clubs, club_names)), season_players
+    
+    async def universe_player(self, player_id):
+        if self.covered(UNIVERSE_PLAYER_TAG, player_id):
+            return self.mirror.get(UNIVERSE_PLAYER_TAG, player_id)
+        return await self.outside(f"UniversePlayer {player_id}", lambda source: source.universe_player(player_id))
+
+@asynccontextmanager
+async def open_source(offline=False, max_staleness=None, path=MIRROR_PATH):
+    """LiveSource or MirrorSource for the reporting scripts' --offline / --max-staleness options"""
+    manifest = load_manifest()
+    universe_manifest = load_universe_manifest()
+    
+    if offline or max_staleness is not None:
+        mirror = Mirror(path)
+        try:
+            tags = [*MIRRORED_TYPES, UNIVERSE_PLAYER_TAG]
+            mirror.check(tags, world_addresses(manifest, universe_manifest), max_staleness)
+        except MirrorError as e:
+            mirror.close()
+            if offline:
+                print(f"❌ Mirror unusable: {e}")
+                sys.exit(1)
+            print(f"⚠️  {e}, reading from the node")
+        else:
+            oldest = min(mirror.sync_state(tag)[2] for tag in tags)
+            print(f"🗄️  Reading from the mirror ({time.time() - oldest:.0f}s old)")
+            try:
+                if offline:
+                    try:
+                        yield MirrorSource(mirror)
+                    except MirrorError as e:
+                        print(f"❌ Mirror unusable: {e}")
+                        sys.exit(1)
+                else:
+                    async with StarknetClient.from_config() as client:
+                        yield MirrorSource(mirror, max_staleness, LiveSource(client, manifest, universe_manifest))
+            finally:
+                mirror.close()
+            return
+    
+    async with StarknetClient.from_config() as client:
+        yield LiveSource(client, manifest, universe_manifest)
+
+async def refresh(client, mirror, season_ids, player_ids=(), user_addresses=()):
+    """Re-read the entities of the given seasons and ids and upsert them in the mirror, returns row counts"""
+    manifest = load_manifest()
+    universe_manifest = load_universe_manifest()
+    source = LiveSource(client, manifest, universe_manifest)
+    addresses = world_addresses(manifest, universe_manifest)
+    
+    for tag, world_address in addresses.items():
+        if mirror.drop_other_worlds(tag, world_address):
+            print(f"🔄 World changed for {tag}, dropped the old rows")
+    
+    # Reads are at least as recent as this block
+    block_number = await client.rpc('starknet_blockNumber', [])
+    semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+    
+    async def read_all(read, ids):
+        async def read_one(entity_id):
+            async with semaphore:
+                return await read(entity_id)
+        results = await asyncio.gather(*[read_one(entity_id) for entity_id in ids])
+        return [result for result in results if result is not None]
+    
+    def record_reader(cls):
+        return lambda entity_id: source.record(cls, [entity_id])
+    
+    # Season, clubs, season players and their OvergoalPlayers: a few calls per season
+    seasons, season_clubs, clubs, season_players, overgoal_players = [], [], [], [], []
+    for season_id in season_ids:
+        # get_season_snapshot reverts for a missing season, which is still mirrored as missing
+        if await source.record(Season, [season_id]) is None:
+            print(f"⚠️  Season {season_id} does not exist")
+            continue
+        snapshot = await read_season_snapshot(client, manifest, season_id)
+        seasons.append(snapshot.season)
+        for season_club, club_name in snapshot.season_clubs:
+            season_clubs.append(season_club)
+            clubs.append(Club(id=season_club.club_id, name=club_name))
+        for season_player, overgoal_player in snapshot.season_players:
+            season_players.append(season_player)
+            if overgoal_player.exists():
+                overgoal_players.append(overgoal_player)
+    
+    overgoal_player_ids = sorted({player.overgoal_player_id for player in season_players} | set(player_ids))
+    extra_player_ids = sorted(set(player_ids) - {player.id for player in overgoal_players})
+    overgoal_players += await read_all(record_reader(OvergoalPlayer), extra_player_ids)
+    universe_players = await read_all(source.universe_player, overgoal_player_ids)
+    users = await read_all(record_reader(User), user_addresses)
+    
+    counts = {}
+    for tag, records, covered_keys in (
+        (Season.TAG, seasons, season_ids),
+        (SeasonPlayer.TAG, season_players, season_ids),
+        (SeasonClub.TAG, season_clubs, season_ids),
+        (Club.TAG, clubs, [club.id for club in clubs]),
+        (OvergoalPlayer.TAG, overgoal_players, overgoal_player_ids),
+        (User.TAG, users, user_addresses),
+    ):
+        mirror.store(
+            tag, addresses[tag], block_number,
+            {record_key(record): asdict(record) for record in records}, covered_keys
+        )
+        counts[tag] = len(records)
+    
+    mirror.store(
+        UNIVERSE_PLAYER_TAG, addresses[UNIVERSE_PLAYER_TAG], block_number,
+        {record['id']: record for record in universe_players}, overgoal_player_ids
+    )
+    counts[UNIVERSE_PLAYER_TAG] = len(universe_players)
+    return block_number, counts
+
+def print_status(mirror):
+    """Print the sync state of every table"""
+    for tag in [*MIRRORED_TYPES, UNIVERSE_PLAYER_TAG]:
+        state = mirror.sync_state(tag)
+        if state is None:
+            print(f"  ❌ {tag}: never mirrored")
+            continue
+        world_address, block_number, synced_at = state
+        rows = len(mirror.all(tag))
+        covered_keys = mirror.covered_keys(tag)
+        if tag == Season.TAG or tag in SEASON_SCOPED_TAGS:
+            coverage = f"seasons {', '.join(sorted(covered_keys, key=int))}"
+        else:
+            coverage = f"{len(covered_keys)} keys covered"
+        print(
+            f"  ✅ {tag}: {rows} rows, {coverage}, last refresh at block {block_number}, "
+            f"{time.time() - synced_at:.0f}s ago ({world_address})"
+        )
+
+async def main():
+    parser = argparse.ArgumentParser(description='Local SQLite mirror of the Overgoal world')
+    parser.add_argument('--mirror', type=Path, default=MIRROR_PATH, help=f'Mirror database (default: {MIRROR_PATH})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    refresh_parser = subparsers.add_parser('refresh', help='Re-read the world into the mirror')
+    refresh_parser.add_argument('--season-id', type=int, action='append',
+                                help='Season to mirror, may be repeated (default: 1)')
+    refresh_parser.add_argument('--player-ids', type=int, default=0,
+                                help='Also mirror players 1..N even if they are not in a season')
+    refresh_parser.add_argument('--user', action='append', default=[], help='User owner address to mirror')
+    
+    subparsers.add_parser('status', help='Show what the mirror holds')
+    
+    args = parser.parse_args()
+    
+    mirror = Mirror(args.mirror)
+    try:
+        if args.command == 'status':
+            print(f"🗄️  Mirror: {args.mirror}")
+            print_status(mirror)
+            return
+        
+        season_ids = args.season_id or [1]
+        user_addresses = [to_int(address) for address in args.user]
+        print("=" * 60)
+        print(f"REFRESHING MIRROR (seasons {', '.join(map(str, season_ids))})")
+        print("=" * 60)
+        
+        started_at = time.perf_counter()
+        async with StarknetClient.from_config() as client:
+            block_number, counts = await refresh(
+                client, mirror, season_ids, range(1, args.player_ids + 1), user_addresses
+            )
+        
+        for tag, count in counts.items():
+            print(f"  📥 {tag}: {count}")
+        print(f"\n✅ Mirror at block {block_number} ({time.perf_counter() - started_at:.1f}s)")
+    finally:
+        mirror.close()
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Typed records for the Overgoal models.
+
+Raw felts read from the world (or returned by views) are decoded with the
+model's schema into dataclasses, without going through any text output:
+- the schema comes from the manifest `models` entry when sozo wrote its
+  `members`, otherwise from the model contract's on-chain `schema()`;
+- `IntrospectPacked` models are unpacked by the world, so they decode like
+  any other layout; `ByteArray` fields are decoded into `str`;
+- `exists()` mirrors the Cairo `is_zero` of each model, so existence checks
+  follow the same rule as the contracts instead of "any felt is set".
+
+Usage:
+    player = await read_record(client, load_manifest(), OvergoalPlayer, [1])
+    if player is not None:
+        print(player.energy)
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import ClassVar
+
+from starknet_client import decode_value
+
+# Primitive Cairo types a manifest member can name (see dojo::meta::introspect::Ty::Primitive)
+PRIMITIVE_TYPES = {
+    'felt252', 'bool', 'u8', 'u16', 'u32', 'u64', 'u128', 'u256', 'usize',
+    'i8', 'i16', 'i32', 'i64', 'i128', 'ContractAddress', 'ClassHash', 'EthAddress',
+}
+
+@dataclass
+class Record(ABC):
+    """Base of all model records, each defining exists()"""
+    TAG: ClassVar[str] = ''
+    
+    @classmethod
+    def from_fields(cls, values):
+        """Record from a decoded {field name: value} dict"""
+        record = {}
+        for field in fields(cls):
+            if field.name not in values:
+                raise KeyError(f"{cls.TAG}: field {field.name} missing from schema")
+            value = values[field.name]
+            record[field.name] = bool(value) if field.type is bool else value
+        return cls(**record)
+    
+    @abstractmethod
+    def exists(self):
+        """Same rule as the model's Cairo is_zero, negated"""
+
+@dataclass
+class Club(Record):
+    TAG: ClassVar[str] = 'overgoal-Club'
+    id: int
+    name: str
+    
+    def exists(self):
+        return len(self.name) != 0
+
+@dataclass
+class OvergoalPlayer(Record):
+    TAG: ClassVar[str] = 'overgoal-OvergoalPlayer'
+    id: int
+    universe_player_id: int
+    goal_currency: int
+    energy: int
+    speed: int
+    leadership: int
+    pass_: int
+    shoot: int
+    freekick: int
+    is_injured: bool
+    visor_type: int
+    visor_color: int
+    energy_updated_at: int
+    
+    @classmethod
+    def from_fields(cls, values):
+        # `pass` is a Python keyword
+        return super().from_fields({**values, 'pass_': values.get('pass')})
+    
+    def exists(self):
+        return not (self.universe_player_id == 0 and self.goal_currency == 0 and self.energy == 0)
+    
+    def effective_energy(self, now):
+        """Energy at unix time `now`, regenerated since energy_updated_at (effective_energy in
+        src/models/overgoal_player.cairo)"""
+        if self.energy >= MAX_ENERGY or now <= self.energy_updated_at:
+            return self.energy
+        if ENERGY_REGEN_BY_DAY:
+            periods = now // SECONDS_PER_DAY - self.energy_updated_at // SECONDS_PER_DAY
+        else:
+            periods = (now - self.energy_updated_at) // ENERGY_REGEN_PERIOD
+        return min(MAX_ENERGY, self.energy + periods * ENERGY_REGEN_AMOUNT)
+
+@dataclass
+class Season(Record):
+    TAG: ClassVar[str] = 'overgoal-Season'
+    id: int
+    name: str
+    start_date: int
+    end_date: int
+    prize_pool: int
+    
+    def exists(self):
+        return not (len(self.name) == 0 and self.start_date == 0 and self.end_date == 0)
+
+@dataclass
+class SeasonClub(Record):
+    TAG: ClassVar[str] = 'overgoal-SeasonClub'
+    id: int
+    season_id: int
+    club_id: int
+    manager_id: int
+    coach_id: int
+    season_points: int
+    offense: int
+    defense: int
+    intensity: int
+    chemistry: int
+    matches_won: int
+    matches_lost: int
+    matches_drawn: int
+    
+    def exists(self):
+        return not (self.season_id == 0 and self.club_id == 0 and self.manager_id == 0)
+
+@dataclass
+class SeasonPlayer(Record):
+    TAG: ClassVar[str] = 'overgoal-SeasonPlayer'
+    id: int
+    season_id: int
+    season_club_id: int
+    overgoal_player_id: int
+    team_relationship: int
+    fans_relationship: int
+    season_points: int
+    matches_won: int
+    matches_lost: int
+    trophies_won: int
+    
+    def exists(self):
+        return not (self.season_id == 0 and self.season_club_id == 0 and self.overgoal_player_id == 0)
+
+@dataclass
+class User(Record):
+    TAG: ClassVar[str] = 'overgoal-User'
+    owner: int
+    username: int
+    created_at: int
+    
+    def exists(self):
+        # The Cairo is_zero tests `owner`, but that is the key and is always
+        # set on a read, so use the creation timestamp instead
+        return self.created_at != 0
+
+@dataclass
+class Roster(Record):
+    TAG: ClassVar[str] = 'overgoal-Roster'
+    scope: int
+    scope_id: int
+    count: int
+    
+    def exists(self):
+        # An empty roster is still a valid (empty) list
+        return True
+
+@dataclass
+class RosterEntry(Record):
+    TAG: ClassVar[str] = 'overgoal-RosterEntry'
+    scope: int
+    scope_id: int
+    index: int
+    member_id: int                      # season_player_id, or season_club_id (ROSTER_SCOPE_SEASON_CLUBS)
+    
+    def exists(self):
+        return self.member_id != 0
+
+@dataclass
+class FixtureSchedule(Record):
+    TAG: ClassVar[str] = 'overgoal-FixtureSchedule'
+    season_id: int
+    club_count: int
+    matchday_count: int
+    scheduled_matchdays: int
+    
+    def exists(self):
+        return self.matchday_count != 0
+    
+    def is_complete(self):
+        return self.exists() and self.scheduled_matchdays == self.matchday_count
+
+@dataclass
+class Matchday(Record):
+    TAG: ClassVar[str] = 'overgoal-Matchday'
+    season_id: int
+    matchday: int
+    day: int                            # Days since the unix epoch
+    fixture_count: int
+    
+    def exists(self):
+        return self.day != 0
+
+@dataclass
+class Fixture(Record):
+    TAG: ClassVar[str] = 'overgoal-Fixture'
+    season_id: int
+    matchday: int
+    index: int
+    home_season_club_id: int
+    away_season_club_id: int
+    
+    def exists(self):
+        return self.home_season_club_id != 0
+
+@dataclass
+class Leaderboard(Record):
+    TAG: ClassVar[str] = 'overgoal-Leaderboard'
+    board: int
+    season_id: int
+    size: int
+    count: int
+    
+    def exists(self):
+        return self.size != 0
+
+@dataclass
+class LeaderboardEntry(Record):
+    TAG: ClassVar[str] = 'overgoal-LeaderboardEntry'
+    board: int
+    season_id: int
+    rank: int
+    id: int
+    score: int
+    
+    def exists(self):
+        return self.id != 0
+
+# Roster scopes (see src/constants.cairo)
+ROSTER_SCOPE_SEASON_PLAYERS = 1
+ROSTER_SCOPE_CLUB_PLAYERS = 2
+ROSTER_SCOPE_SEASON_CLUBS = 3
+
+# Season clubs created by admin.seed_season_1
+SEASON_1_CLUBS = (101, 102, 103, 104)
+
+# Energy regeneration (see src/constants.cairo)
+MAX_ENERGY = 100
+ENERGY_REGEN_AMOUNT = 10
+ENERGY_REGEN_PERIOD = 3600
+ENERGY_REGEN_BY_DAY = False
+SECONDS_PER_DAY = 86400
+
+# Leaderboard boards (see src/constants.cairo)
+LEADERBOARD_CLUBS = 1
+LEADERBOARD_PLAYERS = 2
+
+def leaderboard_score(season_points, matches_won):
+    """Sort key of a LeaderboardEntry (leaderboard_score in src/models/leaderboard.cairo)"""
+    return season_points * 0x10000 + matches_won
+
+# Season players per admin.get_season_snapshot page (MAX_SNAPSHOT_PAGE in src/constants.cairo)
+SNAPSHOT_PAGE = 100
+
+# Ids per overgoal_game multi-get call (get_overgoal_players, get_season_players)
+MULTI_GET_BATCH = 100
+
+RECORD_TYPES = {
+    cls.TAG: cls
+    for cls in (
+        Club, OvergoalPlayer, Season, SeasonClub, SeasonPlayer, User, Roster, RosterEntry,
+        FixtureSchedule, Matchday, Fixture, Leaderboard, LeaderboardEntry,
+    )
+}
+
+def member_ty(type_name):
+    """Schema type of a manifest member type name, None if it can't be expressed"""
+    short_name = type_name.split('::')[-1]
+    if short_name == 'ByteArray':
+        return ('bytearray',)
+    if short_name in PRIMITIVE_TYPES:
+        return ('primitive', short_name)
+    return None
+
+def manifest_schema(manifest, tag):
+    """Schema of a model (or event) built from the manifest `members`, None when they are missing"""
+    resource = manifest.models.get(tag) or manifest.events.get(tag) or {}
+    members = resource.get('members')
+    if not members:
+        return None
+    
+    schema_members = []
+    for member in members:
+        ty = member_ty(member['type'])
+        if ty is None:
+            return None
+        schema_members.append((member['name'], bool(member.get('key')), ty))
+    return ('struct', tag.split('-')[-1], schema_members)
+
+async def model_schema(client, manifest, cls):
+    """Schema of a record type: manifest members first, on-chain `schema()` otherwise"""
+    schema = manifest_schema(manifest, cls.TAG)
+    if schema is None:
+        schema = await client.model_schema(manifest.world_address, manifest.model_selector(cls.TAG))
+    return schema
+
+async def read_record(client, manifest, cls, keys):
+    """Read one entity as a typed record, None if it does not exist"""
+    schema = await model_schema(client, manifest, cls)
+    values = await client.read_model(manifest.world_address, manifest.model_selector(cls.TAG), keys, schema=schema)
+    record = cls.from_fields(values)
+    return record if record.exists() else None
+
+async def record_exists(client, manifest, cls, keys):
+    """True when the entity exists by the model's own is_zero rule"""
+    return await read_record(client, manifest, cls, keys) is not None
+
+def decode_records(cls, schema, values, offset=0):
+    """Decode a serialized Array/Span of full model structs (keys included), returns (records, next_offset)"""
+    count = values[offset]
+    offset += 1
+    records = []
+    for _ in range(count):
+        decoded, offset = decode_value(schema, values, offset)
+        records.append(cls.from_fields(decoded))
+    return records, offset
+
+async def read_records_batch(client, manifest, cls, entrypoint, ids):
+    """Records for `ids` from an overgoal_game multi-get view, in order, None where missing"""
+    schema = await model_schema(client, manifest, cls)
+    game_address = manifest.contract_address('overgoal-overgoal_game')
+    values = await client.call(game_address, entrypoint, [len(ids), *ids])
+    records, _ = decode_records(cls, schema, values)
+    return [record if record.exists() else None for record in records]
+
+async def read_overgoal_players(client, manifest, ids):
+    """OvergoalPlayers for `ids` through get_overgoal_players, None where missing"""
+    return await read_records_batch(client, manifest, OvergoalPlayer, 'get_overgoal_players', ids)
+
+async def read_season_players(client, manifest, ids):
+    """SeasonPlayers for `ids` through get_season_players, None where missing"""
+    return await read_records_batch(client, manifest, SeasonPlayer, 'get_season_players', ids)
+
+async def read_roster(client, manifest, scope, scope_id):
+    """Season player ids of a Season or SeasonClub roster: one read for the count, then one per entry"""
+    roster = await read_record(client, manifest, Roster, [scope, scope_id])
+    entries = await asyncio.gather(*[
+        read_record(client, manifest, RosterEntry, [scope, scope_id, index])
+        for index in range(roster.count)
+    ])
+    return [entry.member_id for entry in entries if entry is not None]
+
+@dataclass
+class SeasonSnapshot:
+    """A season with its clubs and players, as returned by admin.get_season_snapshot"""
+    season: Season
+    season_clubs: list                  # [(SeasonClub, club name)]
+    season_players: list                # [(SeasonPlayer, OvergoalPlayer)]
+    total_players: int
+
+async def read_season_snapshot(client, manifest, season_id, page_size=SNAPSHOT_PAGE):
+    """Whole season through admin.get_season_snapshot: one call for the first page, then the others in parallel"""
+    season_schema, club_schema, season_player_schema, overgoal_player_schema = await asyncio.gather(
+        *[model_schema(client, manifest, cls) for cls in (Season, SeasonClub, SeasonPlayer, OvergoalPlayer)]
+    )
+    clubs_ty = ('array', [('tuple', [club_schema, ('bytearray',)])])
+    players_ty = ('array', [('tuple', [season_player_schema, overgoal_player_schema])])
+    admin_address = manifest.contract_address('overgoal-admin')
+    
+    async def read_page(offset):
+        values = await client.call(admin_address, 'get_season_snapshot', [season_id, offset, page_size])
+        season, offset = decode_value(season_schema, values, 0)
+        clubs, offset = decode_value(clubs_ty, values, offset)
+        players, offset = decode_value(players_ty, values, offset)
+        return season, clubs, players, values[offset]
+    
+    season, clubs, players, total_players = await read_page(0)
+    pages = await asyncio.gather(*[read_page(offset) for offset in range(page_size, total_players, page_size)])
+    for _season, _clubs, page_players, _total in pages:
+        players += page_players
+    
+    return SeasonSnapshot(
+        season=Season.from_fields(season),
+        season_clubs=[(SeasonClub.from_fields(club), name) for club, name in clubs],
+        season_players=[
+            (SeasonPlayer.from_fields(season_player), OvergoalPlayer.from_fields(overgoal_player))
+            for season_player, overgoal_player in players
+        ],
+        total_players=total_players,
+    )
+
+async def read_matchday_fixtures(client, manifest, season_id, matchday):
+    """(Matchday, [Fixture]) through admin.get_matchday_fixtures"""
+    matchday_schema, fixture_schema = await asyncio.gather(
+        model_schema(client, manifest, Matchday), model_schema(client, manifest, Fixture)
+    )
+    admin_address = manifest.contract_address('overgoal-admin')
+    values = await client.call(admin_address, 'get_matchday_fixtures', [season_id, matchday])
+    header, offset = decode_value(matchday_schema, values, 0)
+    fixtures, _ = decode_records(Fixture, fixture_schema, values, offset)
+    return Matchday.from_fields(header), fixtures
+
+async def read_leaderboard(client, manifest, season_id, board):
+    """[LeaderboardEntry] of an on-chain top-N board through admin.get_leaderboard, best first"""
+    schema = await model_schema(client, manifest, LeaderboardEntry)
+    admin_address = manifest.contract_address('overgoal-admin')
+    values = await client.call(admin_address, 'get_leaderboard', [season_id, board])
+    entries, _ = decode_records(LeaderboardEntry, schema, values)
+    return entries
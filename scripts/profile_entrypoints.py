@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Step, builtin, storage and gas profile of every IAdmin / IOvergoalGame
+entrypoint and of the Store helpers behind them.
+
+Test profile (default): runs the `profile_` scenarios of
+src/tests/test_profile.cairo with `sozo test --print-resource-usage`. Each
+scenario runs a setup and then one call; its baseline (the setup alone) is
+subtracted, so every row is the cost of that single call:
+- steps, memory holes and the estimated gas;
+- storage reads and writes, contract calls and events (syscalls);
+- builtin usage (range_check, pedersen, poseidon, ...).
+Store helper rows break an entrypoint down, e.g. admin.record_match against
+store.record_match and store.update_leaderboard.
+
+Trace profile (--trace / --block): reads katana's traces of sent
+transactions and walks their call tree, attributing to each call its own
+cost (its resources minus those of its sub-calls), named after the
+manifest's contract tags and entrypoints.
+
+The table is sorted and stable, so it can be diffed between commits; --out
+writes it as JSON and --diff compares it with an earlier JSON. --folded
+writes collapsed stacks ("caller;callee weight") for flamegraph.pl,
+inferno or speedscope.
+
+Usage:
+    ./scripts/profile_entrypoints.py --out profile.json
+    ./scripts/profile_entrypoints.py --diff profile.json
+    ./scripts/profile_entrypoints.py --input test_output.txt
+    ./scripts/profile_entrypoints.py --trace 0x1234... --folded calls.folded
+    ./scripts/profile_entrypoints.py --block 42 --weight l2_gas
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import shlex
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from manifest import load_manifest
+from starknet_client import ROOT_PATH, StarknetClient, get_selector_from_name
+
+# Configuration
+TEST_COMMAND = 'sozo test --print-resource-usage --filter profile_'
+BASELINE_PREFIX = 'baseline_'
+KINDS = {'admin': 'IAdmin', 'game': 'IOvergoalGame', 'store': 'Store'}
+
+# Syscall -> column
+SYSCALL_COLUMNS = {
+    'StorageRead': 'reads',
+    'StorageWrite': 'writes',
+    'CallContract': 'calls',
+    'EmitEvent': 'events',
+}
+BUILTIN_COLUMNS = ('range_check', 'pedersen', 'poseidon', 'bitwise', 'ec_op')
+COLUMNS = ('steps', 'gas', 'reads', 'writes', 'calls', 'events', *BUILTIN_COLUMNS)
+
+TEST_LINE = re.compile(r'^test (?:\S+::)?(profile_\w+) \.\.\. (\w+)(?: \(gas usage est\.: (\d+)\))?')
+COUNT_LINE = re.compile(r'^\s+(steps|memory holes): (\d+)')
+MAP_LINE = re.compile(r'^\s+(builtins|syscalls): \((.*)\)')
+MAP_ITEM = re.compile(r'"?(\w+)"?: (\d+)')
+
+# --------- Test profile ---------
+
+def parse_test_output(output):
+    """{test name: {column: value}} of the `profile_` tests in cairo-test output"""
+    tests, current = {}, None
+    for line in output.splitlines():
+        match = TEST_LINE.match(line)
+        if match:
+            name, status, gas = match.groups()
+            current = None
+            if status != 'ok':
+                print(f"⚠️  {name} {status}, skipped")
+                continue
+            current = tests[name] = defaultdict(int)
+            current['gas'] = int(gas or 0)
+            continue
+        if current is None:
+            continue
+        match = COUNT_LINE.match(line)
+        if match:
+            current[match.group(1).replace(' ', '_')] = int(match.group(2))
+            continue
+        match = MAP_LINE.match(line)
+        if match:
+            for key, value in MAP_ITEM.findall(match.group(2)):
+                if match.group(1) == 'syscalls':
+                    current[SYSCALL_COLUMNS.get(key, key)] += int(value)
+                else:
+                    current[key.removesuffix('_builtin')] += int(value)
+    return tests
+
+def profile_rows(tests):
+    """Rows of the calls, each minus the baseline of its setup, sorted by kind and name"""
+    baselines = {
+        name.removeprefix(f'profile_{BASELINE_PREFIX}'): resources
+        for name, resources in tests.items() if name.startswith(f'profile_{BASELINE_PREFIX}')
+    }
+    rows, unmatched = [], set()
+    for name, resources in tests.items():
+        parts = name.removeprefix('profile_').split('_', 2)
+        if parts[0] == BASELINE_PREFIX.rstrip('_') or len(parts) < 3 or parts[1] not in KINDS:
+            continue
+        setup, kind, call = parts
+        if setup not in baselines:
+            unmatched.add(setup)
+            continue
+        baseline = baselines[setup]
+        rows.append({
+            'kind': KINDS[kind],
+            'name': call,
+            **{column: resources[column] - baseline[column] for column in sorted(set(resources) | set(baseline))},
+        })
+    for setup in sorted(unmatched):
+        print(f"⚠️  No profile_{BASELINE_PREFIX}{setup} test, its scenarios are skipped")
+    return sorted(rows, key=lambda row: (list(KINDS.values()).index(row['kind']), row['name']))
+
+def run_tests(command):
+    """Output of the profiling tests"""
+    print(f"🧪 {command}")
+    result = subprocess.run(shlex.split(command), cwd=ROOT_PATH, capture_output=True, text=True)
+    if result.returncode != 0 and 'profile_' not in result.stdout:
+        print(f"❌ Tests failed:\n{result.stderr or result.stdout}")
+        sys.exit(1)
+    return result.stdout
+
+# --------- Trace profile ---------
+
+def call_names(manifest):
+    """address -> contract tag and selector -> entrypoint name, from the manifest"""
+    contracts = {int(manifest.world_address, 16): 'world'}
+    contracts.update({int(entry['address'], 16): tag for tag, entry in manifest.contracts.items()})
+    selectors = {}
+    for abi in manifest.abis.values():
+        for name, entry in abi.items():
+            if entry.get('type') in ('function', 'l1_handler'):
+                selectors[get_selector_from_name(name)] = name
+    return contracts, selectors
+
+def resource_weight(resources, weight):
+    """Value of `weight` (steps or l2_gas) in an execution_resources object"""
+    value = (resources or {}).get(weight, 0)
+    return int(value, 16) if isinstance(value, str) else value
+
+def walk_invocation(invocation, stack, names, weight, folded, totals):
+    """Add the own cost of a call and its sub-calls to the folded stacks and the per-call totals"""
+    contracts, selectors = names
+    address = int(invocation['contract_address'], 16)
+    selector = int(invocation['entry_point_selector'], 16)
+    frame = f"{contracts.get(address, hex(address))}::{selectors.get(selector, hex(selector))}"
+    stack = [*stack, frame]
+    
+    inclusive = resource_weight(invocation.get('execution_resources'), weight)
+    children = sum(resource_weight(call.get('execution_resources'), weight) for call in invocation.get('calls', []))
+    own = max(0, inclusive - children)
+    folded[';'.join(stack)] += own
+    totals[frame]['calls'] += 1
+    totals[frame]['own'] += own
+    totals[frame]['inclusive'] += inclusive
+    
+    for call in invocation.get('calls', []):
+        walk_invocation(call, stack, names, weight, folded, totals)
+
+async def trace_profile(tx_hashes, block, weight):
+    """(folded stacks, per-call totals, storage writes) of the traced transactions"""
+    manifest = load_manifest()
+    names = call_names(manifest)
+    async with StarknetClient.from_config() as client:
+        if block is not None:
+            traces = [
+                entry['trace_root']
+                for entry in await client.rpc('starknet_traceBlockTransactions', {'block_id': {'block_number': block}})
+            ]
+        else:
+            traces = await asyncio.gather(*[
+                client.rpc('starknet_traceTransaction', {'transaction_hash': tx_hash}) for tx_hash in tx_hashes
+            ])
+    
+    folded = defaultdict(int)
+    totals = defaultdict(lambda: defaultdict(int))
+    writes = 0
+    for trace in traces:
+        execution = trace.get('execute_invocation') or {}
+        if 'revert_reason' in execution:
+            print(f"⚠️  Reverted transaction skipped: {execution['revert_reason'][:200]}")
+            continue
+        walk_invocation(execution, [], names, weight, folded, totals)
+        for diff in (trace.get('state_diff') or {}).get('storage_diffs', []):
+            writes += len(diff.get('storage_entries', []))
+    return folded, totals, writes
+
+# --------- Output ---------
+
+def print_table(rows):
+    width = max([len(f"{row['kind']}.{row['name']}") for row in rows] + [10])
+    print(f"{'call':<{width}} " + ' '.join(f"{column:>11}" for column in COLUMNS))
+    print('-' * (width + 12 * len(COLUMNS)))
+    for row in rows:
+        print(f"{row['kind'] + '.' + row['name']:<{width}} " + ' '.join(f"{row.get(column, 0):>11}" for column in COLUMNS))
+
+def print_diff(old_rows, rows):
+    """Changes between two profiles, per call and column"""
+    old = {(row['kind'], row['name']): row for row in old_rows}
+    changed = 0
+    for row in rows:
+        key = (row['kind'], row['name'])
+        if key not in old:
+            print(f"   + {row['kind']}.{row['name']} (new)")
+            changed += 1
+            continue
+        columns = [column for column in {**old[key], **row} if column not in ('kind', 'name')]
+        deltas = [
+            f"{column} {old[key].get(column, 0)} → {row.get(column, 0)} ({row.get(column, 0) - old[key].get(column, 0):+})"
+            for column in columns if row.get(column, 0) != old[key].get(column, 0)
+        ]
+        if deltas:
+            print(f"   ~ {row['kind']}.{row['name']}: {', '.join(deltas)}")
+            changed += 1
+    for key in sorted(set(old) - {(row['kind'], row['name']) for row in rows}):
+        print(f"   - {key[0]}.{key[1]} (removed)")
+        changed += 1
+    if not changed:
+        print("   No changes")
+
+def write_folded(path, folded):
+    with open(path, 'w') as f:
+        for stack, value in sorted(folded.items()):
+            if value > 0:
+                f.write(f"{stack} {value}\n")
+    print(f"🔥 Collapsed stacks written to {path}")
+
+def rows_folded(rows, weight):
+    """Collapsed stacks of the test profile: kind;call weight"""
+    return {f"{row['kind']};{row['name']}": row.get(weight, 0) for row in rows}
+
+# --------- Main ---------
+
+async def main():
+    parser = argparse.ArgumentParser(description='Profile the cost of every entrypoint and Store helper')
+    parser.add_argument('--command', default=TEST_COMMAND, help=f'Test command (default: {TEST_COMMAND})')
+    parser.add_argument('--input', type=Path, help='Parse saved test output instead of running the tests')
+    parser.add_argument('--trace', nargs='+', metavar='TX_HASH', help='Profile katana traces of these transactions')
+    parser.add_argument('--block', type=int, help='Profile katana traces of every transaction of a block')
+    parser.add_argument('--weight', default='steps', choices=['steps', 'l2_gas'],
+                        help='Trace resource to attribute (default: steps; RPC 0.8+ nodes only report l2_gas)')
+    parser.add_argument('--out', type=Path, help='Write the profile as JSON')
+    parser.add_argument('--diff', type=Path, help='Compare with a profile written by --out')
+    parser.add_argument('--folded', type=Path, help='Write collapsed stacks for a flamegraph')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("ENTRYPOINT PROFILE")
+    print("=" * 60)
+    
+    if args.trace or args.block is not None:
+        folded, totals, writes = await trace_profile(args.trace or [], args.block, args.weight)
+        rows = sorted(
+            ({'kind': 'trace', 'name': frame, **values} for frame, values in totals.items()),
+            key=lambda row: -row['inclusive'],
+        )
+        print(f"{'call':<60} {'calls':>7} {'own ' + args.weight:>14} {'inclusive':>14}")
+        for row in rows:
+            print(f"{row['name']:<60} {row['calls']:>7} {row['own']:>14} {row['inclusive']:>14}")
+        print(f"\n💾 {writes} storage writes")
+    else:
+        output = args.input.read_text() if args.input else run_tests(args.command)
+        rows = profile_rows(parse_test_output(output))
+        if not rows:
+            print("❌ No profile_ scenarios found in the test output")
+            sys.exit(1)
+        print_table(rows)
+        folded = rows_folded(rows, 'steps')
+    
+    if args.folded:
+        write_folded(args.folded, folded)
+    if args.diff:
+        with open(args.diff, 'r') as f:
+            old_rows = json.load(f)['rows']
+        print(f"\n📊 Changes since {args.diff}:")
+        print_diff(old_rows, rows)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'rows': rows}, f, indent=2)
+        print(f"\n💾 Profile written to {args.out}")
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Build the double round-robin calendar of a season with admin.create_fixtures
+and list it by matchday.
+
+The calendar is generated on-chain in chunks: each transaction schedules as
+many matchdays as fit in --fixtures-per-tx fixtures, so seasons with hundreds
+of clubs don't hit the transaction step limit. Re-running the script resumes
+where the last chunk stopped.
+
+Usage:
+    ./scripts/schedule_fixtures.py --season-id 1
+    ./scripts/schedule_fixtures.py --season-id 1 --list 0 1 2
+    ./scripts/schedule_fixtures.py --season-id 1 --list-all
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+
+from manifest import load_manifest
+from models import (
+    FixtureSchedule, Roster, ROSTER_SCOPE_SEASON_CLUBS, read_matchday_fixtures, read_record,
+)
+from starknet_client import StarknetClient, TransactionError
+
+DEFAULT_FIXTURES_PER_TX = 400
+SECONDS_PER_DAY = 86400
+
+def day_to_date(day):
+    """Date string of a day slot (days since the unix epoch)"""
+    return datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc).strftime('%Y-%m-%d')
+
+def matchdays_per_tx(club_count, fixtures_per_tx):
+    """Matchdays of `club_count // 2` fixtures each that fit in one transaction (at least one)"""
+    return max(1, fixtures_per_tx // max(1, club_count // 2))
+
+async def schedule(client, manifest, season_id, fixtures_per_tx):
+    """Send create_fixtures chunks until the calendar is complete"""
+    admin_address = manifest.contract_address('overgoal-admin')
+    current = await read_record(client, manifest, FixtureSchedule, [season_id])
+    if current is not None and current.is_complete():
+        print(f"✅ Calendar already complete ({current.matchday_count} matchdays)")
+        return current
+    
+    if current is not None:
+        club_count = current.club_count
+        print(f"↪️  Resuming at matchday {current.scheduled_matchdays}/{current.matchday_count}")
+    else:
+        roster = await read_record(client, manifest, Roster, [ROSTER_SCOPE_SEASON_CLUBS, season_id])
+        club_count = roster.count
+        if club_count < 2:
+            print(f"❌ Season {season_id} has {club_count} season clubs, at least 2 are needed")
+            sys.exit(1)
+    
+    chunk = matchdays_per_tx(club_count, fixtures_per_tx)
+    print(f"🗓️  {club_count} clubs, {chunk} matchdays per transaction")
+    
+    start = time.perf_counter()
+    while current is None or not current.is_complete():
+        try:
+            tx_hash = await client.invoke(admin_address, 'create_fixtures', [season_id, chunk])
+        except TransactionError as e:
+            print(f"❌ create_fixtures failed: {e}")
+            sys.exit(1)
+        current = await read_record(client, manifest, FixtureSchedule, [season_id])
+        print(f"   ✅ {current.scheduled_matchdays}/{current.matchday_count} matchdays ({hex(tx_hash)})")
+    
+    print(f"\n✅ Calendar complete: {current.matchday_count} matchdays in {time.perf_counter() - start:.1f}s")
+    return current
+
+async def list_matchdays(client, manifest, season_id, matchdays):
+    """Print the fixtures of `matchdays`, read in parallel"""
+    listed = await asyncio.gather(*[
+        read_matchday_fixtures(client, manifest, season_id, matchday) for matchday in matchdays
+    ])
+    for header, fixtures in listed:
+        if not header.exists():
+            print(f"\n⚠️  Matchday {header.matchday + 1} is not scheduled")
+            continue
+        print(f"\n📅 Matchday {header.matchday + 1} — {day_to_date(header.day)} ({header.fixture_count} fixtures)")
+        for fixture in fixtures:
+            print(f"   {fixture.home_season_club_id:>6} vs {fixture.away_season_club_id:<6}")
+
+async def main():
+    parser = argparse.ArgumentParser(description='Schedule and list the fixtures of a season')
+    parser.add_argument('--season-id', type=int, default=1, help='Season to schedule (default: 1)')
+    parser.add_argument('--fixtures-per-tx', type=int, default=DEFAULT_FIXTURES_PER_TX,
+                        help=f'Fixtures written per transaction (default: {DEFAULT_FIXTURES_PER_TX})')
+    parser.add_argument('--list', type=int, nargs='+', metavar='MATCHDAY',
+                        help='List these matchdays (0-based) instead of scheduling')
+    parser.add_argument('--list-all', action='store_true', help='List the whole calendar instead of scheduling')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"SEASON {args.season_id} FIXTURES")
+    print("=" * 60)
+    
+    manifest = load_manifest()
+    async with StarknetClient.from_config() as client:
+        if args.list:
+            await list_matchdays(client, manifest, args.season_id, args.list)
+        elif args.list_all:
+            current = await read_record(client, manifest, FixtureSchedule, [args.season_id])
+            if current is None:
+                print("❌ No fixtures scheduled yet, run without --list-all first")
+                sys.exit(1)
+            await list_matchdays(client, manifest, args.season_id, range(current.scheduled_matchdays))
+        else:
+            await schedule(client, manifest, args.season_id, args.fixtures_per_tx)
+            print("\n💡 Run with --list-all to see the calendar")
+
+if __name__ == '__main__':
+    asyncio.run(main())
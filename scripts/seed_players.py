@@ -5,16 +5,69 @@ This script:
 1. Reads players from players.json
 2. Creates UniversePlayer and OvergoalPlayer for each player via admin.seed_player()
 3. Creates SeasonPlayer for each player via admin.seed_season_player()
+
+With --batch-size N, players are sent N at a time through
+admin.seed_players_batch() instead (one transaction per chunk that creates
+the players and their season players together).
+
+Before any transaction, the rows are validated against the model invariants
+and the season's clubs on-chain (validate_roster.py --from-world; season 1's
+clubs 101-104 when the world predates the roster index), and every problem is
+reported.
+
+Runs are resumable: every created entity is appended to a journal
+(--journal), and entities already in the journal or already on-chain
+(OvergoalPlayer / SeasonPlayer pre-check) are skipped without a transaction.
+
+With --reconcile, the current OvergoalPlayers and SeasonPlayers are read
+in bulk and diffed against players.json, and only what differs is sent, as
+multicalls of --calls-per-tx calls:
+- update_overgoal_player_stats for changed speed/leadership/pass/shoot/freekick;
+- seed_players_batch for missing players and season players;
+- transfer_season_player for a changed team_id.
+Visor changes can't be applied by any entrypoint and are reported; energy
+isn't compared, it regenerates on-chain (OvergoalPlayer.effective_energy).
+The journal isn't used: the chain is the reference.
+
+With --window K, up to K transactions are kept in flight at once with a
+locally tracked nonce (see tx_pipeline.py) instead of waiting for each one.
+With --accounts N (katana prefunded accounts) or --accounts-file, the
+transactions are sharded over several accounts, each with its own nonce.
+
+Requires numpy for the validation (`pip install numpy`); it's only imported
+once the players are about to be validated.
+
+Usage:
+    ./scripts/seed_players.py                        # one seed_player tx per player
+    ./scripts/seed_players.py --batch-size 20 --window 8
+    ./scripts/seed_players.py --reconcile --dry-run
 """
 
+import argparse
+import asyncio
 import json
-import subprocess
 import sys
 from pathlib import Path
 
+from journal import Journal
+from manifest import load_manifest
+from models import (
+    MULTI_GET_BATCH, OvergoalPlayer, SeasonPlayer, read_overgoal_players, read_season_players, record_exists,
+)
+from starknet_client import StarknetClient, TransactionError
+from tx_pipeline import ShardedPipeline, shard_clients
+
 # Configuration
 PLAYERS_JSON_PATH = Path(__file__).parent.parent.parent / "docs" / "players.json"
+JOURNAL_PATH = Path(__file__).parent / "seed_journal.jsonl"
 SEASON_ID = 1  # Season 1
+PRECHECK_CONCURRENCY = 32
+PRECHECK_RECORDS = {'player': OvergoalPlayer, 'season_player': SeasonPlayer}
+RECONCILE_CALLS_PER_TX = 50
+RECONCILE_SEED_BATCH = 25                       # Players per seed_players_batch call when --batch-size is 0
+STAT_FIELDS = ('speed', 'leadership', 'pass', 'shoot', 'freekick')     # update_overgoal_player_stats
+FIXED_FIELDS = ('visor_type', 'visor_color')                           # No entrypoint updates them (energy regenerates)
+
 def load_players():
     """Load players from players.json"""
     print(f"📖 Loading players from {PLAYERS_JSON_PATH}")
@@ -24,78 +77,53 @@ def load_players():
     return players
 
 def get_contract_addresses():
-    """Get contract addresses from manifest"""
+    """Get the manifest and admin contract address"""
     print("📍 Reading contract addresses from manifest...")
     try:
-        with open('manifest_dev.json', 'r') as f:
-            manifest = json.load(f)
-        
-        world_address = manifest['world']['address']
-        admin_address = None
-        
-        for contract in manifest['contracts']:
-            if contract['tag'] == 'overgoal-admin':
-                admin_address = contract['address']
-                break
+        manifest = load_manifest()
         
-        if not admin_address:
-            print("❌ Admin contract not found in manifest!")
-            sys.exit(1)
+        admin_address = manifest.contract_address('overgoal-admin')
         
-        print(f"✅ World: {world_address}")
+        print(f"✅ World: {manifest.world_address}")
         print(f"✅ Admin: {admin_address}")
-        return world_address, admin_address
+        return manifest, admin_address
+    except KeyError:
+        print("❌ Admin contract not found in manifest!")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Error reading manifest: {e}")
         sys.exit(1)
 
-def seed_player(admin_address, world_address, player):
-    """Seed a single player (creates both Universe and Overgoal players)"""
+def season_player_id_of(player):
+    """season_player_id will be unique: 10000 + player_id"""
+    return 10000 + player['user_id']
+
+def player_calldata(player):
+    """Calldata fields of a single player (seed_player / PlayerSeed order)"""
     player_id = player['user_id']
     
-    # Prepare calldata for seed_player (all values must be in hex format)
-    calldata = [
-        hex(player_id),  # player_id
-        hex(player['user_id']),  # user_id
+    return [
+        player_id,  # player_id
+        player['user_id'],  # user_id
         # Universe player attributes
-        hex(player['body_type']),
-        hex(player['skin_color']),
-        hex(player['beard_type']),
-        hex(player['hair_type']),
-        hex(player['hair_color']),
+        player['body_type'],
+        player['skin_color'],
+        player['beard_type'],
+        player['hair_type'],
+        player['hair_color'],
         # Overgoal player attributes
-        hex(player['energy']),
-        hex(player['speed']),
-        hex(player['leadership']),
-        hex(player['pass']),
-        hex(player['shoot']),
-        hex(player['freekick']),
-        hex(player['visor_type']),
-        hex(player['visor_color']),
+        player['energy'],
+        player['speed'],
+        player['leadership'],
+        player['pass'],
+        player['shoot'],
+        player['freekick'],
+        player['visor_type'],
+        player['visor_color'],
     ]
-    
-    # Call sozo execute
-    # Format: sozo execute --world <WORLD> <CONTRACT> <ENTRYPOINT> <CALLDATA...>
-    cmd = [
-        'sozo', 'execute',
-        '--world', world_address,
-        admin_address,
-        'seed_player',
-        *calldata,
-        '--wait'
-    ]
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n  ❌ Command: {' '.join(cmd)}")
-        print(f"  ❌ Stdout: {e.stdout}")
-        print(f"  ❌ Stderr: {e.stderr}")
-        return False
-
-def seed_season_player(admin_address, world_address, player):
-    """Seed a single season player"""
+
+def season_player_calldata(player):
+    """Calldata fields of a single season player (seed_season_player / SeasonPlayerSeed order)"""
     player_id = player['user_id']
     team_id = player['team_id']
     
@@ -106,111 +134,369 @@ def seed_season_player(admin_address, world_address, player):
     # JSON team_id 3 → club 4 (season_club_id 104)
     season_club_id = 101 + team_id  # 0→101, 1→102, 2→103, 3→104
     
-    # All players have teams now (no skip needed)
-    
-    # season_player_id will be unique: 10000 + player_id
-    season_player_id = 10000 + player_id
-    
-    # Prepare calldata for seed_season_player (all values must be in hex format)
-    calldata = [
-        hex(season_player_id),  # season_player_id
-        hex(SEASON_ID),  # season_id
-        hex(season_club_id),  # season_club_id
-        hex(player_id),  # overgoal_player_id
-    ]
-    
-    # Call sozo execute
-    # Format: sozo execute --world <WORLD> <CONTRACT> <ENTRYPOINT> <CALLDATA...>
-    cmd = [
-        'sozo', 'execute',
-        '--world', world_address,
-        admin_address,
-        'seed_season_player',
-        *calldata,
-        '--wait'
+    return [
+        season_player_id_of(player),  # season_player_id
+        SEASON_ID,  # season_id
+        season_club_id,  # season_club_id
+        player_id,  # overgoal_player_id
     ]
-    
+
+async def execute(client, admin_address, entrypoint, calldata):
+    """Send a single admin call, returns the tx hash or None on failure"""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n  ❌ Command: {' '.join(cmd)}")
-        print(f"  ❌ Stdout: {e.stdout}")
-        print(f"  ❌ Stderr: {e.stderr}")
-        return False
-
-def main():
-    print("🌱 Starting player seeding process...")
-    print("=" * 60)
-    
-    # Load players
-    players = load_players()
+        return await client.invoke(admin_address, entrypoint, calldata)
+    except TransactionError as e:
+        print(f"\n  ❌ {entrypoint}: {e}")
+        return None
+
+async def precheck(client, manifest, journal, players):
+    """Journal entities that already exist on-chain so they are skipped without a tx"""
+    semaphore = asyncio.Semaphore(PRECHECK_CONCURRENCY)
     
-    # Get contract addresses
-    world_address, admin_address = get_contract_addresses()
+    async def check(kind, entity_id):
+        async with semaphore:
+            exists = await record_exists(client, manifest, PRECHECK_RECORDS[kind], [entity_id])
+        return kind, entity_id, exists
     
-    print("\n" + "=" * 60)
-    print("STEP 1: Creating Universe and Overgoal Players")
-    print("=" * 60)
+    checks = []
+    for player in players:
+        if not journal.is_done('player', player['user_id']):
+            checks.append(check('player', player['user_id']))
+        if not journal.is_done('season_player', season_player_id_of(player)):
+            checks.append(check('season_player', season_player_id_of(player)))
     
-    # Seed all players (creates both Universe and Overgoal players)
-    success_count = 0
-    fail_count = 0
+    found = 0
+    for kind, entity_id, exists in await asyncio.gather(*checks):
+        if exists:
+            journal.record(kind, entity_id)
+            found += 1
+    return found
+
+def describe(entities):
+    """Short label for the entities created by one operation"""
+    ids = [entity_id for _, entity_id in entities]
+    if len(ids) == 1:
+        return f"{entities[0][0]} {ids[0]}"
+    return f"{len(ids)} entities (IDs {min(ids)}..{max(ids)})"
+
+def single_operations(journal, players):
+    """One seed_player / seed_season_player call per entity not yet journaled"""
+    operations = []
+    for player in players:
+        if not journal.is_done('player', player['user_id']):
+            operations.append(('seed_player', player_calldata(player), [('player', player['user_id'])]))
+    for player in players:
+        if not journal.is_done('season_player', season_player_id_of(player)):
+            operations.append((
+                'seed_season_player',
+                season_player_calldata(player),
+                [('season_player', season_player_id_of(player))],
+            ))
+    return operations
+
+def seed_batch_calldata(new_players, new_season_players):
+    """seed_players_batch calldata: Span<PlayerSeed> and Span<SeasonPlayerSeed> as length + flattened structs"""
+    calldata = [len(new_players)]
+    for player in new_players:
+        calldata.extend(player_calldata(player))
+    calldata.append(len(new_season_players))
+    for player in new_season_players:
+        calldata.extend(season_player_calldata(player))
+    return calldata
+
+def batched_operations(journal, players, batch_size):
+    """One seed_players_batch call per chunk; each chunk succeeds or fails as a unit"""
+    # Only players with something left to create take part in a chunk
+    pending = [
+        player for player in players
+        if not journal.is_done('player', player['user_id'])
+        or not journal.is_done('season_player', season_player_id_of(player))
+    ]
     
-    for i, player in enumerate(players, 1):
-        player_name = player.get('player_name', f"Player {player['user_id']}")
-        print(f"[{i}/{len(players)}] Seeding {player_name} (ID: {player['user_id']})...", end=" ")
+    operations = []
+    for i in range(0, len(pending), batch_size):
+        chunk = pending[i:i + batch_size]
+        new_players = [p for p in chunk if not journal.is_done('player', p['user_id'])]
+        new_season_players = [p for p in chunk if not journal.is_done('season_player', season_player_id_of(p))]
         
-        if seed_player(admin_address, world_address, player):
+        calldata = seed_batch_calldata(new_players, new_season_players)
+        entities = [('player', p['user_id']) for p in new_players]
+        entities += [('season_player', season_player_id_of(p)) for p in new_season_players]
+        operations.append(('seed_players_batch', calldata, entities))
+    return operations
+
+async def run_sequential(client, admin_address, journal, operations):
+    """Send operations one at a time, waiting for each; returns the failed operations"""
+    failed = []
+    for i, (entrypoint, calldata, entities) in enumerate(operations, 1):
+        print(f"[{i}/{len(operations)}] {entrypoint}: {describe(entities)}...", end=" ")
+        
+        tx_hash = await execute(client, admin_address, entrypoint, calldata)
+        if tx_hash is not None:
+            for kind, entity_id in entities:
+                journal.record(kind, entity_id, tx_hash)
             print("✅")
-            success_count += 1
         else:
             print("❌")
-            fail_count += 1
+            failed.append((entrypoint, entities, None))
+    return failed
+
+async def run_pipelined(clients, admin_address, journal, operations, window):
+    """Send operations sharded over `clients`, each keeping `window` transactions in flight; returns the failed operations"""
+    done_count = 0
     
-    print(f"\n✅ Players created: {success_count}/{len(players)}")
-    if fail_count > 0:
-        print(f"❌ Failed: {fail_count}")
+    def on_done(job):
+        nonlocal done_count
+        done_count += 1
+        entrypoint, _, entities = job.tag
+        if job.succeeded:
+            for kind, entity_id in entities:
+                journal.record(kind, entity_id, job.tx_hash)
+            print(f"[{done_count}/{len(operations)}] {entrypoint}: {describe(entities)} ✅")
+        else:
+            print(f"[{done_count}/{len(operations)}] {entrypoint}: {describe(entities)} ❌ {job.error}")
     
-    print("\n" + "=" * 60)
-    print("STEP 2: Creating Season Players")
-    print("=" * 60)
+    pipeline = ShardedPipeline(clients, window=window, on_done=on_done)
+    for operation in operations:
+        entrypoint, calldata, _ = operation
+        pipeline.submit([(admin_address, entrypoint, calldata)], tag=operation)
     
-    # Seed season players (only for players with team_id > 0)
-    season_success = 0
-    season_fail = 0
-    season_skip = 0
+    jobs = await pipeline.run()
     
-    for i, player in enumerate(players, 1):
-        player_name = player.get('player_name', f"Player {player['user_id']}")
-        team_id = player['team_id']
-        
-        print(f"[{i}/{len(players)}] Seeding season player for {player_name} (Team {team_id})...", end=" ")
+    elapsed = pipeline.stats.elapsed()
+    print(f"\n🚀 Sent {pipeline.stats.sent} transactions in {elapsed:.1f}s "
+          f"({pipeline.stats.sent / elapsed if elapsed else 0:.1f} tx/s), "
+          f"{pipeline.stats.retried} retries, {pipeline.stats.resyncs} nonce resyncs")
+    if len(clients) > 1:
+        for account_address, succeeded, failed in pipeline.shard_summary():
+            print(f"   👤 {account_address}: {succeeded} ✅  {failed} ❌")
+    return [(job.tag[0], job.tag[2], job.error) for job in jobs if not job.succeeded]
+
+# --------- Reconcile ---------
+
+async def read_chain_state(client, manifest, players):
+    """[(OvergoalPlayer | None, SeasonPlayer | None)] of each player, through the multi-get views"""
+    player_ids = [player['user_id'] for player in players]
+    season_player_ids = [season_player_id_of(player) for player in players]
+    starts = range(0, len(players), MULTI_GET_BATCH)
+    overgoal_chunks, season_chunks = await asyncio.gather(
+        asyncio.gather(*[read_overgoal_players(client, manifest, player_ids[i:i + MULTI_GET_BATCH]) for i in starts]),
+        asyncio.gather(*[read_season_players(client, manifest, season_player_ids[i:i + MULTI_GET_BATCH]) for i in starts]),
+    )
+    overgoal_players = [record for chunk in overgoal_chunks for record in chunk]
+    season_players = [record for chunk in season_chunks for record in chunk]
+    return list(zip(overgoal_players, season_players))
+
+def stat_of(overgoal_player, field):
+    """OvergoalPlayer attribute of a players.json field (`pass` is `pass_`)"""
+    return getattr(overgoal_player, 'pass_' if field == 'pass' else field)
+
+def reconcile_calls(players, state, game_address, admin_address, seed_batch):
+    """Calls that bring the chain to players.json as [(address, entrypoint, calldata, label)],
+    plus the differences no entrypoint can apply"""
+    calls, drift = [], []
+    new_players, new_season_players = [], []
+    for player, (overgoal_player, season_player) in zip(players, state):
+        player_id = player['user_id']
+        if overgoal_player is None:
+            new_players.append(player)
+        else:
+            changed = [field for field in STAT_FIELDS if stat_of(overgoal_player, field) != player[field]]
+            if changed:
+                calls.append((
+                    game_address,
+                    'update_overgoal_player_stats',
+                    [player_id, *[player[field] for field in STAT_FIELDS]],
+                    f"player {player_id}: {', '.join(changed)}",
+                ))
+            drift += [
+                f"player {player_id}: {field} {stat_of(overgoal_player, field)} on-chain, {player[field]} wanted"
+                for field in FIXED_FIELDS if stat_of(overgoal_player, field) != player[field]
+            ]
         
-        if seed_season_player(admin_address, world_address, player):
-            print("✅")
-            season_success += 1
+        season_club_id = season_player_calldata(player)[2]
+        if season_player is None:
+            new_season_players.append(player)
+        elif season_player.season_club_id != season_club_id:
+            calls.append((
+                admin_address,
+                'transfer_season_player',
+                [season_player.id, season_club_id],
+                f"season player {season_player.id}: club {season_player.season_club_id} → {season_club_id}",
+            ))
+    
+    # Creates go through seed_players_batch, players before their season players within each call
+    pending = new_players + [player for player in new_season_players if player not in new_players]
+    for i in range(0, len(pending), seed_batch):
+        chunk = pending[i:i + seed_batch]
+        chunk_players = [player for player in chunk if player in new_players]
+        chunk_season_players = [player for player in chunk if player in new_season_players]
+        calls.append((
+            admin_address,
+            'seed_players_batch',
+            seed_batch_calldata(chunk_players, chunk_season_players),
+            f"create {len(chunk_players)} players, {len(chunk_season_players)} season players",
+        ))
+    return calls, drift
+
+async def run_reconcile(clients, calls, calls_per_tx, window):
+    """Send the calls as multicalls of `calls_per_tx`; returns the labels of the failed calls"""
+    pipeline = ShardedPipeline(clients, window=window)
+    for i in range(0, len(calls), calls_per_tx):
+        chunk = calls[i:i + calls_per_tx]
+        pipeline.submit([(address, entrypoint, calldata) for address, entrypoint, calldata, _ in chunk],
+                        tag=[label for _, _, _, label in chunk])
+    jobs = await pipeline.run()
+    
+    failed = []
+    for job in jobs:
+        if job.succeeded:
+            print(f"   ✅ {len(job.tag)} calls ({hex(job.tx_hash)})")
         else:
-            print("❌")
-            season_fail += 1
+            print(f"   ❌ {len(job.tag)} calls: {job.error}")
+            failed += job.tag
+    return failed
+
+async def reconcile(client, manifest, admin_address, players, args):
+    """Diff players.json against the chain and send only the needed calls"""
+    game_address = manifest.contract_address('overgoal-overgoal_game')
     
-    print(f"\n✅ Season players created: {season_success}")
-    if season_fail > 0:
-        print(f"❌ Failed: {season_fail}")
+    print("🔍 Reading on-chain players and season players...")
+    state = await read_chain_state(client, manifest, players)
+    calls, drift = reconcile_calls(
+        players, state, game_address, admin_address, args.batch_size or RECONCILE_SEED_BATCH
+    )
+    
+    transactions = (len(calls) + args.calls_per_tx - 1) // args.calls_per_tx
+    print("\n" + "=" * 60)
+    print(f"Reconcile: {len(calls)} calls in {transactions} transactions")
+    print("=" * 60)
+    for _, entrypoint, _, label in calls:
+        print(f"   • {entrypoint}: {label}")
+    if drift:
+        print(f"\n⚠️  {len(drift)} differences can't be applied (no entrypoint updates them):")
+        for difference in drift:
+            print(f"   • {difference}")
+    
+    if not calls:
+        print("\n✅ Chain already matches players.json")
+        return
+    if args.dry_run:
+        print("\n💡 Dry run, nothing sent")
+        return
+    
+    clients = await shard_clients(client, args.accounts, args.accounts_file)
+    failed = await run_reconcile(clients, calls, args.calls_per_tx, args.window)
+    if failed:
+        print(f"\n❌ {len(failed)} calls failed, re-run --reconcile to retry them:")
+        for label in failed:
+            print(f"   • {label}")
+        sys.exit(1)
+    print(f"\n✅ Reconciled {len(calls)} calls")
+
+def print_report(players, operations, failed):
+    """Summary of one seeding run"""
+    created = {'player': 0, 'season_player': 0}
+    failed_entities = {entity for _, entities, _ in failed for entity in entities}
+    for _, _, entities in operations:
+        for entity in entities:
+            if entity not in failed_entities:
+                created[entity[0]] += 1
     
     print("\n" + "=" * 60)
     print("🎉 SEEDING COMPLETE!")
     print("=" * 60)
     print(f"Total players: {len(players)}")
-    print(f"Players created: {success_count}")
-    print(f"Season players created: {season_success}")
+    print(f"Transactions: {len(operations)}")
+    print(f"Players created: {created['player']}")
+    print(f"Season players created: {created['season_player']}")
+    
+    if failed:
+        print(f"\n❌ Failed transactions: {len(failed)}")
+        for entrypoint, entities, error in failed:
+            print(f"   {entrypoint}: {describe(entities)}" + (f" ({error})" if error else ""))
+
+async def main():
+    parser = argparse.ArgumentParser(description='Seed players from players.json')
+    parser.add_argument('--batch-size', type=int, default=0,
+                        help='Players per seed_players_batch transaction (default: one seed_player tx per player)')
+    parser.add_argument('--journal', type=Path, default=JOURNAL_PATH,
+                        help=f'Append-only journal of seeded entities (default: {JOURNAL_PATH})')
+    parser.add_argument('--no-precheck', action='store_true',
+                        help='Skip the on-chain existence pre-check and trust the journal only')
+    parser.add_argument('--window', type=int, default=1,
+                        help='Transactions kept in flight with a locally tracked nonce (default: 1, wait for each)')
+    parser.add_argument('--accounts', type=int, default=1,
+                        help='Shard transactions over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Shard transactions over the accounts in a JSON file ([{"address", "private_key"}, ...])')
+    parser.add_argument('--reconcile', action='store_true',
+                        help='Diff players.json against the chain and send only updates, transfers and creates')
+    parser.add_argument('--calls-per-tx', type=int, default=RECONCILE_CALLS_PER_TX,
+                        help=f'Calls per multicall transaction with --reconcile (default: {RECONCILE_CALLS_PER_TX})')
+    parser.add_argument('--dry-run', action='store_true', help='With --reconcile, print the calls without sending')
     
-    if fail_count > 0 or season_fail > 0:
-        print(f"\n⚠️  Some operations failed. Check the errors above.")
+    args = parser.parse_args()
+    
+    print("🌱 Starting player seeding process...")
+    print("=" * 60)
+    
+    # Load players
+    players = load_players()
+    
+    # Get contract addresses
+    manifest, admin_address = get_contract_addresses()
+    
+    # Resume from the journal of previous runs against this world
+    journal = Journal(args.journal, manifest.world_address)
+    resumed = journal.load()
+    if resumed:
+        print(f"📒 Resuming: {resumed} entities already in {args.journal}")
+    
+    async with StarknetClient.from_config() as client:
+        # Fail on bad rows before any transaction is sent (numpy is only needed from here)
+        from validate_roster import print_errors, season_club_ids_on_chain, validate_players
+        season_club_ids = await season_club_ids_on_chain(client, manifest, SEASON_ID)
+        errors = validate_players(players, season_club_ids)
+        if errors:
+            print_errors(errors, PLAYERS_JSON_PATH)
+            sys.exit(1)
+        print(f"✅ {len(players)} players pass validation")
+        
+        if args.reconcile:
+            await reconcile(client, manifest, admin_address, players, args)
+            return
+        
+        if not args.no_precheck:
+            print("🔍 Checking which players already exist on-chain...")
+            found = await precheck(client, manifest, journal, players)
+            print(f"✅ Found {found} already-seeded entities")
+        
+        if args.batch_size > 0:
+            operations = batched_operations(journal, players, args.batch_size)
+        else:
+            operations = single_operations(journal, players)
+        
+        print("\n" + "=" * 60)
+        print(f"Seeding: {len(operations)} transactions to send")
+        print("=" * 60)
+        
+        clients = await shard_clients(client, args.accounts, args.accounts_file)
+        if len(clients) > 1:
+            print(f"👥 Sharding over {len(clients)} accounts")
+        
+        if args.window > 1 or len(clients) > 1:
+            failed = await run_pipelined(clients, admin_address, journal, operations, args.window)
+        else:
+            failed = await run_sequential(client, admin_address, journal, operations)
+    
+    print_report(players, operations, failed)
+    
+    if failed:
+        print(f"\n⚠️  Some operations failed. Check the errors above and re-run to resume.")
         sys.exit(1)
     
     print(f"\n✅ All done! Run './scripts/verify_players.py' to verify the data.")
 
 if __name__ == '__main__':
-    main()
-
+    asyncio.run(main())
@@ -47,4 +47,5 @@ echo ""
 echo "  - 4 SeasonClub entries created (IDs: 101-104)"
 echo ""
 echo "💡 Run './scripts/verify_season_1.sh' to verify the data"
+echo "💡 Run './scripts/schedule_fixtures.py --season-id 1' to build the calendar"
 
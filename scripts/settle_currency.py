@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Apply a currency settlement (match rewards, shop purchases, ...) through
+overgoal_game.apply_currency_deltas.
+
+The settlement file lists signed amounts per OvergoalPlayer, in any order
+and with any number of lines per player:
+- CSV (header required): player_id,amount[,reason]
+- JSON: [{"player_id": 1, "amount": 250}, ...] (or one object per line, JSONL)
+
+Lines are netted per player first, so each player appears in exactly one
+apply_currency_deltas call, and the resulting balances are checked against
+the chain (one get_overgoal_players read per MULTI_GET_BATCH players): if a
+player is missing or would go negative, nothing is sent. The deltas are then
+sent in batches of --deltas-per-tx through the transaction pipeline
+(--window, --accounts); each batch is atomic on-chain.
+
+Every batch outcome is appended to the settlement log as one JSON line, with
+the settlement id (a hash of the netted deltas, or --settlement-id) and the
+players of the batch. Players in a succeeded batch of the same settlement are
+skipped, so re-running a file (e.g. after a batch reverted) only sends and
+checks the players not paid yet, never pays anyone twice. A file that really
+has to be applied again needs a new --settlement-id.
+
+Usage:
+    ./scripts/settle_currency.py payouts_matchday_3.csv
+    ./scripts/settle_currency.py shop.jsonl --deltas-per-tx 100 --dry-run
+    ./scripts/settle_currency.py payouts_matchday_3.csv --settlement-id md3-replay
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from manifest import load_manifest
+from models import MULTI_GET_BATCH, read_overgoal_players
+from starknet_client import StarknetClient, to_felt
+from tx_pipeline import DEFAULT_WINDOW, ShardedPipeline, shard_clients
+
+# Configuration
+SETTLEMENT_LOG_PATH = Path(__file__).parent / "settlement_log.jsonl"
+DEFAULT_DELTAS_PER_TX = 200             # Each delta costs a read and a write of one OvergoalPlayer
+I128_MIN, I128_MAX = -2**127, 2**127 - 1
+
+class InvalidSettlement(Exception):
+    """A settlement line that can't be applied"""
+
+# --------- Input ---------
+
+def read_lines(path):
+    """(line number, player_id, amount) of every settlement line"""
+    path = Path(path)
+    with open(path, 'r') as f:
+        if path.suffix == '.csv':
+            rows = list(csv.DictReader(f))
+        elif path.suffix == '.jsonl':
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = json.load(f)
+    
+    lines = []
+    for number, row in enumerate(rows, start=1):
+        try:
+            player_id, amount = int(row['player_id']), int(row['amount'])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidSettlement(f"line {number}: player_id and amount must be integers ({row})")
+        if player_id <= 0:
+            raise InvalidSettlement(f"line {number}: invalid player_id {player_id}")
+        lines.append((number, player_id, amount))
+    return lines
+
+def net_deltas(lines):
+    """{player_id: net amount} in order of first appearance, players netting to 0 dropped"""
+    net = {}
+    for _, player_id, amount in lines:
+        net[player_id] = net.get(player_id, 0) + amount
+    for player_id, amount in net.items():
+        if not I128_MIN <= amount <= I128_MAX:
+            raise InvalidSettlement(f"player {player_id}: net amount {amount} doesn't fit an i128")
+    return {player_id: amount for player_id, amount in net.items() if amount != 0}
+
+def settlement_id(net):
+    """Id of a settlement: hash of its netted deltas, so the same payouts always get the same id"""
+    content = json.dumps(sorted(net.items()))
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+# --------- Settlement log ---------
+
+def settled_player_ids(path, settlement):
+    """Players of the succeeded batches of a settlement in the settlement log"""
+    settled = set()
+    if Path(path).exists():
+        with open(path, 'r') as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get('settlement') == settlement and entry.get('status') == 'succeeded':
+                    settled.update(entry.get('player_ids', []))
+    return settled
+
+class SettlementLog:
+    """Append-only JSONL log of batch outcomes"""
+    
+    def __init__(self, path, settlement):
+        self.file = open(path, 'a')
+        self.settlement = settlement
+    
+    def write_batch(self, job):
+        number, batch = job.tag
+        self.file.write(json.dumps({
+            'settlement': self.settlement,
+            'batch': number,
+            'status': job.status,
+            'tx_hash': hex(job.tx_hash) if job.tx_hash is not None else None,
+            'attempts': job.attempts,
+            'error': job.error,
+            'player_ids': [player_id for player_id, _ in batch],
+            'amounts': [amount for _, amount in batch],
+        }) + '\n')
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+
+# --------- Checks ---------
+
+async def check_balances(client, manifest, net):
+    """Problems of the settlement against the current balances (empty when it can be applied)"""
+    player_ids = list(net)
+    chunks = await asyncio.gather(*[
+        read_overgoal_players(client, manifest, player_ids[i:i + MULTI_GET_BATCH])
+        for i in range(0, len(player_ids), MULTI_GET_BATCH)
+    ])
+    players = [player for chunk in chunks for player in chunk]
+    
+    problems = []
+    for player_id, player in zip(player_ids, players):
+        if player is None:
+            problems.append(f"player {player_id} doesn't exist")
+        elif player.goal_currency + net[player_id] < 0:
+            problems.append(
+                f"player {player_id}: balance {player.goal_currency}, net {net[player_id]} (insufficient currency)"
+            )
+    return problems
+
+def delta_calldata(deltas):
+    """apply_currency_deltas calldata: Span<(felt252, i128)> as length + flattened pairs"""
+    calldata = [len(deltas)]
+    for player_id, amount in deltas:
+        calldata.extend([player_id, to_felt(amount)])
+    return calldata
+
+# --------- Main ---------
+
+async def settle(args):
+    try:
+        net = net_deltas(read_lines(args.file))
+    except InvalidSettlement as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    settlement = args.settlement_id or settlement_id(net)
+    settled = settled_player_ids(args.log, settlement)
+    print(f"🔖 Settlement {settlement}")
+    if settled:
+        print(f"♻️  {len(settled)} players already settled (skipped)")
+    net = {player_id: amount for player_id, amount in net.items() if player_id not in settled}
+    
+    deltas = list(net.items())
+    batches = [deltas[i:i + args.deltas_per_tx] for i in range(0, len(deltas), args.deltas_per_tx)]
+    credited = sum(amount for _, amount in deltas if amount > 0)
+    debited = -sum(amount for _, amount in deltas if amount < 0)
+    print(f"📒 {len(deltas)} players: +{credited} / -{debited} in {len(batches)} transactions")
+    if not deltas:
+        print("✅ Nothing to apply")
+        return
+    
+    manifest = load_manifest()
+    game_address = manifest.contract_address('overgoal-overgoal_game')
+    
+    async with StarknetClient.from_config() as client:
+        problems = await check_balances(client, manifest, net)
+        if problems:
+            print(f"❌ {len(problems)} problems, nothing was sent:")
+            for problem in problems:
+                print(f"   • {problem}")
+            sys.exit(1)
+        print("✅ Balances checked")
+        
+        if args.dry_run:
+            print("💡 Dry run, nothing sent")
+            return
+        
+        clients = await shard_clients(client, args.accounts, args.accounts_file)
+        log = SettlementLog(args.log, settlement)
+        try:
+            # Logged as each batch settles, so an interrupted run still records what landed
+            pipeline = ShardedPipeline(clients, window=args.window, on_done=log.write_batch)
+            for number, batch in enumerate(batches):
+                pipeline.submit(
+                    [(game_address, 'apply_currency_deltas', delta_calldata(batch))], tag=(number, batch)
+                )
+            jobs = await pipeline.run()
+        finally:
+            log.close()
+    
+    failed = [job for job in jobs if not job.succeeded]
+    for job in jobs:
+        number, batch = job.tag
+        if job.succeeded:
+            print(f"   ✅ Batch {number}: {len(batch)} players ({hex(job.tx_hash)})")
+        else:
+            print(f"   ❌ Batch {number}: {len(batch)} players: {job.error}")
+    
+    print("\n" + "=" * 60)
+    print(f"✅ Players settled: {sum(len(job.tag[1]) for job in jobs if job.succeeded)}")
+    print(f"❌ Players in failed batches: {sum(len(job.tag[1]) for job in failed)}")
+    print(f"📒 Settlement log: {args.log}")
+    print("=" * 60)
+    if failed:
+        sys.exit(1)
+
+async def main():
+    parser = argparse.ArgumentParser(description='Apply a currency settlement file through apply_currency_deltas')
+    parser.add_argument('file', help='Settlement file (.csv, .json or .jsonl)')
+    parser.add_argument('--deltas-per-tx', type=int, default=DEFAULT_DELTAS_PER_TX,
+                        help=f'Players per apply_currency_deltas call (default: {DEFAULT_DELTAS_PER_TX})')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW,
+                        help=f'Transactions kept in flight per account (default: {DEFAULT_WINDOW})')
+    parser.add_argument('--accounts', type=int, default=1,
+                        help='Shard batches over the first N katana prefunded accounts')
+    parser.add_argument('--accounts-file',
+                        help='Shard batches over the accounts in a JSON file ([{"address", "private_key"}, ...])')
+    parser.add_argument('--dry-run', action='store_true', help='Check the settlement without sending it')
+    parser.add_argument('--log', type=Path, default=SETTLEMENT_LOG_PATH,
+                        help=f'JSONL log of applied batches (default: {SETTLEMENT_LOG_PATH})')
+    parser.add_argument('--settlement-id',
+                        help='Settlement id to log batches under (default: a hash of the netted deltas)')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"CURRENCY SETTLEMENT: {args.file}")
+    print("=" * 60)
+    
+    await settle(args)
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -7,30 +7,23 @@ Setup test data for assign_player_to_club testing:
 - 1 season
 """
 
-import json
-import subprocess
+import asyncio
 import sys
-from pathlib import Path
+
+from manifest import load_manifest, load_universe_manifest
+from starknet_client import StarknetClient, TransactionError
 
 def get_contract_addresses():
     """Get contract addresses from manifests"""
     print("📍 Reading contract addresses...")
     
     # Overgoal
-    with open('manifest_dev.json', 'r') as f:
-        manifest = json.load(f)
-    overgoal_world = manifest['world']['address']
-    admin_address = None
-    for contract in manifest['contracts']:
-        if contract['tag'] == 'overgoal-admin':
-            admin_address = contract['address']
-            break
+    manifest = load_manifest()
+    overgoal_world = manifest.world_address
+    admin_address = manifest.contract_address('overgoal-admin')
     
     # Universe
-    universe_manifest_path = Path(__file__).parent.parent.parent / "universe" / "manifest_dev.json"
-    with open(universe_manifest_path, 'r') as f:
-        universe_manifest = json.load(f)
-    universe_world = universe_manifest['world']['address']
+    universe_world = load_universe_manifest().world_address
     
     print(f"  Overgoal World: {overgoal_world}")
     print(f"  Admin Contract: {admin_address}")
@@ -38,101 +31,80 @@ def get_contract_addresses():
     
     return overgoal_world, admin_address, universe_world
 
-def create_season():
+async def create_season(client, admin_address):
     """Create Season 1"""
     print("\n🌱 Creating Season 1...")
-    overgoal_world, admin_address, _ = get_contract_addresses()
-    
-    cmd = [
-        'sozo', 'execute',
-        '--world', overgoal_world,
-        admin_address,
-        'seed_season_1',
-        '--wait'
-    ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        await client.invoke(admin_address, 'seed_season_1', [])
         print("  ✅ Season 1 created (ID: 1)")
         print("  ✅ 4 Clubs created (IDs: 1, 2, 3, 4)")
         print("  ✅ 4 Season Clubs created (IDs: 101, 102, 103, 104)")
         return True
-    except subprocess.CalledProcessError as e:
+    except TransactionError as e:
         print(f"  ❌ Error creating season")
-        print(f"     Stdout: {e.stdout}")
-        print(f"     Stderr: {e.stderr}")
-        print(f"     Command: {' '.join(cmd)}")
+        print(f"     {e}")
         return False
 
-def create_player(player_id, user_id):
+async def create_player(client, admin_address, player_id, user_id):
     """Create a player (Universe + Overgoal)"""
-    overgoal_world, admin_address, _ = get_contract_addresses()
-    
     # Player data
     calldata = [
-        hex(player_id),
-        hex(user_id),
+        player_id,
+        user_id,
         # Universe attributes
-        hex(0),  # body_type
-        hex(0),  # skin_color
-        hex(1),  # beard_type
-        hex(0),  # hair_type
-        hex(0),  # hair_color
+        0,  # body_type
+        0,  # skin_color
+        1,  # beard_type
+        0,  # hair_type
+        0,  # hair_color
         # Overgoal attributes
-        hex(50),  # energy
-        hex(50),  # speed
-        hex(50),  # leadership
-        hex(50),  # pass
-        hex(50),  # shoot
-        hex(50),  # freekick
-        hex(0),   # visor_type
-        hex(0),   # visor_color
-    ]
-    
-    cmd = [
-        'sozo', 'execute',
-        '--world', overgoal_world,
-        admin_address,
-        'seed_player',
-        *calldata,
-        '--wait'
+        50,  # energy
+        50,  # speed
+        50,  # leadership
+        50,  # pass
+        50,  # shoot
+        50,  # freekick
+        0,   # visor_type
+        0,   # visor_color
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        await client.invoke(admin_address, 'seed_player', calldata)
         return True
-    except subprocess.CalledProcessError as e:
+    except TransactionError as e:
         print(f"  ❌ Error creating player {player_id}")
-        print(f"     Stdout: {e.stdout}")
-        print(f"     Stderr: {e.stderr}")
-        print(f"     Command: {' '.join(cmd)}")
+        print(f"     {e}")
         return False
 
-def main():
+async def main():
     print("=" * 70)
     print("SETUP TEST DATA FOR assign_player_to_club")
     print("=" * 70)
     
-    # Step 1: Create Season 1 (includes 4 clubs and 4 season clubs)
-    if not create_season():
-        print("\n❌ Failed to create season")
-        sys.exit(1)
-    
-    # Step 2: Create 3 players
-    print("\n🌱 Creating 3 players...")
-    players = [
-        (1, 1),  # Player 1, temporary user_id = 1
-        (2, 2),  # Player 2, temporary user_id = 2
-        (3, 3),  # Player 3, temporary user_id = 3
-    ]
+    _, admin_address, _ = get_contract_addresses()
     
-    for player_id, user_id in players:
-        print(f"  Creating Player {player_id}...", end=" ")
-        if create_player(player_id, user_id):
-            print("✅")
-        else:
-            print("❌")
+    async with StarknetClient.from_config() as client:
+        # Step 1: Create Season 1 (includes 4 clubs and 4 season clubs)
+        if not await create_season(client, admin_address):
+            print("\n❌ Failed to create season")
             sys.exit(1)
+        
+        # Step 2: Create 3 players
+        print("\n🌱 Creating 3 players...")
+        players = [
+            (1, 1),  # Player 1, temporary user_id = 1
+            (2, 2),  # Player 2, temporary user_id = 2
+            (3, 3),  # Player 3, temporary user_id = 3
+        ]
+        
+        for player_id, user_id in players:
+            print(f"  Creating Player {player_id}...", end=" ")
+            if await create_player(client, admin_address, player_id, user_id):
+                print("✅")
+            else:
+                print("❌")
+                sys.exit(1)
     
     # Summary
     print("\n" + "=" * 70)
@@ -148,5 +120,4 @@ def main():
     print("   Example: python3 scripts/assign_player.py --player-id 1 --user-id 100 --club-id 1")
 
 if __name__ == '__main__':
-    main()
-
+    asyncio.run(main())
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Offline match simulator for balancing the OvergoalPlayer and SeasonClub
+attributes.
+
+A league (clubs, their offense/defense/intensity/chemistry, and each club's
+players with energy/speed/leadership/pass/shoot/freekick) is loaded from
+players.json or from the world (admin.get_season_snapshot) into NumPy
+arrays. Thousands of seasons of a double round-robin are then simulated at
+once with a seeded RNG:
+- each club gets an attack and a defense rating from its players' attributes
+  (scaled by energy) and its own club attributes;
+- goals are Poisson draws whose rate grows with attack - defense, with a
+  home advantage;
+- a club's goals are credited to its players in proportion to shoot,
+  freekick and energy: per season, one multinomial draw over the club's
+  season goals (memory stays O(seasons x players), so thousands of seasons
+  of a full league fit), and per match only for the season --results-out
+  exports.
+
+Clubs earn 3 points per win and 1 per draw (as record_match does). A player
+earns PLAYER_POINTS_PER_GOAL per goal credited and PLAYER_POINTS_PER_WIN per
+win of its club.
+
+The report shows mean standings, title odds, the points distribution of each
+club and the players with the most season points. --results-out writes one
+simulated season in the JSONL format ingest_results.py accepts (player
+entries also name their season_club_id, for standings.py --results).
+
+Usage:
+    ./scripts/simulate_season.py --seasons 10000 --seed 7
+    ./scripts/simulate_season.py --from-world --season-id 1 --results-out season.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("❌ numpy is required: pip install numpy")
+    sys.exit(1)
+
+# Configuration
+PLAYERS_JSON_PATH = Path(__file__).parent.parent.parent / "docs" / "players.json"
+DEFAULT_SEASONS = 1000
+DEFAULT_CLUB_ATTRIBUTES = (50, 50, 50, 50)  # offense, defense, intensity, chemistry
+
+# Match model (tuning knobs)
+BASE_GOALS = 1.3                        # Goals per side when attack == defense
+RATING_SCALE = 40.0                     # Rating difference that multiplies the goal rate by e
+HOME_ADVANTAGE = 1.1
+
+# Points (MATCH_WIN_POINTS / MATCH_DRAW_POINTS in src/constants.cairo)
+WIN_POINTS = 3
+DRAW_POINTS = 1
+PLAYER_POINTS_PER_GOAL = 1
+PLAYER_POINTS_PER_WIN = 1
+
+# Relationship changes written to the exported results
+FANS_CHANGE_WIN = 2
+FANS_CHANGE_LOSS = -2
+
+PLAYER_ATTRIBUTES = ('energy', 'speed', 'leadership', 'pass', 'shoot', 'freekick')
+ENERGY, SPEED, LEADERSHIP, PASS, SHOOT, FREEKICK = range(len(PLAYER_ATTRIBUTES))
+OFFENSE, DEFENSE, INTENSITY, CHEMISTRY = range(4)
+
+@dataclass
+class League:
+    """Clubs and players of a season as arrays"""
+    season_id: int
+    season_club_ids: np.ndarray         # (C,) season club ids
+    club_attributes: np.ndarray         # (C, 4) offense, defense, intensity, chemistry
+    season_player_ids: np.ndarray       # (N,) season player ids
+    player_club: np.ndarray             # (N,) index of each player's club
+    player_attributes: np.ndarray       # (N, 6) PLAYER_ATTRIBUTES
+
+@dataclass
+class SimulationResult:
+    """Outcome of `seasons` simulated seasons"""
+    fixtures: np.ndarray                # (M, 2) home / away club index of each match
+    matchdays: np.ndarray               # (M,) matchday of each match
+    home_goals: np.ndarray              # (S, M)
+    away_goals: np.ndarray              # (S, M)
+    club_points: np.ndarray             # (S, C)
+    player_goals: np.ndarray            # (S, N) goals credited to each player over each season
+    player_points: np.ndarray           # (S, N)
+    export_season: int | None = None    # Season whose scorers are drawn per match
+    match_player_goals: np.ndarray | None = None    # (M, N) goals of each player in each match of export_season
+
+# --------- Loading ---------
+
+def load_players_json(path=PLAYERS_JSON_PATH, season_id=1, club_attributes=DEFAULT_CLUB_ATTRIBUTES):
+    """League from players.json (team_id 0-3 -> season club 101-104, player -> season player 10000 + user_id)"""
+    with open(path, 'r') as f:
+        players = json.load(f)
+    
+    season_club_ids = np.array(sorted({101 + player['team_id'] for player in players}))
+    club_index = {season_club_id: index for index, season_club_id in enumerate(season_club_ids)}
+    return League(
+        season_id=season_id,
+        season_club_ids=season_club_ids,
+        club_attributes=np.tile(np.array(club_attributes, dtype=float), (len(season_club_ids), 1)),
+        season_player_ids=np.array([10000 + player['user_id'] for player in players]),
+        player_club=np.array([club_index[101 + player['team_id']] for player in players]),
+        player_attributes=np.array(
+            [[player[name] for name in PLAYER_ATTRIBUTES] for player in players], dtype=float
+        ),
+    )
+
+async def load_world(season_id):
+    """League from the world through admin.get_season_snapshot"""
+    from manifest import load_manifest
+    from models import read_season_snapshot
+    from starknet_client import StarknetClient
+    
+    async with StarknetClient.from_config() as client:
+        snapshot = await read_season_snapshot(client, load_manifest(), season_id)
+    
+    season_clubs = [season_club for season_club, _ in snapshot.season_clubs]
+    club_index = {season_club.id: index for index, season_club in enumerate(season_clubs)}
+    players = [
+        (season_player, overgoal_player) for season_player, overgoal_player in snapshot.season_players
+        if season_player.season_club_id in club_index
+    ]
+    return League(
+        season_id=season_id,
+        season_club_ids=np.array([season_club.id for season_club in season_clubs]),
+        club_attributes=np.array(
+            [[club.offense, club.defense, club.intensity, club.chemistry] for club in season_clubs], dtype=float
+        ),
+        season_player_ids=np.array([season_player.id for season_player, _ in players]),
+        player_club=np.array([club_index[season_player.season_club_id] for season_player, _ in players]),
+        player_attributes=np.array(
+            [
+                [player.energy, player.speed, player.leadership, player.pass_, player.shoot, player.freekick]
+                for _, player in players
+            ],
+            dtype=float,
+        ),
+    )
+
+# --------- Fixtures ---------
+
+def pairings(club_count, matchday):
+    """(home, away) club indices of a matchday, as FixtureScheduleTrait::pairings computes them on chain"""
+    slots = club_count + club_count % 2
+    rounds = slots - 1
+    round_ = matchday % rounds
+    pairs = []
+    for i in range(slots // 2):
+        if i == 0:
+            home, away = round_, rounds
+            # Alternate the fixed slot so it doesn't play every first-half match at home
+            if round_ % 2 == 1:
+                home, away = away, home
+        else:
+            home, away = (round_ + i) % rounds, (round_ + rounds - i) % rounds
+        if matchday >= rounds:
+            home, away = away, home
+        # A club drawn against the bye slot of an odd club count rests
+        if home < club_count and away < club_count:
+            pairs.append((home, away))
+    return pairs
+
+def round_robin(club_count):
+    """Double round-robin of the on-chain schedule: [(matchday, home, away), ...] over club indices"""
+    matchday_count = 2 * (club_count + club_count % 2 - 1)
+    return [
+        (matchday, home, away)
+        for matchday in range(matchday_count)
+        for home, away in pairings(club_count, matchday)
+    ]
+
+# --------- Simulation ---------
+
+def club_ratings(league):
+    """(attack, defense) rating of each club, from its players (scaled by energy) and club attributes"""
+    attributes = league.player_attributes
+    fitness = attributes[:, ENERGY] / 100
+    player_attack = fitness * (
+        0.35 * attributes[:, SHOOT] + 0.25 * attributes[:, PASS]
+        + 0.2 * attributes[:, SPEED] + 0.2 * attributes[:, FREEKICK]
+    )
+    player_defense = fitness * (0.5 * attributes[:, SPEED] + 0.5 * attributes[:, LEADERSHIP])
+    
+    club_count = len(league.season_club_ids)
+    squad_size = np.maximum(np.bincount(league.player_club, minlength=club_count), 1)
+    squad_attack = np.bincount(league.player_club, weights=player_attack, minlength=club_count) / squad_size
+    squad_defense = np.bincount(league.player_club, weights=player_defense, minlength=club_count) / squad_size
+    
+    clubs = league.club_attributes
+    teamwork = 0.5 * clubs[:, INTENSITY] + 0.5 * clubs[:, CHEMISTRY]
+    attack = 0.6 * squad_attack + 0.25 * clubs[:, OFFENSE] + 0.15 * teamwork
+    defense = 0.6 * squad_defense + 0.25 * clubs[:, DEFENSE] + 0.15 * teamwork
+    return attack, defense
+
+def scorer_weights(league):
+    """Probability of each player scoring a goal of its club"""
+    attributes = league.player_attributes
+    weights = (attributes[:, SHOOT] + 0.5 * attributes[:, FREEKICK]) * attributes[:, ENERGY] / 100 + 1e-9
+    totals = np.bincount(league.player_club, weights=weights, minlength=len(league.season_club_ids))
+    return weights / totals[league.player_club]
+
+def simulate(league, seasons, seed=0, export_season=None):
+    """Simulate `seasons` double round-robin seasons at once (per-match scorers for `export_season` only)"""
+    rng = np.random.default_rng(seed)
+    schedule = np.array(round_robin(len(league.season_club_ids)))
+    matchdays, fixtures = schedule[:, 0], schedule[:, 1:]
+    home, away = fixtures[:, 0], fixtures[:, 1]
+    club_count = len(league.season_club_ids)
+    player_count = len(league.season_player_ids)
+    
+    # Goals: (S, M) Poisson draws, rates depend only on the fixture
+    attack, defense = club_ratings(league)
+    home_rate = BASE_GOALS * HOME_ADVANTAGE * np.exp((attack[home] - defense[away]) / RATING_SCALE)
+    away_rate = BASE_GOALS * np.exp((attack[away] - defense[home]) / RATING_SCALE)
+    home_goals = rng.poisson(home_rate, size=(seasons, len(fixtures)))
+    away_goals = rng.poisson(away_rate, size=(seasons, len(fixtures)))
+    
+    # Club points
+    home_won = home_goals > away_goals
+    away_won = away_goals > home_goals
+    drawn = home_goals == away_goals
+    home_points = np.where(home_won, WIN_POINTS, np.where(drawn, DRAW_POINTS, 0))
+    away_points = np.where(away_won, WIN_POINTS, np.where(drawn, DRAW_POINTS, 0))
+    club_points = np.zeros((seasons, club_count), dtype=np.int64)
+    np.add.at(club_points, (slice(None), home), home_points)
+    np.add.at(club_points, (slice(None), away), away_points)
+    
+    # Goals credited to players: per club, one multinomial over each season's goals of the club
+    # (the sum of per-match draws has the same distribution), per match for the exported season only
+    weights = scorer_weights(league)
+    club_goals = np.zeros((seasons, club_count), dtype=np.int64)
+    np.add.at(club_goals, (slice(None), home), home_goals)
+    np.add.at(club_goals, (slice(None), away), away_goals)
+    club_wins = np.zeros((seasons, club_count), dtype=np.int64)
+    np.add.at(club_wins, (slice(None), home), home_won)
+    np.add.at(club_wins, (slice(None), away), away_won)
+    
+    player_goals = np.zeros((seasons, player_count), dtype=np.int64)
+    match_player_goals = None
+    if export_season is not None:
+        match_player_goals = np.zeros((len(fixtures), player_count), dtype=np.int64)
+    for club in range(club_count):
+        members = np.flatnonzero(league.player_club == club)
+        if len(members) == 0:
+            continue
+        player_goals[:, members] = rng.multinomial(club_goals[:, club], weights[members])
+        if match_player_goals is not None:
+            goals = (
+                np.where(home == club, home_goals[export_season], 0)
+                + np.where(away == club, away_goals[export_season], 0)
+            )
+            match_player_goals[:, members] = rng.multinomial(goals, weights[members])
+    if match_player_goals is not None:
+        # Keep the exported season's totals consistent with its matches
+        player_goals[export_season] = match_player_goals.sum(axis=0)
+    
+    player_points = (
+        PLAYER_POINTS_PER_GOAL * player_goals
+        + PLAYER_POINTS_PER_WIN * club_wins[:, league.player_club]
+    )
+    return SimulationResult(
+        fixtures=fixtures,
+        matchdays=matchdays,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        club_points=club_points,
+        player_goals=player_goals,
+        player_points=player_points,
+        export_season=export_season,
+        match_player_goals=match_player_goals,
+    )
+
+# --------- Output ---------
+
+def standings(result, seed=0):
+    """(S, C) final position of each club (0 = champion), ties broken at random"""
+    rng = np.random.default_rng(seed)
+    tie_break = rng.random(result.club_points.shape)
+    order = np.lexsort((tie_break, -result.club_points), axis=1)
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(order.shape[1])[None, :], axis=1)
+    return positions
+
+def export_results(league, result, path, seed):
+    """Write the exported simulated season as ingest_results.py JSONL (matches in matchday order)"""
+    season = result.export_season
+    with open(path, 'w') as f:
+        for match in range(len(result.fixtures)):
+            home, away = result.fixtures[match]
+            home_goals = int(result.home_goals[season, match])
+            away_goals = int(result.away_goals[season, match])
+            players = []
+            for side, goals, against in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+                won = goals > against
+                fans = FANS_CHANGE_WIN if won else FANS_CHANGE_LOSS if goals < against else 0
+                for player in np.flatnonzero(league.player_club == side):
+                    points = (
+                        PLAYER_POINTS_PER_GOAL * int(result.match_player_goals[match, player])
+                        + (PLAYER_POINTS_PER_WIN if won else 0)
+                    )
+                    players.append({
+                        'season_player_id': int(league.season_player_ids[player]),
+                        'season_club_id': int(league.season_club_ids[side]),
+                        'points': points,
+                        'team': 0,
+                        'fans': fans,
+                    })
+            f.write(json.dumps({
+                'match_id': f"sim-{seed}-s{season}-md{int(result.matchdays[match]) + 1}-{match}",
+                'season_id': league.season_id,
+                'home': int(league.season_club_ids[home]),
+                'away': int(league.season_club_ids[away]),
+                'home_goals': home_goals,
+                'away_goals': away_goals,
+                'players': players,
+            }) + '\n')
+
+def print_report(league, result, positions, top_players):
+    seasons, club_count = result.club_points.shape
+    print("\n" + "=" * 80)
+    print(f"STANDINGS ({seasons} seasons, {len(result.fixtures)} matches each)")
+    print("=" * 80)
+    print(f"{'Club':>6} {'Mean pts':>9} {'Std':>6} {'p5':>5} {'p50':>5} {'p95':>5} {'Title %':>8} {'Mean pos':>9}")
+    
+    mean_points = result.club_points.mean(axis=0)
+    for club in np.argsort(-mean_points):
+        points = result.club_points[:, club]
+        p5, p50, p95 = np.percentile(points, [5, 50, 95])
+        print(f"{int(league.season_club_ids[club]):>6} {mean_points[club]:>9.2f} {points.std():>6.2f} "
+              f"{p5:>5.0f} {p50:>5.0f} {p95:>5.0f} {100 * (positions[:, club] == 0).mean():>7.1f}% "
+              f"{positions[:, club].mean() + 1:>9.2f}")
+    
+    goals = result.home_goals + result.away_goals
+    print(f"\n⚽ Goals per match: {goals.mean():.2f}   "
+          f"Home wins: {100 * (result.home_goals > result.away_goals).mean():.1f}%   "
+          f"Draws: {100 * (result.home_goals == result.away_goals).mean():.1f}%")
+    
+    print("\n" + "=" * 80)
+    print(f"TOP {top_players} PLAYERS BY MEAN SEASON POINTS")
+    print("=" * 80)
+    mean_player_points = result.player_points.mean(axis=0)
+    for player in np.argsort(-mean_player_points)[:top_players]:
+        attributes = ", ".join(
+            f"{name} {int(value)}" for name, value in zip(PLAYER_ATTRIBUTES, league.player_attributes[player])
+        )
+        print(f"  {int(league.season_player_ids[player]):>6} (club {int(league.season_club_ids[league.player_club[player]])}): "
+              f"{mean_player_points[player]:6.2f} pts  [{attributes}]")
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate seasons offline from player and club attributes')
+    parser.add_argument('--seasons', type=int, default=DEFAULT_SEASONS,
+                        help=f'Seasons to simulate (default: {DEFAULT_SEASONS})')
+    parser.add_argument('--seed', type=int, default=0, help='RNG seed (default: 0)')
+    parser.add_argument('--players', type=Path, default=PLAYERS_JSON_PATH,
+                        help=f'players.json to load (default: {PLAYERS_JSON_PATH})')
+    parser.add_argument('--from-world', action='store_true', help='Load the league from the world instead')
+    parser.add_argument('--season-id', type=int, default=1, help='Season to load or export (default: 1)')
+    parser.add_argument('--club-attributes', default=','.join(map(str, DEFAULT_CLUB_ATTRIBUTES)),
+                        help='offense,defense,intensity,chemistry of every club with --players (default: 50,50,50,50)')
+    parser.add_argument('--top', type=int, default=10, help='Players to list (default: 10)')
+    parser.add_argument('--results-out', type=Path, help='Write one simulated season as ingest_results.py JSONL')
+    parser.add_argument('--export-season', type=int, default=0,
+                        help='Which simulated season --results-out writes (default: 0)')
+    
+    args = parser.parse_args()
+    
+    if args.from_world:
+        league = asyncio.run(load_world(args.season_id))
+    else:
+        club_attributes = tuple(int(value) for value in args.club_attributes.split(','))
+        league = load_players_json(args.players, args.season_id, club_attributes)
+    
+    print("=" * 80)
+    print("SEASON SIMULATOR")
+    print("=" * 80)
+    print(f"🏟️  {len(league.season_club_ids)} clubs, {len(league.season_player_ids)} players, "
+          f"{args.seasons} seasons (seed {args.seed})")
+    
+    if len(league.season_club_ids) < 2:
+        print("❌ At least 2 clubs are needed")
+        sys.exit(1)
+    
+    if args.results_out and not 0 <= args.export_season < args.seasons:
+        print(f"❌ --export-season must be in [0, {args.seasons})")
+        sys.exit(1)
+    
+    export_season = args.export_season if args.results_out else None
+    result = simulate(league, args.seasons, args.seed, export_season)
+    positions = standings(result, args.seed)
+    print_report(league, result, positions, args.top)
+    
+    if args.results_out:
+        export_results(league, result, args.results_out, args.seed)
+        print(f"\n📝 Season {args.export_season} written to {args.results_out} (ingest with ingest_results.py)")
+
+if __name__ == '__main__':
+    main()
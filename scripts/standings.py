@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Season standings and leaderboards, kept up to date incrementally.
+
+Each table (clubs by season points, players by season points, players by
+matches won) is an indexable skip list of (sort key, id): an update is a
+remove plus an insert, and top-K / rank-of-id queries walk the list with the
+link widths, all in O(log n) whatever the size of the season.
+
+The tables are seeded from admin.get_season_snapshot, then follow the model
+change events (event_follower.EventFollower). Events carry totals after the
+change, so re-applying one is harmless. With --results, the tables are built
+offline from match results in the ingest_results.py JSONL format instead
+(e.g. the output of simulate_season.py), applying the record_match rules;
+player wins and losses need the optional `season_club_id` of each player
+entry, which simulate_season.py writes.
+
+--onchain also prints the top-N cache kept by record_match
+(admin.set_leaderboard_size enables it per season).
+
+Usage:
+    ./scripts/standings.py --season-id 1 --top 10
+    ./scripts/standings.py --season-id 1 --rank 10001 10002 --follow
+    ./scripts/standings.py --results season.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from math import log
+
+from manifest import load_manifest
+from models import (
+    LEADERBOARD_CLUBS, LEADERBOARD_PLAYERS, Season, read_leaderboard, read_record, read_season_snapshot,
+)
+from starknet_client import StarknetClient
+
+# Configuration
+MAX_LEVELS = 32
+POLL_INTERVAL = 2
+MATCH_WIN_POINTS = 3                    # MATCH_WIN_POINTS / MATCH_DRAW_POINTS in src/constants.cairo
+MATCH_DRAW_POINTS = 1
+
+class _End:
+    """Key of the skip list tail: greater than every key"""
+    
+    def __lt__(self, other):
+        return False
+    
+    def __le__(self, other):
+        return False
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+    
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [0] * levels
+
+class IndexableSkiplist:
+    """Sorted distinct keys with O(log n) insert, remove, rank and k-th access"""
+    
+    def __init__(self, seed=0):
+        self.size = 0
+        self.random = random.Random(seed)
+        self.tail = _Node(_End(), 0)
+        self.head = _Node(None, MAX_LEVELS)
+        self.head.next = [self.tail] * MAX_LEVELS
+        self.head.width = [1] * MAX_LEVELS
+    
+    def __len__(self):
+        return self.size
+    
+    def insert(self, key):
+        chain = [None] * MAX_LEVELS
+        steps_at_level = [0] * MAX_LEVELS
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        
+        # Geometric level: each level up with probability 1/2
+        levels = min(MAX_LEVELS, 1 - int(log(1.0 - self.random.random(), 2.0)))
+        new = _Node(key, levels)
+        steps = 0
+        for level in range(levels):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, MAX_LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+    
+    def remove(self, key):
+        chain = [None] * MAX_LEVELS
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+        found = chain[0].next[0]
+        if found is self.tail or found.key != key:
+            raise KeyError(key)
+        
+        for level in range(len(found.next)):
+            previous = chain[level]
+            previous.width[level] += found.width[level] - 1
+            previous.next[level] = found.next[level]
+        for level in range(len(found.next), MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+    
+    def rank(self, key):
+        """Number of keys lower than `key` (its 0-based index when present)"""
+        rank = 0
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+        return rank
+    
+    def slice(self, start, count):
+        """Up to `count` keys from index `start`: O(log n) to reach `start`, then one step per key"""
+        if start >= self.size or count <= 0:
+            return []
+        node = self.head
+        remaining = start + 1
+        for level in reversed(range(MAX_LEVELS)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        keys = []
+        while node is not self.tail and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+    
+    def __getitem__(self, index):
+        keys = self.slice(index, 1)
+        if not keys:
+            raise IndexError(index)
+        return keys[0]
+
+class Leaderboard:
+    """Ids ranked by score (any comparable, highest first), ties by lowest id"""
+    
+    def __init__(self):
+        self.scores = {}
+        self.ranked = IndexableSkiplist()
+    
+    def __len__(self):
+        return len(self.ranked)
+    
+    @staticmethod
+    def key(entity_id, score):
+        return (tuple(-value for value in score), entity_id)
+    
+    def update(self, entity_id, score):
+        previous = self.scores.get(entity_id)
+        if previous == score:
+            return
+        if previous is not None:
+            self.ranked.remove(self.key(entity_id, previous))
+        self.ranked.insert(self.key(entity_id, score))
+        self.scores[entity_id] = score
+    
+    def remove(self, entity_id):
+        score = self.scores.pop(entity_id, None)
+        if score is not None:
+            self.ranked.remove(self.key(entity_id, score))
+    
+    def rank(self, entity_id):
+        """1-based rank of an id, None when it isn't ranked"""
+        score = self.scores.get(entity_id)
+        if score is None:
+            return None
+        return self.ranked.rank(self.key(entity_id, score)) + 1
+    
+    def top(self, count, start=0):
+        """[(rank, id, score)] from 0-based `start`"""
+        return [
+            (start + offset + 1, entity_id, self.scores[entity_id])
+            for offset, (_key, entity_id) in enumerate(self.ranked.slice(start, count))
+        ]
+
+class Standings:
+    """Club and player tables of one season"""
+    
+    def __init__(self, season_id):
+        self.season_id = season_id
+        self.clubs = {}                 # season_club_id -> club fields
+        self.players = {}               # season_player_id -> season player fields
+        self.club_points = Leaderboard()
+        self.player_points = Leaderboard()
+        self.player_wins = Leaderboard()
+    
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        standings = cls(snapshot.season.id)
+        for season_club, _name in snapshot.season_clubs:
+            standings.set_club(season_club.id, **{
+                name: getattr(season_club, name)
+                for name in ('season_points', 'matches_won', 'matches_lost', 'matches_drawn')
+            })
+        for season_player, _overgoal_player in snapshot.season_players:
+            standings.set_player(season_player.id, **{
+                name: getattr(season_player, name)
+                for name in ('season_club_id', 'season_points', 'matches_won', 'matches_lost')
+            })
+        return standings
+    
+    def set_club(self, season_club_id, **changes):
+        club = self.clubs.setdefault(
+            season_club_id, {'season_points': 0, 'matches_won': 0, 'matches_lost': 0, 'matches_drawn': 0}
+        )
+        club.update(changes)
+        self.club_points.update(season_club_id, (club['season_points'], club['matches_won']))
+    
+    def set_player(self, season_player_id, **changes):
+        player = self.players.setdefault(
+            season_player_id, {'season_club_id': 0, 'season_points': 0, 'matches_won': 0, 'matches_lost': 0}
+        )
+        player.update(changes)
+        self.player_points.update(season_player_id, (player['season_points'], player['matches_won']))
+        self.player_wins.update(season_player_id, (player['matches_won'], player['season_points']))
+    
+    def apply_event(self, tag, decoded):
+        """Apply a model change event (event_follower.EventFollower), ignoring other seasons"""
+        entity_id = decoded['id']
+        if tag == 'overgoal-SeasonClubMatchRecorded':
+            if entity_id in self.clubs:
+                self.set_club(entity_id, **{
+                    name: decoded[name]
+                    for name in ('season_points', 'matches_won', 'matches_lost', 'matches_drawn')
+                })
+        elif tag == 'overgoal-SeasonPlayerCreated':
+            if decoded['season_id'] == self.season_id:
+                self.set_player(entity_id, season_club_id=decoded['season_club_id'])
+        elif entity_id not in self.players:
+            return
+        elif tag == 'overgoal-SeasonPlayerPointsAdded':
+            self.set_player(entity_id, season_points=decoded['season_points'])
+        elif tag == 'overgoal-SeasonPlayerMatchRecorded':
+            self.set_player(entity_id, matches_won=decoded['matches_won'], matches_lost=decoded['matches_lost'])
+        elif tag == 'overgoal-SeasonPlayerTransferred':
+            self.set_player(entity_id, season_club_id=decoded['season_club_id'])
+    
+    def apply_match(self, match):
+        """Apply a match result (ingest_results.py JSONL record) by the admin.record_match rules"""
+        home, away = match['home'], match['away']
+        home_goals, away_goals = match['home_goals'], match['away_goals']
+        for club_id, goals, against in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+            club = self.clubs.get(club_id) or {
+                'season_points': 0, 'matches_won': 0, 'matches_lost': 0, 'matches_drawn': 0,
+            }
+            if goals > against:
+                self.set_club(club_id, season_points=club['season_points'] + MATCH_WIN_POINTS,
+                              matches_won=club['matches_won'] + 1)
+            elif goals < against:
+                self.set_club(club_id, matches_lost=club['matches_lost'] + 1)
+            else:
+                self.set_club(club_id, season_points=club['season_points'] + MATCH_DRAW_POINTS,
+                              matches_drawn=club['matches_drawn'] + 1)
+        
+        for delta in match.get('players', []):
+            season_player_id = delta['season_player_id']
+            player = self.players.get(season_player_id) or {'season_club_id': 0, 'matches_won': 0,
+                                                            'matches_lost': 0, 'season_points': 0}
+            # Results don't have to name a player's club (record_match reads it on-chain)
+            club_id = delta.get('season_club_id') or player['season_club_id']
+            changes = {'season_club_id': club_id, 'season_points': player['season_points'] + delta.get('points', 0)}
+            if home_goals != away_goals and club_id in (home, away):
+                if (club_id == home) == (home_goals > away_goals):
+                    changes['matches_won'] = player['matches_won'] + 1
+                else:
+                    changes['matches_lost'] = player['matches_lost'] + 1
+            self.set_player(season_player_id, **changes)
+
+def load_results(path):
+    """Match results from an ingest_results.py JSONL file"""
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def print_table(title, board, count, columns):
+    print("\n" + "=" * 60)
+    print(title)
+    print("=" * 60)
+    for rank, entity_id, score in board.top(count):
+        values = "  ".join(f"{name} {value:>4}" for name, value in zip(columns, score))
+        print(f"  {rank:>4}. {entity_id:>6}   {values}")
+
+def print_standings(standings, top, ranks):
+    print_table(f"CLUBS ({len(standings.club_points)})", standings.club_points, top, ('pts', 'won'))
+    print_table(f"PLAYERS BY POINTS ({len(standings.player_points)})", standings.player_points, top, ('pts', 'won'))
+    print_table(f"PLAYERS BY WINS ({len(standings.player_wins)})", standings.player_wins, top, ('won', 'pts'))
+    
+    for entity_id in ranks:
+        if entity_id in standings.clubs:
+            print(f"\n🏟️  Club {entity_id}: rank {standings.club_points.rank(entity_id)}/{len(standings.club_points)}")
+        elif entity_id in standings.players:
+            print(f"\n👤 Player {entity_id}: rank {standings.player_points.rank(entity_id)} by points, "
+                  f"{standings.player_wins.rank(entity_id)} by wins (of {len(standings.player_points)})")
+        else:
+            print(f"\n⚠️  {entity_id} is not in season {standings.season_id}")
+
+async def print_onchain(client, manifest, season_id):
+    """Print the top-N cache kept by record_match"""
+    for board, title in ((LEADERBOARD_CLUBS, 'CLUBS'), (LEADERBOARD_PLAYERS, 'PLAYERS')):
+        entries = await read_leaderboard(client, manifest, season_id, board)
+        print(f"\n⛓️  On-chain {title} top {len(entries)}")
+        for entry in entries:
+            print(f"  {entry.rank + 1:>4}. {entry.id:>6}   pts {entry.score >> 16:>4}  won {entry.score & 0xFFFF:>4}")
+
+async def follow(client, manifest, standings, from_block, args):
+    """Apply events from `from_block` and reprint the tables when something changed"""
+    from event_follower import EventFollower
+    
+    follower = EventFollower(client, manifest, from_block)
+    while True:
+        applied = 0
+        async for events in follower.pages():
+            for tag, decoded, _block_number in events:
+                standings.apply_event(tag, decoded)
+            applied += len(events)
+        if applied:
+            print(f"\n📥 Applied {applied} events (next block: {follower.from_block})")
+            print_standings(standings, args.top, args.rank)
+        await asyncio.sleep(args.interval)
+
+async def main():
+    parser = argparse.ArgumentParser(description='Season standings and leaderboards')
+    parser.add_argument('--season-id', type=int, default=1, help='Season (default: 1)')
+    parser.add_argument('--top', type=int, default=10, help='Entries per table (default: 10)')
+    parser.add_argument('--rank', type=int, nargs='+', default=[], metavar='ID',
+                        help='Print the rank of these season club / season player ids')
+    parser.add_argument('--results', help='Build the tables offline from an ingest_results.py JSONL file')
+    parser.add_argument('--onchain', action='store_true', help='Also print the on-chain top-N cache')
+    parser.add_argument('--follow', action='store_true', help='Keep applying new events')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL,
+                        help=f'Seconds between polls with --follow (default: {POLL_INTERVAL})')
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"SEASON {args.season_id} STANDINGS")
+    print("=" * 60)
+    
+    if args.results:
+        standings = Standings(args.season_id)
+        matches = [
+            match for match in load_results(args.results) if match.get('season_id', args.season_id) == args.season_id
+        ]
+        for match in matches:
+            standings.apply_match(match)
+        print(f"📖 Applied {len(matches)} matches from {args.results}")
+        print_standings(standings, args.top, args.rank)
+        return
+    
+    manifest = load_manifest()
+    async with StarknetClient.from_config() as client:
+        # Events are totals, so starting at the block read before the snapshot can only re-apply
+        from_block = await client.rpc('starknet_blockNumber', [])
+        # get_season_snapshot reverts for a missing season
+        if await read_record(client, manifest, Season, [args.season_id]) is None:
+            print(f"❌ Season {args.season_id} does not exist")
+            sys.exit(1)
+        snapshot = await read_season_snapshot(client, manifest, args.season_id)
+        standings = Standings.from_snapshot(snapshot)
+        print(f"📸 {len(standings.clubs)} clubs, {len(standings.players)} players")
+        print_standings(standings, args.top, args.rank)
+        
+        if args.onchain:
+            await print_onchain(client, manifest, args.season_id)
+        if args.follow:
+            await follow(client, manifest, standings, from_block, args)
+
+if __name__ == '__main__':
+    asyncio.run(main())
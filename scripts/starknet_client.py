@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Shared in-process Starknet JSON-RPC client for the Overgoal scripts.
+
+Replaces the per-call `sozo execute` / `sozo model get` subprocesses:
+- one keep-alive HTTP session to the `rpc_url` in dojo_dev.toml
+- reads models with `starknet_call` against the world's `entity` entrypoint
+- signs and sends invokes with the account configured in dojo_dev.toml
+
+Addresses and selectors come from the shared manifest index (manifest.py).
+
+Requires starknet-py, which also provides aiohttp (`pip install starknet-py`,
+or `pip install starknet-py numpy` for all the scripts, see QUICK_START.md).
+
+Usage:
+    from manifest import load_manifest
+    from starknet_client import StarknetClient
+    
+    manifest = load_manifest()
+    async with StarknetClient.from_config() as client:
+        selector = manifest.model_selector('overgoal-OvergoalPlayer')
+        player = await client.read_model(manifest.world_address, selector, [1])
+        await client.invoke(manifest.contract_address('overgoal-admin'), 'seed_season_1', [])
+"""
+
+import asyncio
+import json
+import sys
+import tomllib
+from dataclasses import fields, replace
+from pathlib import Path
+
+try:
+    import aiohttp
+    from starknet_py.hash.selector import get_selector_from_name
+    from starknet_py.net.account.account import Account
+    from starknet_py.net.client_errors import ClientError
+    from starknet_py.net.client_models import Call
+    from starknet_py.net.full_node_client import FullNodeClient
+    from starknet_py.net.signer.stark_curve_signer import KeyPair
+except ImportError:
+    print("❌ starknet-py is required: pip install starknet-py")
+    sys.exit(1)
+
+# Configuration
+ROOT_PATH = Path(__file__).parent.parent
+DOJO_CONFIG_PATH = ROOT_PATH / "dojo_dev.toml"
+
+# Dojo enum variants (see dojo::model::ModelIndex, dojo::meta::introspect::Ty, dojo::world::Resource)
+MODEL_INDEX_KEYS = 0
+RESOURCE_MODEL = 0
+RESOURCE_EVENT = 1
+TY_PRIMITIVE = 0
+TY_STRUCT = 1
+TY_ENUM = 2
+TY_TUPLE = 3
+TY_ARRAY = 4
+TY_BYTE_ARRAY = 5
+TY_FIXED_ARRAY = 6
+
+# Number of felts a primitive takes once unpacked
+PRIMITIVE_SIZES = {'u256': 2}
+
+# Headroom on estimated resource amounts, for calls whose cost varies with state rather than calldata size
+RESOURCE_BOUNDS_MARGIN = 1.5
+
+# Starknet field prime: negative integers are serialized as FIELD_PRIME - |value|
+FIELD_PRIME = 2**251 + 17 * 2**192 + 1
+
+class TransactionError(Exception):
+    """Raised when an invoke is rejected or reverted"""
+
+def load_dojo_config(path=DOJO_CONFIG_PATH):
+    """Load the [env] section of a dojo profile config"""
+    with open(path, 'rb') as f:
+        return tomllib.load(f)['env']
+
+def to_int(value):
+    """Felt given as int or hex string"""
+    return int(value, 16) if isinstance(value, str) else value
+
+def to_felt(value):
+    """Calldata felt of a (possibly negative) Cairo integer"""
+    return value % FIELD_PRIME
+
+def short_string(value):
+    """Decode a Cairo short string felt"""
+    return value.to_bytes(31, 'big').lstrip(b'\x00').decode('utf-8', errors='replace')
+
+def decode_byte_array(values, offset):
+    """Decode a serialized ByteArray, returns (string, next_offset)"""
+    data_len = values[offset]
+    words = values[offset + 1:offset + 1 + data_len]
+    pending_word = values[offset + 1 + data_len]
+    pending_len = values[offset + 2 + data_len]
+    
+    data = b''.join(word.to_bytes(31, 'big') for word in words)
+    if pending_len:
+        data += pending_word.to_bytes(pending_len, 'big')
+    return data.decode('utf-8', errors='replace'), offset + 3 + data_len
+
+def parse_ty(values, offset):
+    """Parse a serialized `Ty`, returns (ty, next_offset)"""
+    variant = values[offset]
+    offset += 1
+    
+    if variant == TY_PRIMITIVE:
+        return ('primitive', short_string(values[offset])), offset + 1
+    if variant == TY_STRUCT:
+        return parse_struct(values, offset)
+    if variant == TY_ENUM:
+        name = short_string(values[offset])
+        attrs_len = values[offset + 1]
+        offset += 2 + attrs_len
+        children = []
+        count = values[offset]
+        offset += 1
+        for _ in range(count):
+            child_name = short_string(values[offset])
+            child_ty, offset = parse_ty(values, offset + 1)
+            children.append((child_name, child_ty))
+        return ('enum', name, children), offset
+    if variant in (TY_TUPLE, TY_ARRAY):
+        items = []
+        count = values[offset]
+        offset += 1
+        for _ in range(count):
+            item, offset = parse_ty(values, offset)
+            items.append(item)
+        return ('tuple' if variant == TY_TUPLE else 'array', items), offset
+    if variant == TY_BYTE_ARRAY:
+        return ('bytearray',), offset
+    if variant == TY_FIXED_ARRAY:
+        items = []
+        count = values[offset]
+        offset += 1
+        for _ in range(count):
+            item, offset = parse_ty(values, offset)
+            items.append(item)
+        return ('fixed_array', items, values[offset]), offset + 1
+    raise ValueError(f"Unknown Ty variant {variant}")
+
+def parse_struct(values, offset):
+    """Parse a serialized introspection `Struct`, returns (ty, next_offset)"""
+    name = short_string(values[offset])
+    attrs_len = values[offset + 1]
+    offset += 2 + attrs_len
+    
+    members = []
+    count = values[offset]
+    offset += 1
+    for _ in range(count):
+        member_name = short_string(values[offset])
+        attrs_len = values[offset + 1]
+        attrs = [short_string(attr) for attr in values[offset + 2:offset + 2 + attrs_len]]
+        member_ty, offset = parse_ty(values, offset + 2 + attrs_len)
+        members.append((member_name, 'key' in attrs, member_ty))
+    return ('struct', name, members), offset
+
+def decode_value(ty, values, offset):
+    """Decode one value of type `ty` from a felt array, returns (value, next_offset)"""
+    kind = ty[0]
+    if kind == 'primitive':
+        size = PRIMITIVE_SIZES.get(ty[1], 1)
+        if size == 2:
+            return values[offset] + (values[offset + 1] << 128), offset + 2
+        return values[offset], offset + 1
+    if kind == 'bytearray':
+        return decode_byte_array(values, offset)
+    if kind == 'struct':
+        record = {}
+        for name, _is_key, member_ty in ty[2]:
+            record[name], offset = decode_value(member_ty, values, offset)
+        return record, offset
+    if kind == 'tuple':
+        items = []
+        for item_ty in ty[1]:
+            item, offset = decode_value(item_ty, values, offset)
+            items.append(item)
+        return tuple(items), offset
+    if kind == 'array':
+        items = []
+        count = values[offset]
+        offset += 1
+        for _ in range(count):
+            item, offset = decode_value(ty[1][0], values, offset)
+            items.append(item)
+        return items, offset
+    if kind == 'fixed_array':
+        items = []
+        for _ in range(ty[2]):
+            item, offset = decode_value(ty[1][0], values, offset)
+            items.append(item)
+        return items, offset
+    if kind == 'enum':
+        variant_name, variant_ty = ty[2][values[offset]]
+        value, offset = decode_value(variant_ty, values, offset + 1)
+        return (variant_name, value), offset
+    raise ValueError(f"Cannot decode {ty}")
+
+def with_margin(resource_bounds, margin):
+    """Resource bounds with every max_amount scaled by `margin` (prices are kept)"""
+    scaled = {}
+    for field in fields(resource_bounds):
+        bounds = getattr(resource_bounds, field.name)
+        scaled[field.name] = replace(bounds, max_amount=int(bounds.max_amount * margin))
+    return replace(resource_bounds, **scaled)
+
+def to_calls(calls):
+    """starknet-py Calls from [(contract_address, entrypoint, calldata), ...]"""
+    return [
+        Call(
+            to_addr=to_int(address),
+            selector=get_selector_from_name(entrypoint),
+            calldata=list(calldata),
+        )
+        for address, entrypoint, calldata in calls
+    ]
+
+class StarknetClient:
+    """JSON-RPC client sharing one keep-alive HTTP session for reads and invokes"""
+    
+    def __init__(self, rpc_url, account_address=None, private_key=None):
+        self.rpc_url = rpc_url
+        self.account_address = account_address
+        self.private_key = private_key
+        self.session = None
+        self.node = None
+        self.account = None
+        self._request_id = 0
+        self._layouts = {}
+        self._schemas = {}
+        self._resource_bounds = {}
+    
+    @classmethod
+    def from_config(cls, path=DOJO_CONFIG_PATH):
+        """Client configured from dojo_dev.toml (rpc_url, account_address, private_key)"""
+        env = load_dojo_config(path)
+        return cls(env['rpc_url'], env.get('account_address'), env.get('private_key'))
+    
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(keepalive_timeout=60))
+        self.node = FullNodeClient(node_url=self.rpc_url, session=self.session)
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.session.close()
+    
+    def for_account(self, account_address, private_key):
+        """Client signing with another account, sharing this client's HTTP session and model caches"""
+        other = StarknetClient(self.rpc_url, account_address, private_key)
+        other.session = self.session
+        other.node = self.node
+        other._layouts = self._layouts
+        other._schemas = self._schemas
+        return other
+    
+    async def predeployed_accounts(self):
+        """Prefunded accounts of a katana node started with `dev = true`, as [(address, private_key), ...]"""
+        accounts = await self.rpc('dev_predeployedAccounts', [])
+        return [(account['address'], account.get('privateKey', account.get('private_key'))) for account in accounts]
+    
+    # --------- Raw JSON-RPC ---------
+    
+    async def rpc(self, method, params):
+        """Send a single JSON-RPC request and return its result"""
+        self._request_id += 1
+        payload = {'jsonrpc': '2.0', 'id': self._request_id, 'method': method, 'params': params}
+        async with self.session.post(self.rpc_url, json=payload) as response:
+            body = await response.json(content_type=None)
+        if 'error' in body:
+            raise ClientError(message=json.dumps(body['error']))
+        return body['result']
+    
+    async def rpc_batch(self, requests):
+        """Send [(method, params), ...] as one JSON-RPC batch, returns [(result, error), ...] in order"""
+        if not requests:
+            return []
+        first_id = self._request_id + 1
+        payload = []
+        for method, params in requests:
+            self._request_id += 1
+            payload.append({'jsonrpc': '2.0', 'id': self._request_id, 'method': method, 'params': params})
+        async with self.session.post(self.rpc_url, json=payload) as response:
+            body = await response.json(content_type=None)
+        
+        # Batch responses may come back in any order
+        by_id = {item['id']: item for item in body}
+        return [
+            (by_id.get(first_id + i, {}).get('result'), by_id.get(first_id + i, {}).get('error'))
+            for i in range(len(requests))
+        ]
+    
+    async def call(self, contract_address, entrypoint, calldata=()):
+        """starknet_call a view entrypoint, returns the raw felts as ints"""
+        result = await self.rpc('starknet_call', {
+            'request': {
+                'contract_address': hex(to_int(contract_address)),
+                'entry_point_selector': hex(get_selector_from_name(entrypoint)),
+                'calldata': [hex(value) for value in calldata],
+            },
+            'block_id': 'latest',
+        })
+        return [int(value, 16) for value in result]
+    
+    # --------- Invokes ---------
+    
+    async def get_account(self):
+        """Account from dojo_dev.toml, created on first use"""
+        if self.account is None:
+            if not self.account_address or not self.private_key:
+                raise TransactionError("account_address and private_key are required to send transactions")
+            chain_id = int(await self.rpc('starknet_chainId', []), 16)
+            self.account = Account(
+                address=self.account_address,
+                client=self.node,
+                key_pair=KeyPair.from_private_key(to_int(self.private_key)),
+                chain=chain_id,
+            )
+        return self.account
+    
+    async def get_nonce(self):
+        """Nonce of the configured account, including transactions not yet in a block"""
+        account = await self.get_account()
+        params = {'contract_address': hex(to_int(account.address))}
+        try:
+            nonce = await self.rpc('starknet_getNonce', {**params, 'block_id': 'pending'})
+        except ClientError:
+            # Nodes on RPC 0.9+ dropped the "pending" block tag
+            nonce = await self.rpc('starknet_getNonce', {**params, 'block_id': 'pre_confirmed'})
+        return int(nonce, 16)
+    
+    async def multicall(self, calls, wait=True):
+        """Sign and send [(contract_address, entrypoint, calldata), ...] as one invoke, returns the tx hash"""
+        account = await self.get_account()
+        starknet_calls = to_calls(calls)
+        
+        try:
+            response = await account.execute_v3(calls=starknet_calls, auto_estimate=True)
+            if wait:
+                await self.node.wait_for_tx(response.transaction_hash)
+        except Exception as e:
+            raise TransactionError(str(e)) from e
+        return response.transaction_hash
+    
+    async def invoke(self, contract_address, entrypoint, calldata, wait=True):
+        """Sign and send a single call, returns the tx hash"""
+        return await self.multicall([(contract_address, entrypoint, calldata)], wait=wait)
+    
+    async def resource_bounds(self, calls):
+        """Fee bounds for calls to the same entrypoints with the same calldata size, estimated once at the chain nonce"""
+        # The cost of a batch entrypoint grows with its payload, so bounds estimated
+        # on a small batch must not be reused for a larger one
+        key = (
+            tuple((to_int(address), entrypoint) for address, entrypoint, _ in calls),
+            sum(len(calldata) for _, _, calldata in calls),
+        )
+        if key not in self._resource_bounds:
+            account = await self.get_account()
+            # Estimating at a future nonce fails validation, so estimate at the
+            # current one and reuse the bounds for every later nonce
+            estimated = await account.sign_invoke_v3(calls=to_calls(calls), auto_estimate=True)
+            self._resource_bounds[key] = with_margin(estimated.resource_bounds, RESOURCE_BOUNDS_MARGIN)
+        return self._resource_bounds[key]
+    
+    async def send_invoke(self, calls, nonce):
+        """Sign calls with an explicit nonce and send without waiting, returns the tx hash"""
+        account = await self.get_account()
+        try:
+            resource_bounds = await self.resource_bounds(calls)
+            transaction = await account.sign_invoke_v3(
+                calls=to_calls(calls), nonce=nonce, resource_bounds=resource_bounds
+            )
+            response = await self.node.send_transaction(transaction)
+        except Exception as e:
+            raise TransactionError(str(e)) from e
+        return response.transaction_hash
+    
+    async def get_receipts(self, tx_hashes):
+        """Receipts for many transactions in one batch request, None for those not yet known"""
+        results = await self.rpc_batch([
+            ('starknet_getTransactionReceipt', {'transaction_hash': hex(tx_hash)})
+            for tx_hash in tx_hashes
+        ])
+        return {tx_hash: result for tx_hash, (result, _) in zip(tx_hashes, results)}
+    
+    # --------- Model reads ---------
+    
+    async def model_contract(self, world_address, selector, kind=RESOURCE_MODEL):
+        """Address of a model (or, with kind=RESOURCE_EVENT, event) contract registered in the world"""
+        resource = await self.call(world_address, 'resource', [selector])
+        if resource[0] != kind:
+            raise KeyError(f"Resource {hex(selector)} is not a {'model' if kind == RESOURCE_MODEL else 'event'}")
+        return resource[1]
+    
+    async def model_layout(self, world_address, selector):
+        """Serialized `Layout` of a model, fetched once per (world, model)"""
+        key = (world_address, selector)
+        if key not in self._layouts:
+            # Cache the task so concurrent readers share a single fetch
+            self._layouts[key] = asyncio.ensure_future(self._fetch_model_call(world_address, selector, 'layout'))
+        return await self._layouts[key]
+    
+    async def model_schema(self, world_address, selector):
+        """Parsed schema (`Struct`) of a model, fetched once per (world, model)"""
+        key = (world_address, selector)
+        if key not in self._schemas:
+            self._schemas[key] = asyncio.ensure_future(self._fetch_model_schema(world_address, selector))
+        return await self._schemas[key]
+    
+    async def event_schema(self, world_address, selector):
+        """Parsed schema (`Struct`) of an event, fetched once per (world, event)"""
+        key = (world_address, selector)
+        if key not in self._schemas:
+            self._schemas[key] = asyncio.ensure_future(
+                self._fetch_model_schema(world_address, selector, RESOURCE_EVENT)
+            )
+        return await self._schemas[key]
+    
+    async def _fetch_model_call(self, world_address, selector, entrypoint, kind=RESOURCE_MODEL):
+        address = await self.model_contract(world_address, selector, kind)
+        return await self.call(address, entrypoint)
+    
+    async def _fetch_model_schema(self, world_address, selector, kind=RESOURCE_MODEL):
+        schema, _ = parse_struct(await self._fetch_model_call(world_address, selector, 'schema', kind), 0)
+        return schema
+    
+    async def read_model_values(self, world_address, selector, keys):
+        """Raw (non-key) values of a model entity"""
+        layout = await self.model_layout(world_address, selector)
+        result = await self.call(
+            world_address, 'entity', [selector, MODEL_INDEX_KEYS, len(keys), *keys, *layout]
+        )
+        return result[1:1 + result[0]]
+    
+    async def read_models_values(self, world_address, selector, keys_list):
+        """Raw (non-key) values of many entities of one model, in a single world `entities` call"""
+        layout = await self.model_layout(world_address, selector)
+        indexes = []
+        for keys in keys_list:
+            indexes += [MODEL_INDEX_KEYS, len(keys), *keys]
+        result = await self.call(world_address, 'entities', [selector, len(keys_list), *indexes, *layout])
+        
+        # Span<Span<felt252>>: [count, len, values..., len, values..., ...]
+        entities = []
+        offset = 1
+        for _ in range(result[0]):
+            entities.append(result[offset + 1:offset + 1 + result[offset]])
+            offset += 1 + result[offset]
+        return entities
+    
+    async def read_model(self, world_address, selector, keys, schema=None):
+        """Read a model entity as a dict of field name -> value (keys included)"""
+        if schema is None:
+            schema = await self.model_schema(world_address, selector)
+        values = await self.read_model_values(world_address, selector, keys)
+        
+        record = {}
+        key_values = iter(keys)
+        offset = 0
+        for name, is_key, ty in schema[2]:
+            if is_key:
+                record[name] = next(key_values)
+            else:
+                record[name], offset = decode_value(ty, values, offset)
+        return record
+    
+    async def model_exists(self, world_address, selector, keys):
+        """True when any non-key value of the entity is set (see models.record_exists for Overgoal models)"""
+        values = await self.read_model_values(world_address, selector, keys)
+        return any(values)
@@ -1,19 +1,15 @@
 #!/usr/bin/env python3
 """Quick test to seed just ONE player"""
 
-import json
 import subprocess
 import sys
 
+from manifest import load_manifest
+
 # Get addresses
-with open('manifest_dev.json', 'r') as f:
-    manifest = json.load(f)
-world_address = manifest['world']['address']
-admin_address = None
-for contract in manifest['contracts']:
-    if contract['tag'] == 'overgoal-admin':
-        admin_address = contract['address']
-        break
+manifest = load_manifest()
+world_address = manifest.world_address
+admin_address = manifest.contract_address('overgoal-admin')
 
 print(f"World: {world_address}")
 print(f"Admin: {admin_address}")
@@ -61,4 +57,3 @@ except subprocess.CalledProcessError as e:
     print(f"Stdout: {e.stdout}")
     print(f"Stderr: {e.stderr}")
     sys.exit(1)
-
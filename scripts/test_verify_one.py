@@ -1,21 +1,14 @@
 #!/usr/bin/env python3
 """Quick test to verify just ONE player"""
 
-import json
 import subprocess
-import sys
 from pathlib import Path
 
-# Get Overgoal world
-with open('manifest_dev.json', 'r') as f:
-    manifest = json.load(f)
-overgoal_world = manifest['world']['address']
+from manifest import load_manifest, load_universe_manifest
 
-# Get Universe world
-universe_manifest_path = Path(__file__).parent.parent.parent / "universe" / "manifest_dev.json"
-with open(universe_manifest_path, 'r') as f:
-    universe_manifest = json.load(f)
-universe_world = universe_manifest['world']['address']
+# Get Overgoal and Universe worlds
+overgoal_world = load_manifest().world_address
+universe_world = load_universe_manifest().world_address
 
 print(f"📍 Overgoal World: {overgoal_world}")
 print(f"📍 Universe World: {universe_world}")
@@ -61,4 +54,3 @@ if "Model not found" in result.stdout:
     print("❌ SeasonPlayer NOT FOUND")
 else:
     print("✅ SeasonPlayer found")
-
@@ -1,75 +1,59 @@
 #!/usr/bin/env python3
 """Quick test to verify just the 3 missing players"""
 
-import json
-import subprocess
-from pathlib import Path
+import asyncio
 
-# Get Overgoal world
-with open('manifest_dev.json', 'r') as f:
-    manifest = json.load(f)
-overgoal_world = manifest['world']['address']
-
-# Get Universe world
-universe_manifest_path = Path(__file__).parent.parent.parent / "universe" / "manifest_dev.json"
-with open(universe_manifest_path, 'r') as f:
-    universe_manifest = json.load(f)
-universe_world = universe_manifest['world']['address']
-
-print(f"📍 Overgoal World: {overgoal_world}")
-print(f"📍 Universe World: {universe_world}")
+from manifest import load_manifest, load_universe_manifest
+from models import read_overgoal_players, read_season_players
+from starknet_client import StarknetClient
 
 # The 3 missing player IDs
 missing_ids = [51, 88, 103]
 
-for player_id in missing_ids:
-    player_id_hex = hex(player_id)
-    print(f"\n{'='*60}")
-    print(f"Checking Player ID {player_id} ({player_id_hex})")
-    print('='*60)
-    
-    # Check OvergoalPlayer
-    print(f"\n🔍 OvergoalPlayer...")
-    cmd = ['sozo', 'model', 'get', 'OvergoalPlayer', player_id_hex, '--world', overgoal_world]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if "Model not found" in result.stdout:
-        print("❌ NOT FOUND")
-    elif "universe_player_id" in result.stdout:
-        print("✅ FOUND")
-    else:
-        print("❓ UNKNOWN")
-        print(result.stdout[:200])
+def print_check(found):
+    print("✅ FOUND" if found else "❌ NOT FOUND")
+
+async def main():
+    # Get Overgoal and Universe worlds
+    manifest = load_manifest()
+    universe_manifest = load_universe_manifest()
     
-    # Check UniversePlayer
-    print(f"\n🔍 UniversePlayer...")
-    universe_scarb = Path(__file__).parent.parent.parent / "universe" / "Scarb.toml"
-    cmd = ['sozo', 'model', 'get', 'UniversePlayer', player_id_hex, '--world', universe_world, '--manifest-path', str(universe_scarb)]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    print(f"📍 Overgoal World: {manifest.world_address}")
+    print(f"📍 Universe World: {universe_manifest.world_address}")
     
-    if "Model not found" in result.stdout:
-        print("❌ NOT FOUND")
-    elif "user_id" in result.stdout:
-        print("✅ FOUND")
-    else:
-        print("❓ UNKNOWN")
-        print(result.stdout[:200])
+    # One batched call per model for all players
+    season_player_ids = [10000 + player_id for player_id in missing_ids]
+    async with StarknetClient.from_config() as client:
+        overgoal_players, universe_players, season_players = await asyncio.gather(
+            read_overgoal_players(client, manifest, missing_ids),
+            client.read_models_values(
+                universe_manifest.world_address,
+                universe_manifest.model_selector('universe-UniversePlayer'),
+                [[player_id] for player_id in missing_ids]
+            ),
+            read_season_players(client, manifest, season_player_ids),
+        )
     
-    # Check SeasonPlayer
-    season_player_id = hex(10000 + player_id)
-    print(f"\n🔍 SeasonPlayer (ID: {season_player_id})...")
-    cmd = ['sozo', 'model', 'get', 'SeasonPlayer', season_player_id, '--world', overgoal_world]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    for i, player_id in enumerate(missing_ids):
+        print(f"\n{'='*60}")
+        print(f"Checking Player ID {player_id} ({hex(player_id)})")
+        print('='*60)
+        
+        # Check OvergoalPlayer
+        print(f"\n🔍 OvergoalPlayer...")
+        print_check(overgoal_players[i] is not None)
+        
+        # Check UniversePlayer (any non-key field set)
+        print(f"\n🔍 UniversePlayer...")
+        print_check(any(universe_players[i]))
+        
+        # Check SeasonPlayer
+        print(f"\n🔍 SeasonPlayer (ID: {hex(season_player_ids[i])})...")
+        print_check(season_players[i] is not None)
     
-    if "Model not found" in result.stdout:
-        print("❌ NOT FOUND")
-    elif "season_id" in result.stdout:
-        print("✅ FOUND")
-    else:
-        print("❓ UNKNOWN")
-        print(result.stdout[:200])
-
-print(f"\n{'='*60}")
-print("✅ Verification complete!")
-print('='*60)
+    print(f"\n{'='*60}")
+    print("✅ Verification complete!")
+    print('='*60)
 
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Pipelined transaction submission for a single account.
+
+Instead of waiting for every invoke to be accepted before sending the next,
+the pipeline tracks the account nonce locally and keeps up to `window`
+invokes in flight. Receipts of all in-flight transactions are polled with a
+single JSON-RPC batch request.
+
+Failures are re-queued with a correct nonce:
+- a send rejected by the node (e.g. invalid nonce) did not consume a nonce,
+  so the pipeline drains what is in flight, re-reads the nonce from the chain
+  and sends the job again;
+- a reverted transaction consumed its nonce and would revert the same way
+  again, so it is reported as failed right away, never resent;
+- a transaction without a receipt after `receipt_timeout` is checked against
+  the chain nonce first: if its nonce was consumed it only landed late, so
+  its receipt is polled again and it is never resent; only a transaction whose
+  nonce is still unused (dropped from the mempool) is treated like a rejected
+  send.
+
+Each rejected or dropped job is retried at most `max_retries` times before it
+is reported as failed.
+
+A single account serializes everything through one nonce, so
+ShardedPipeline spreads jobs round-robin over one TxPipeline per account
+(e.g. katana's prefunded accounts) and runs them concurrently. Accounts need
+no extra permissions: Dojo checks writer permissions against the system
+contract being called (admin, overgoal_game), not the signing account.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from starknet_client import TransactionError
+
+DEFAULT_WINDOW = 16
+DEFAULT_MAX_RETRIES = 2
+POLL_INTERVAL = 0.5
+RECEIPT_TIMEOUT = 60
+
+@dataclass
+class Job:
+    """One invoke (a list of calls) and its outcome"""
+    calls: list
+    tag: object = None
+    attempts: int = 0
+    nonce: int = None
+    tx_hash: int = None
+    sent_at: float = None
+    status: str = 'pending'  # pending | succeeded | failed
+    error: str = None
+    shard: int = 0
+    landed: bool = False
+    
+    @property
+    def succeeded(self):
+        return self.status == 'succeeded'
+
+@dataclass
+class PipelineStats:
+    sent: int = 0
+    retried: int = 0
+    resyncs: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+class TxPipeline:
+    """Keeps a window of in-flight invokes from one account with a locally tracked nonce"""
+    
+    def __init__(self, client, window=DEFAULT_WINDOW, max_retries=DEFAULT_MAX_RETRIES,
+                 poll_interval=POLL_INTERVAL, receipt_timeout=RECEIPT_TIMEOUT, on_done=None, shard=0):
+        self.client = client
+        self.shard = shard
+        self.window = window
+        self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self.receipt_timeout = receipt_timeout
+        self.on_done = on_done
+        self.queue = deque()
+        self.in_flight = {}
+        self.jobs = []
+        self.nonce = None
+        self.stats = PipelineStats()
+        self._resync = False
+    
+    def submit(self, calls, tag=None):
+        """Queue [(contract_address, entrypoint, calldata), ...] to be sent as one invoke"""
+        job = Job(calls=list(calls), tag=tag, shard=self.shard)
+        self.queue.append(job)
+        self.jobs.append(job)
+        return job
+    
+    async def run(self):
+        """Send every queued job and wait for all of them to settle, returns the jobs"""
+        self.stats = PipelineStats()
+        self.nonce = await self.client.get_nonce()
+        
+        while self.queue or self.in_flight:
+            await self._fill_window()
+            
+            if self.in_flight:
+                await asyncio.sleep(self.poll_interval)
+                await self._poll()
+            
+            # Only re-read the nonce once nothing we sent can still land,
+            # otherwise the chain nonce would be behind our own transactions
+            if self._resync and not self.in_flight:
+                self.nonce = await self.client.get_nonce()
+                self.stats.resyncs += 1
+                self._resync = False
+        
+        return self.jobs
+    
+    async def _fill_window(self):
+        while self.queue and len(self.in_flight) < self.window and not self._resync:
+            job = self.queue.popleft()
+            job.attempts += 1
+            try:
+                tx_hash = await self.client.send_invoke(job.calls, self.nonce)
+            except TransactionError as e:
+                # Rejected before reaching the mempool: the nonce was not used,
+                # but anything sent after this may now be ahead of the chain
+                self._retry(job, str(e))
+                self._resync = True
+                return
+            
+            job.nonce = self.nonce
+            job.tx_hash = tx_hash
+            job.sent_at = time.monotonic()
+            job.landed = False
+            self.in_flight[tx_hash] = job
+            self.nonce += 1
+            self.stats.sent += 1
+    
+    async def _poll(self):
+        receipts = await self.client.get_receipts(list(self.in_flight))
+        now = time.monotonic()
+        chain_nonce = None
+        
+        for tx_hash, receipt in receipts.items():
+            job = self.in_flight[tx_hash]
+            
+            if receipt is None:
+                if now - job.sent_at <= self.receipt_timeout:
+                    continue
+                
+                if job.landed:
+                    # Its nonce was consumed but the receipt still does not show up:
+                    # resending could apply it twice, so give up on it instead
+                    del self.in_flight[tx_hash]
+                    job.error = f"nonce {job.nonce} consumed but no receipt after {2 * self.receipt_timeout}s"
+                    self._finish(job, 'failed')
+                    continue
+                
+                # Read the nonce only after the receipt came back empty, so a
+                # transaction that lands in between is seen as consumed
+                if chain_nonce is None:
+                    chain_nonce = await self.client.get_nonce()
+                
+                if chain_nonce > job.nonce:
+                    # Only slow: it landed, keep polling for its receipt
+                    job.landed = True
+                    job.sent_at = now
+                else:
+                    # Dropped: its nonce (and every later one) was never consumed
+                    del self.in_flight[tx_hash]
+                    self._retry(job, f"no receipt after {self.receipt_timeout}s")
+                    self._resync = True
+                continue
+            
+            del self.in_flight[tx_hash]
+            if receipt.get('execution_status') == 'REVERTED':
+                job.error = receipt.get('revert_reason', 'reverted')
+                self._finish(job, 'failed')
+            else:
+                self._finish(job, 'succeeded')
+    
+    def _retry(self, job, error):
+        job.error = error
+        if job.attempts > self.max_retries:
+            self._finish(job, 'failed')
+            return
+        # Retried jobs go first so ordering is kept as far as possible
+        self.queue.appendleft(job)
+        self.stats.retried += 1
+    
+    def _finish(self, job, status):
+        job.status = status
+        if status == 'succeeded':
+            job.error = None
+        if self.on_done is not None:
+            self.on_done(job)
+
+class ShardedPipeline:
+    """Spreads jobs round-robin over one TxPipeline per account and runs them concurrently"""
+    
+    def __init__(self, clients, window=DEFAULT_WINDOW, on_done=None, **options):
+        self.pipelines = [
+            TxPipeline(client, window=window, on_done=on_done, shard=index, **options)
+            for index, client in enumerate(clients)
+        ]
+        self.jobs = []
+        self.stats = PipelineStats()
+    
+    def submit(self, calls, tag=None):
+        """Queue one invoke on the next account in turn"""
+        pipeline = self.pipelines[len(self.jobs) % len(self.pipelines)]
+        job = pipeline.submit(calls, tag)
+        self.jobs.append(job)
+        return job
+    
+    async def run(self):
+        """Run every account's pipeline to completion, returns all jobs in submission order"""
+        self.stats = PipelineStats()
+        await asyncio.gather(*(pipeline.run() for pipeline in self.pipelines))
+        for pipeline in self.pipelines:
+            self.stats.sent += pipeline.stats.sent
+            self.stats.retried += pipeline.stats.retried
+            self.stats.resyncs += pipeline.stats.resyncs
+        return self.jobs
+    
+    def shard_summary(self):
+        """[(account_address, succeeded, failed), ...] per account"""
+        return [
+            (
+                pipeline.client.account_address,
+                sum(1 for job in pipeline.jobs if job.succeeded),
+                sum(1 for job in pipeline.jobs if not job.succeeded),
+            )
+            for pipeline in self.pipelines
+        ]
+
+def load_accounts(path):
+    """Accounts from a JSON file: [{"address": "0x...", "private_key": "0x..."}, ...]"""
+    with open(path, 'r') as f:
+        return [(account['address'], account['private_key']) for account in json.load(f)]
+
+async def shard_clients(client, count=0, accounts_file=None):
+    """Clients to shard over: accounts from a file, the first `count` katana prefunded accounts, or just `client`"""
+    if accounts_file:
+        accounts = load_accounts(accounts_file)
+    elif count > 1:
+        accounts = (await client.predeployed_accounts())[:count]
+    else:
+        return [client]
+    return [client.for_account(address, private_key) for address, private_key in accounts]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Pre-flight validation of players.json before seeding.
+
+The rows are loaded into one NumPy column per field and checked in a single
+vectorized pass against what the seeding transactions would assert on-chain:
+- OvergoalPlayerTrait::new: player id and universe player id (both user_id)
+  not zero (SeasonPlayerTrait::new's ids, 10000 + user_id and
+  101 + team_id, are then never zero either);
+- the calldata types: u8 appearance and visor fields (UniversePlayer and
+  OvergoalPlayer), u16 stats;
+- duplicate user_ids (the second seed_player would revert, with
+  'Failed to create universe player' if the Universe contract rejects the
+  duplicate, else with create_overgoal_player's
+  'OvergoalPlayer already exists');
+- team_ids whose 101 + team_id SeasonClub doesn't exist in the season
+  (create_season_player doesn't check it and would index the season player
+  under a club that doesn't exist).
+
+Every problem is collected, so one run reports the full list. seed_players.py
+runs it before sending any transaction.
+
+Usage:
+    ./scripts/validate_roster.py                     # against season 1's clubs 101-104
+    ./scripts/validate_roster.py --from-world        # against the season clubs on-chain
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("❌ numpy is required: pip install numpy")
+    sys.exit(1)
+
+from manifest import load_manifest
+from models import ROSTER_SCOPE_SEASON_CLUBS, SEASON_1_CLUBS, read_roster
+from starknet_client import StarknetClient
+
+# Configuration
+PLAYERS_JSON_PATH = Path(__file__).parent.parent.parent / "docs" / "players.json"
+SEASON_ID = 1
+MAX_ERRORS_SHOWN = 50
+
+U8_MAX = 2**8 - 1
+U16_MAX = 2**16 - 1
+ID_MAX = 2**62                          # Ids are felts; players.json ids are far below int64
+
+# Field -> (min, max) accepted by the seeding calldata
+U8_FIELDS = ('body_type', 'skin_color', 'beard_type', 'hair_type', 'hair_color', 'visor_type', 'visor_color')
+U16_FIELDS = ('energy', 'speed', 'leadership', 'pass', 'shoot', 'freekick')
+FIELD_RANGES = {
+    'user_id': (1, ID_MAX),             # Player id and universe player id must not be zero
+    'team_id': (0, ID_MAX),
+    **{field: (0, U8_MAX) for field in U8_FIELDS},
+    **{field: (0, U16_MAX) for field in U16_FIELDS},
+}
+
+def columns(players):
+    """{field: int64 column}, {field: mask of rows where the value is missing or not an integer}"""
+    values, missing = {}, {}
+    for field, (low, high) in FIELD_RANGES.items():
+        raw = [player.get(field) if isinstance(player, dict) else None for player in players]
+        is_int = np.array([isinstance(value, int) and not isinstance(value, bool) for value in raw], dtype=bool)
+        # Clamp what int64 can't hold, it is out of range anyway
+        values[field] = np.array(
+            [min(max(value, -1), high + 1) if ok else 0 for value, ok in zip(raw, is_int)], dtype=np.int64
+        )
+        missing[field] = ~is_int
+    return values, missing
+
+def validate_players(players, season_club_ids=SEASON_1_CLUBS):
+    """Every problem in the players.json rows as a list of messages (empty when valid)"""
+    if not players:
+        return []
+    values, missing = columns(players)
+    labels = [player.get('user_id') if isinstance(player, dict) else None for player in players]
+    problems = []                       # (row, message)
+    
+    def report(mask, message):
+        problems.extend((row, message(row)) for row in np.flatnonzero(mask))
+    
+    # Types and ranges
+    usable = {}
+    for field, (low, high) in FIELD_RANGES.items():
+        report(missing[field], lambda row, field=field: f"{field} missing or not an integer")
+        out_of_range = ~missing[field] & ((values[field] < low) | (values[field] > high))
+        usable[field] = ~missing[field] & ~out_of_range
+        report(out_of_range, lambda row, field=field, low=low, high=high: (
+            f"{field} {players[row][field]} outside [{low}, {high}]"
+        ))
+    
+    # Duplicate ids: sort the valid ids, a row repeats the id of its predecessor in sorted order
+    valid_rows = np.flatnonzero(usable['user_id'])
+    order = valid_rows[np.argsort(values['user_id'][valid_rows], kind='stable')]
+    sorted_ids = values['user_id'][order]
+    repeats = np.zeros(len(players), dtype=bool)
+    repeats[order[1:][sorted_ids[1:] == sorted_ids[:-1]]] = True
+    first_row = dict(zip(sorted_ids[::-1].tolist(), order[::-1].tolist()))
+    report(repeats, lambda row: f"duplicate user_id (first in row {first_row[values['user_id'][row]]})")
+    
+    # Dangling club references: SeasonClub 101 + team_id must exist in the season
+    season_club_of = values['team_id'] + 101
+    dangling = usable['team_id'] & ~np.isin(season_club_of, np.array(sorted(season_club_ids), dtype=np.int64))
+    report(dangling, lambda row: (
+        f"team_id {players[row]['team_id']} maps to SeasonClub {101 + players[row]['team_id']}, "
+        f"not in season {SEASON_ID} ({', '.join(map(str, sorted(season_club_ids)))})"
+    ))
+    
+    problems.sort(key=lambda problem: problem[0])
+    return [f"row {row} (user_id {labels[row]}): {message}" for row, message in problems]
+
+def print_errors(errors, source):
+    """Print the error list (first MAX_ERRORS_SHOWN) of a failed validation"""
+    print(f"❌ {len(errors)} problems in {source}, nothing was sent:")
+    for error in errors[:MAX_ERRORS_SHOWN]:
+        print(f"   • {error}")
+    if len(errors) > MAX_ERRORS_SHOWN:
+        print(f"   … and {len(errors) - MAX_ERRORS_SHOWN} more")
+
+async def season_club_ids_on_chain(client, manifest, season_id=SEASON_ID):
+    """Season club ids of a season, from its season clubs roster (season 1's clubs if it's empty)"""
+    season_club_ids = set(await read_roster(client, manifest, ROSTER_SCOPE_SEASON_CLUBS, season_id))
+    # Worlds seeded before the roster index have an empty roster until backfill_rosters.py runs
+    if not season_club_ids and season_id == 1:
+        print(f"⚠️  Season {season_id} has no indexed season clubs (run backfill_rosters.py), "
+              f"checking against {', '.join(map(str, SEASON_1_CLUBS))}")
+        return set(SEASON_1_CLUBS)
+    return season_club_ids
+
+async def main():
+    parser = argparse.ArgumentParser(description='Validate players.json before seeding')
+    parser.add_argument('--players', type=Path, default=PLAYERS_JSON_PATH,
+                        help=f'players.json to validate (default: {PLAYERS_JSON_PATH})')
+    parser.add_argument('--from-world', action='store_true',
+                        help=f'Check club references against season {SEASON_ID} on-chain instead of 101-104 '
+                             '(seed_players.py always does)')
+    
+    args = parser.parse_args()
+    
+    with open(args.players, 'r') as f:
+        players = json.load(f)
+    
+    season_club_ids = SEASON_1_CLUBS
+    if args.from_world:
+        async with StarknetClient.from_config() as client:
+            season_club_ids = await season_club_ids_on_chain(client, load_manifest())
+    
+    errors = validate_players(players, season_club_ids)
+    if errors:
+        print_errors(errors, args.players)
+        sys.exit(1)
+    print(f"✅ {len(players)} players valid")
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -5,16 +5,33 @@ This script checks:
 1. OvergoalPlayer exists in Overgoal contract
 2. UniversePlayer exists in Universe contract
 3. SeasonPlayer exists for players with teams
+
+Players are checked in batches (--batch-size): each batch is one
+get_overgoal_players call, one get_season_players call and one world
+`entities` call for the UniversePlayers. Batches run concurrently (bounded by
+--concurrency) and are gathered into one report with per-check p50/p95
+latency of the batched calls. A batch whose call fails is reported as an
+error (not as missing players) and left out of the latencies.
 """
 
+import argparse
+import asyncio
 import json
-import subprocess
+import math
 import sys
+import time
 from pathlib import Path
 
+from manifest import load_manifest, load_universe_manifest
+from models import MULTI_GET_BATCH, read_overgoal_players, read_season_players
+from starknet_client import StarknetClient
+
 # Configuration
 PLAYERS_JSON_PATH = Path(__file__).parent.parent.parent / "docs" / "players.json"
 SEASON_ID = 1
+DEFAULT_CONCURRENCY = 32
+DEFAULT_BATCH_SIZE = MULTI_GET_BATCH
+CHECK_TYPES = ('OvergoalPlayer', 'UniversePlayer', 'SeasonPlayer')
 # Note: team_id in JSON (0-3) maps to season_club_id (101-104)
 # team_id 0 -> club 1 (101), team_id 1 -> club 2 (102), etc.
 
@@ -23,72 +40,76 @@ def load_players():
     with open(PLAYERS_JSON_PATH, 'r') as f:
         return json.load(f)
 
-def get_contract_addresses():
-    """Get contract addresses from manifest"""
+def get_world_info():
+    """Get the Overgoal and Universe manifests"""
     try:
-        with open('manifest_dev.json', 'r') as f:
-            manifest = json.load(f)
-        
-        overgoal_world = manifest['world']['address']
-        
-        # Get Universe world address (from universe folder)
-        universe_manifest_path = Path(__file__).parent.parent.parent / "universe" / "manifest_dev.json"
-        with open(universe_manifest_path, 'r') as f:
-            universe_manifest = json.load(f)
-        universe_world = universe_manifest['world']['address']
-        
-        return overgoal_world, universe_world
+        return load_manifest(), load_universe_manifest()
     except Exception as e:
         print(f"❌ Error reading manifests: {e}")
         sys.exit(1)
 
-def check_overgoal_player(world_address, player_id):
-    """Check if OvergoalPlayer exists"""
-    cmd = [
-        'sozo', 'model', 'get', 'OvergoalPlayer', str(player_id),
-        '--world', world_address
-    ]
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        # Check if the output contains meaningful data
-        return 'universe_player_id' in result.stdout and 'Model not found' not in result.stdout
-    except:
-        return False
+async def check_overgoal_players(client, manifest, player_ids):
+    """Existence of each OvergoalPlayer (by the model's own is_zero rule), one view call"""
+    return [player is not None for player in await read_overgoal_players(client, manifest, player_ids)]
 
-def check_universe_player(world_address, player_id):
-    """Check if UniversePlayer exists"""
-    # Use manifest-path to query Universe from Overgoal repo
-    universe_scarb = Path(__file__).parent.parent.parent / "universe" / "Scarb.toml"
-    cmd = [
-        'sozo', 'model', 'get', 'UniversePlayer', str(player_id),
-        '--world', world_address,
-        '--manifest-path', str(universe_scarb)
-    ]
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        # Check if the output contains meaningful data (ignore warnings)
-        # Look for the actual model data, not "Model not found"
-        return 'user_id' in result.stdout and 'Model not found' not in result.stdout
-    except:
-        return False
+async def check_season_players(client, manifest, player_ids):
+    """Existence of each player's SeasonPlayer (10000 + player_id), one view call"""
+    season_player_ids = [10000 + player_id for player_id in player_ids]
+    return [player is not None for player in await read_season_players(client, manifest, season_player_ids)]
+
+async def check_universe_players(client, universe_manifest, player_ids):
+    """Existence of each UniversePlayer (any non-key field set), one world `entities` call"""
+    selector = universe_manifest.model_selector('universe-UniversePlayer')
+    entities = await client.read_models_values(
+        universe_manifest.world_address, selector, [[player_id] for player_id in player_ids]
+    )
+    return [any(values) for values in entities]
+
+async def timed_check(semaphore, latencies, errors, check_type, check, count):
+    """Run one batched check under the concurrency limit and record its latency,
+    a failed call gives None (unknown) for every player of the batch"""
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            exists = await check
+        except Exception as e:
+            errors[check_type].append(str(e))
+            return [None] * count
+        latencies[check_type].append(time.perf_counter() - started)
+    return exists
 
-def check_season_player(world_address, season_player_id):
-    """Check if SeasonPlayer exists"""
-    cmd = [
-        'sozo', 'model', 'get', 'SeasonPlayer', str(season_player_id),
-        '--world', world_address
-    ]
+async def verify_batch(client, semaphore, latencies, errors, manifests, player_ids):
+    """Fan out the three batched checks of some players, returns [{check_type: exists}] in order"""
+    manifest, universe_manifest = manifests
+    count = len(player_ids)
     
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        # Check if the output contains meaningful data
-        return 'season_id' in result.stdout and result.stdout.count('0x0') < 5
-    except:
-        return False
+    results = await asyncio.gather(
+        timed_check(semaphore, latencies, errors, 'OvergoalPlayer',
+                    check_overgoal_players(client, manifest, player_ids), count),
+        timed_check(semaphore, latencies, errors, 'UniversePlayer',
+                    check_universe_players(client, universe_manifest, player_ids), count),
+        timed_check(semaphore, latencies, errors, 'SeasonPlayer',
+                    check_season_players(client, manifest, player_ids), count),
+    )
+    return [dict(zip(CHECK_TYPES, checks)) for checks in zip(*results)]
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
 
-def main():
+async def main():
+    parser = argparse.ArgumentParser(description='Verify seeded players')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Maximum checks in flight (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Players per batched check (default: {DEFAULT_BATCH_SIZE})')
+    
+    args = parser.parse_args()
+    
     print("🔍 Starting player verification...")
     print("=" * 60)
     
@@ -97,14 +118,29 @@ def main():
     print(f"📖 Loaded {len(players)} players from JSON")
     
     # Get contract addresses
-    overgoal_world, universe_world = get_contract_addresses()
-    print(f"📍 Overgoal World: {overgoal_world}")
-    print(f"📍 Universe World: {universe_world}")
+    manifests = get_world_info()
+    print(f"📍 Overgoal World: {manifests[0].world_address}")
+    print(f"📍 Universe World: {manifests[1].world_address}")
     
     print("\n" + "=" * 60)
-    print("Verifying Players...")
+    print(f"Verifying Players (batch size: {args.batch_size}, concurrency: {args.concurrency})...")
     print("=" * 60)
     
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = {check_type: [] for check_type in CHECK_TYPES}
+    errors = {check_type: [] for check_type in CHECK_TYPES}
+    
+    started = time.perf_counter()
+    player_ids = [player['user_id'] for player in players]
+    batches = [player_ids[i:i + args.batch_size] for i in range(0, len(player_ids), args.batch_size)]
+    async with StarknetClient.from_config() as client:
+        batch_results = await asyncio.gather(*[
+            verify_batch(client, semaphore, latencies, errors, manifests, batch)
+            for batch in batches
+        ])
+    results = [checks for batch in batch_results for checks in batch]
+    elapsed = time.perf_counter() - started
+    
     overgoal_ok = 0
     overgoal_missing = []
     universe_ok = 0
@@ -112,43 +148,46 @@ def main():
     season_ok = 0
     season_missing = []
     season_skipped = 0
+    unchecked = {check_type: [] for check_type in CHECK_TYPES}
     
-    for i, player in enumerate(players, 1):
+    for i, (player, checks) in enumerate(zip(players, results), 1):
         player_id = player['user_id']
         player_name = player.get('player_name', f"Player {player_id}")
-        team_id = player['team_id']
         
         print(f"[{i}/{len(players)}] {player_name} (ID: {player_id})...", end=" ")
         
         # Check OvergoalPlayer
-        if check_overgoal_player(overgoal_world, player_id):
+        if checks['OvergoalPlayer'] is None:
+            unchecked['OvergoalPlayer'].append(player_id)
+            print("⚠️  OvergoalPlayer not checked", end=" ")
+        elif checks['OvergoalPlayer']:
             overgoal_ok += 1
         else:
             overgoal_missing.append(player_id)
             print("❌ OvergoalPlayer missing", end=" ")
         
         # Check UniversePlayer
-        if check_universe_player(universe_world, player_id):
+        if checks['UniversePlayer'] is None:
+            unchecked['UniversePlayer'].append(player_id)
+            print("⚠️  UniversePlayer not checked", end=" ")
+        elif checks['UniversePlayer']:
             universe_ok += 1
         else:
             universe_missing.append(player_id)
             print("❌ UniversePlayer missing", end=" ")
         
         # Check SeasonPlayer (all players have teams now, team_id 0-3)
-        if True:  # All players have season_players now
-            season_player_id = 10000 + player_id
-            if check_season_player(overgoal_world, season_player_id):
-                season_ok += 1
-            else:
-                season_missing.append(player_id)
-                print("❌ SeasonPlayer missing", end=" ")
+        if checks['SeasonPlayer'] is None:
+            unchecked['SeasonPlayer'].append(player_id)
+            print("⚠️  SeasonPlayer not checked", end=" ")
+        elif checks['SeasonPlayer']:
+            season_ok += 1
         else:
-            season_skipped += 1
+            season_missing.append(player_id)
+            print("❌ SeasonPlayer missing", end=" ")
         
         # Print OK if all checks passed
-        if (player_id not in overgoal_missing and 
-            player_id not in universe_missing and 
-            player_id not in season_missing):
+        if all(checks.values()):
             print("✅")
         else:
             print()
@@ -177,9 +216,26 @@ def main():
         print(f"  ❌ Missing: {len(season_missing)}")
         print(f"     IDs: {season_missing[:10]}{'...' if len(season_missing) > 10 else ''}")
     
+    if any(errors.values()):
+        print("\n⚠️  Errors (players not checked):")
+        for check_type in CHECK_TYPES:
+            if errors[check_type]:
+                print(f"  {check_type:<15} {len(errors[check_type])} failed calls, "
+                      f"{len(unchecked[check_type])} players, e.g. {errors[check_type][0][:120]}")
+    
+    print(f"\n⏱️  Latency ({sum(len(samples) for samples in latencies.values())} successful batched calls "
+          f"in {elapsed:.2f}s):")
+    for check_type in CHECK_TYPES:
+        samples = latencies[check_type]
+        print(f"  {check_type:<15} p50: {percentile(samples, 50) * 1000:7.1f} ms   "
+              f"p95: {percentile(samples, 95) * 1000:7.1f} ms")
+    
     print("\n" + "=" * 60)
     
-    if overgoal_missing or universe_missing or season_missing:
+    if any(errors.values()):
+        print("❌ VERIFICATION INCOMPLETE - Some checks failed, see the errors above")
+        sys.exit(1)
+    elif overgoal_missing or universe_missing or season_missing:
         print("❌ VERIFICATION FAILED - Some players are missing!")
         sys.exit(1)
     else:
@@ -187,5 +243,4 @@ def main():
         sys.exit(0)
 
 if __name__ == '__main__':
-    main()
-
+    asyncio.run(main())
@@ -1,7 +1,7 @@
 #!/bin/bash
 
 # Script to verify Season 1 data
-# This script calls the admin system's get_season_1_data function
+# This script calls the admin system's get_season_snapshot view for season 1
 
 set -e
 
@@ -20,8 +20,9 @@ echo ""
 echo "📊 Fetching Season 1 data..."
 echo ""
 
-# Call the get_season_1_data function
-sozo call $ADMIN_ADDRESS get_season_1_data \
+# Call get_season_snapshot(season_id, offset, limit): the season, its clubs
+# and the first page of its players
+sozo call $ADMIN_ADDRESS get_season_snapshot 1 0 100 \
     --world $WORLD_ADDRESS
 
 echo ""
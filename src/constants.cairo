@@ -8,3 +8,27 @@ pub fn ZERO_ADDRESS() -> ContractAddress {
 
 // Seconds per day
 pub const SECONDS_PER_DAY: u64 = 86400;
+
+// Roster scopes (see models::roster)
+pub const ROSTER_SCOPE_SEASON_PLAYERS: u8 = 1;     // scope_id = season_id
+pub const ROSTER_SCOPE_CLUB_PLAYERS: u8 = 2;       // scope_id = season_club_id
+pub const ROSTER_SCOPE_SEASON_CLUBS: u8 = 3;       // scope_id = season_id, entries hold season_club_ids
+
+// Maximum season players returned by one `get_season_snapshot` page
+pub const MAX_SNAPSHOT_PAGE: u32 = 100;
+
+// Season points of a SeasonClub per match result
+pub const MATCH_WIN_POINTS: u32 = 3;
+pub const MATCH_DRAW_POINTS: u32 = 1;
+
+// Leaderboard boards (see models::leaderboard)
+pub const LEADERBOARD_CLUBS: u8 = 1;               // SeasonClubs of a season
+pub const LEADERBOARD_PLAYERS: u8 = 2;             // SeasonPlayers of a season
+pub const MAX_LEADERBOARD_SIZE: u32 = 50;
+
+// Energy regeneration of OvergoalPlayers (see OvergoalPlayerTrait::effective_energy): energy is
+// materialized lazily from `energy_updated_at` when a player acts or is read through a view
+pub const MAX_ENERGY: u16 = 100;                   // Regeneration stops here
+pub const ENERGY_REGEN_AMOUNT: u16 = 10;           // Energy regained per period
+pub const ENERGY_REGEN_PERIOD: u64 = 3600;         // Seconds per period
+pub const ENERGY_REGEN_BY_DAY: bool = false;       // Count calendar days (unix_timestamp_to_day) as periods instead
@@ -0,0 +1,114 @@
+// Model change events emitted by the Store mutators.
+//
+// Each event carries the values of the changed fields *after* the change,
+// named like the model fields, so an off-chain view can apply it as an
+// upsert keyed by `id` without re-reading the entity.
+
+// --------- OvergoalPlayer ---------
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct OvergoalPlayerCreated {
+    #[key]
+    pub id: felt252,
+    pub universe_player_id: felt252,
+    pub energy: u16,
+    pub speed: u16,
+    pub leadership: u16,
+    pub pass: u16,
+    pub shoot: u16,
+    pub freekick: u16,
+    pub visor_type: u8,
+    pub visor_color: u8,
+    pub energy_updated_at: u64,
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct OvergoalPlayerUpdated {
+    #[key]
+    pub id: felt252,
+    pub energy: u16,
+    pub speed: u16,
+    pub leadership: u16,
+    pub pass: u16,
+    pub shoot: u16,
+    pub freekick: u16,
+    pub is_injured: bool,
+    pub energy_updated_at: u64,
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct GoalCurrencyChanged {
+    #[key]
+    pub id: felt252,                    // OvergoalPlayer id
+    pub amount: u128,                   // Size of the change
+    pub is_credit: bool,                // true when added, false when spent
+    pub goal_currency: u128,            // Balance after the change
+}
+
+// --------- SeasonPlayer ---------
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonPlayerCreated {
+    #[key]
+    pub id: felt252,
+    pub season_id: felt252,
+    pub season_club_id: felt252,
+    pub overgoal_player_id: felt252,
+    pub team_relationship: u16,
+    pub fans_relationship: u16,
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonPlayerTransferred {
+    #[key]
+    pub id: felt252,
+    pub previous_season_club_id: felt252,
+    pub season_club_id: felt252,
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonPlayerPointsAdded {
+    #[key]
+    pub id: felt252,
+    pub points: u32,
+    pub season_points: u32,             // Total after the change
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonPlayerMatchRecorded {
+    #[key]
+    pub id: felt252,
+    pub won: bool,
+    pub matches_won: u16,
+    pub matches_lost: u16,
+}
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonPlayerRelationshipsChanged {
+    #[key]
+    pub id: felt252,
+    pub team_relationship: u16,         // Values after the change
+    pub fans_relationship: u16,
+}
+
+// --------- SeasonClub ---------
+
+#[derive(Copy, Drop, Serde, Debug)]
+#[dojo::event]
+pub struct SeasonClubMatchRecorded {
+    #[key]
+    pub id: felt252,
+    pub points: u32,                    // Points earned in this match
+    pub season_points: u32,
+    pub matches_won: u16,
+    pub matches_lost: u16,
+    pub matches_drawn: u16,
+}
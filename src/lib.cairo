@@ -1,5 +1,6 @@
 pub mod store;
 pub mod constants;
+pub mod events;
 
 
 
@@ -19,10 +20,15 @@ pub mod models {
     pub mod season;
     pub mod season_club;
     pub mod season_player;
+    pub mod roster;
+    pub mod fixture;
+    pub mod leaderboard;
 }
 
 #[cfg(test)]
 pub mod tests {
+    pub mod mocks;
     pub mod test_overgoal_game;
     pub mod test_admin;
+    pub mod test_profile;
 }
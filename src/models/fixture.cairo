@@ -0,0 +1,164 @@
+// Fixture models: the double round-robin calendar of a Season's clubs.
+// The calendar is generated in chunks of matchdays (FixtureSchedule tracks progress). Fixtures are
+// keyed by (season_id, matchday, index) under a Matchday header, so listing a matchday of N fixtures
+// is exactly N reads.
+
+// Calendar generation state of a season
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct FixtureSchedule {
+    #[key]
+    pub season_id: felt252,
+    pub club_count: u32,                // Season clubs when generation started
+    pub matchday_count: u32,            // Matchdays of the full calendar (both halves)
+    pub scheduled_matchdays: u32,       // Matchdays generated so far (0..scheduled_matchdays)
+}
+
+// Matchday header: day slot and number of fixtures (indices 0..fixture_count)
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct Matchday {
+    #[key]
+    pub season_id: felt252,
+    #[key]
+    pub matchday: u32,                  // 0-based
+    pub day: u32,                       // Days since the unix epoch (Timestamp::unix_timestamp_to_day)
+    pub fixture_count: u32,
+}
+
+// One match of a matchday
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct Fixture {
+    #[key]
+    pub season_id: felt252,
+    #[key]
+    pub matchday: u32,
+    #[key]
+    pub index: u32,
+    pub home_season_club_id: felt252,
+    pub away_season_club_id: felt252,
+}
+
+// Traits Implementations
+#[generate_trait]
+pub impl FixtureScheduleImpl of FixtureScheduleTrait {
+    fn new(season_id: felt252, club_count: u32) -> FixtureSchedule {
+        assert(club_count >= 2, 'Need at least 2 season clubs');
+        let slots = club_count + club_count % 2;
+        FixtureSchedule { season_id, club_count, matchday_count: 2 * (slots - 1), scheduled_matchdays: 0 }
+    }
+
+    fn is_complete(self: @FixtureSchedule) -> bool {
+        *self.matchday_count != 0 && *self.scheduled_matchdays == *self.matchday_count
+    }
+
+    // Pairings of a matchday as (home, away) club indices, by the circle method: slot `rounds` stays
+    // fixed while the others rotate one step per round. An odd club count adds a bye slot (the club
+    // drawn against it rests). The second half replays the first with home and away swapped.
+    // Each pairing is computed directly from the matchday, so a chunk can start anywhere.
+    fn pairings(self: @FixtureSchedule, matchday: u32) -> Array<(u32, u32)> {
+        assert(matchday < *self.matchday_count, 'Invalid matchday');
+        let club_count = *self.club_count;
+        let slots = club_count + club_count % 2;
+        let rounds = slots - 1;
+        let round = matchday % rounds;
+        let second_half = matchday >= rounds;
+
+        let mut pairs = array![];
+        for i in 0..slots / 2 {
+            let (mut home, mut away) = if i == 0 {
+                (round, rounds)
+            } else {
+                ((round + i) % rounds, (round + rounds - i) % rounds)
+            };
+            // Alternate the fixed slot so it doesn't play every first-half match at home
+            if i == 0 && round % 2 == 1 {
+                let fixed = away;
+                away = home;
+                home = fixed;
+            }
+            if second_half {
+                let first = home;
+                home = away;
+                away = first;
+            }
+            if home < club_count && away < club_count {
+                pairs.append((home, away));
+            }
+        };
+        pairs
+    }
+
+    // Day slot of a matchday: matchdays are spread evenly over the season days
+    // (several matchdays share a day when the season has fewer days than matchdays)
+    fn matchday_day(self: @FixtureSchedule, matchday: u32, start_day: u32, end_day: u32) -> u32 {
+        let season_days: u64 = (end_day - start_day + 1).into();
+        let matchday: u64 = matchday.into();
+        let offset = matchday * season_days / (*self.matchday_count).into();
+        start_day + offset.try_into().unwrap()
+    }
+}
+
+// ===============================================
+// Unit Tests
+// ===============================================
+
+#[cfg(test)]
+mod tests {
+    use core::dict::{Felt252Dict, Felt252DictTrait};
+    use super::{FixtureScheduleTrait};
+
+    #[test]
+    fn test_fixture_schedule_new() {
+        let even = FixtureScheduleTrait::new(1, 4);
+        assert(even.matchday_count == 6, 'Should have 6 matchdays');
+        assert(even.scheduled_matchdays == 0, 'Nothing scheduled yet');
+        assert(!even.is_complete(), 'Should not be complete');
+
+        let odd = FixtureScheduleTrait::new(1, 5);
+        assert(odd.matchday_count == 10, 'Should have 10 matchdays');
+    }
+
+    #[test]
+    #[should_panic(expected: ('Need at least 2 season clubs',))]
+    fn test_fixture_schedule_too_few_clubs() {
+        FixtureScheduleTrait::new(1, 1);
+    }
+
+    #[test]
+    fn test_pairings_double_round_robin() {
+        // Every ordered pair (home, away) is played exactly once, and no club plays twice a matchday
+        let club_count: u32 = 5;
+        let schedule = FixtureScheduleTrait::new(1, club_count);
+        let mut played: Felt252Dict<u8> = Default::default();
+        let mut total: u32 = 0;
+        for matchday in 0..schedule.matchday_count {
+            let mut busy: Felt252Dict<u8> = Default::default();
+            for pair in schedule.pairings(matchday) {
+                let (home, away) = pair;
+                assert(home != away, 'Club plays itself');
+                assert(busy.get(home.into()) == 0 && busy.get(away.into()) == 0, 'Club plays twice');
+                busy.insert(home.into(), 1);
+                busy.insert(away.into(), 1);
+                let key: felt252 = (home * club_count + away).into();
+                assert(played.get(key) == 0, 'Pair played twice');
+                played.insert(key, 1);
+                total += 1;
+            };
+        };
+        assert(total == club_count * (club_count - 1), 'Should play every pair');
+    }
+
+    #[test]
+    fn test_matchday_day_spreads_over_season() {
+        let schedule = FixtureScheduleTrait::new(1, 4);
+        // 18 days for 6 matchdays: one every 3 days
+        assert(schedule.matchday_day(0, 100, 117) == 100, 'First matchday on start day');
+        assert(schedule.matchday_day(1, 100, 117) == 103, 'Second matchday 3 days later');
+        assert(schedule.matchday_day(5, 100, 117) == 115, 'Last matchday before the end');
+        // 3 days for 6 matchdays: two per day
+        assert(schedule.matchday_day(1, 100, 102) == 100, 'Shares the first day');
+        assert(schedule.matchday_day(5, 100, 102) == 102, 'Last day');
+    }
+}
@@ -0,0 +1,107 @@
+// Leaderboard models: an optional top-N cache of a season's SeasonClubs or SeasonPlayers, kept
+// sorted by `record_match` so a frontend can read the table in one call. Entries are dense
+// (ranks 0..count) and a board is disabled while its size is 0.
+
+// Leaderboard header: capacity and number of ranked entries
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct Leaderboard {
+    #[key]
+    pub board: u8,                      // LEADERBOARD_* constant
+    #[key]
+    pub season_id: felt252,
+    pub size: u32,                      // Entries kept (0 = disabled)
+    pub count: u32,                     // Entries ranked so far (<= size)
+}
+
+// One ranked entry: (board, season_id, rank) -> season_club_id or season_player_id
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct LeaderboardEntry {
+    #[key]
+    pub board: u8,
+    #[key]
+    pub season_id: felt252,
+    #[key]
+    pub rank: u32,                      // 0 = first
+    pub id: felt252,
+    pub score: u64,                     // leaderboard_score(season_points, matches_won)
+}
+
+// Sort key of an entry: season points first, matches won break ties
+pub fn leaderboard_score(season_points: u32, matches_won: u16) -> u64 {
+    let season_points: u64 = season_points.into();
+    let matches_won: u64 = matches_won.into();
+    season_points * 0x10000 + matches_won
+}
+
+// Traits Implementations
+#[generate_trait]
+pub impl LeaderboardImpl of LeaderboardTrait {
+    fn is_enabled(self: @Leaderboard) -> bool {
+        *self.size > 0
+    }
+
+    // Move (or insert) `id` with its new `score` in `ranked` (sorted by score, highest first) and
+    // keep the first `size` entries. On equal scores the entry already ranked stays ahead.
+    fn place(
+        self: @Leaderboard, ranked: Span<(felt252, u64)>, id: felt252, score: u64
+    ) -> Array<(felt252, u64)> {
+        let size = *self.size;
+        let mut placed = array![];
+        let mut inserted = false;
+        for entry in ranked {
+            let (entry_id, entry_score) = *entry;
+            if entry_id != id {
+                if !inserted && score > entry_score {
+                    if placed.len() < size {
+                        placed.append((id, score));
+                    }
+                    inserted = true;
+                }
+                if placed.len() < size {
+                    placed.append((entry_id, entry_score));
+                }
+            }
+        };
+        if !inserted && placed.len() < size {
+            placed.append((id, score));
+        }
+        placed
+    }
+}
+
+// ===============================================
+// Unit Tests
+// ===============================================
+
+#[cfg(test)]
+mod tests {
+    use super::{Leaderboard, LeaderboardTrait, leaderboard_score};
+
+    #[test]
+    fn test_leaderboard_score_orders_points_then_wins() {
+        assert(leaderboard_score(10, 0) > leaderboard_score(9, 3), 'Points come first');
+        assert(leaderboard_score(9, 3) > leaderboard_score(9, 2), 'Wins break ties');
+    }
+
+    #[test]
+    fn test_leaderboard_place() {
+        let leaderboard = Leaderboard { board: 1, season_id: 1, size: 3, count: 0 };
+
+        let ranked = leaderboard.place(array![].span(), 101, 3);
+        let ranked = leaderboard.place(ranked.span(), 102, 1);
+        let ranked = leaderboard.place(ranked.span(), 103, 3);
+        assert(ranked.span() == array![(101, 3), (103, 3), (102, 1)].span(), 'Ties keep the first ranked');
+
+        // Moving up replaces the old position
+        let ranked = leaderboard.place(ranked.span(), 102, 4);
+        assert(ranked.span() == array![(102, 4), (101, 3), (103, 3)].span(), 'Entry should move up');
+
+        // A full board drops the lowest entry, and doesn't take a lower score
+        let ranked = leaderboard.place(ranked.span(), 104, 5);
+        assert(ranked.span() == array![(104, 5), (102, 4), (101, 3)].span(), 'Lowest entry should drop');
+        let ranked = leaderboard.place(ranked.span(), 105, 1);
+        assert(ranked.len() == 3 && *ranked.at(2) == (101, 3), 'Low score should not enter');
+    }
+}
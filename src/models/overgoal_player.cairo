@@ -1,5 +1,11 @@
 use core::num::traits::zero::Zero;
 
+// Constants imports
+use overgoal::constants::{MAX_ENERGY, ENERGY_REGEN_AMOUNT, ENERGY_REGEN_PERIOD, ENERGY_REGEN_BY_DAY};
+
+// Helpers import
+use overgoal::helpers::timestamp::Timestamp;
+
 // OvergoalPlayer model representing a football player in the Overgoal game
 // This model is linked to a universe player via universe_player_id
 #[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
@@ -18,6 +24,7 @@ pub struct OvergoalPlayer {
     pub is_injured: bool,                   // Injury status
     pub visor_type: u8,                     // Visor type (can be 0 for none)
     pub visor_color: u8,                    // Visor color (can be 0 for none)
+    pub energy_updated_at: u64,             // Unix timestamp `energy` was last materialized at
 }
 
 // Traits Implementations
@@ -34,6 +41,7 @@ pub impl OvergoalPlayerImpl of OvergoalPlayerTrait {
         freekick: u16,
         visor_type: u8,
         visor_color: u8,
+        created_at: u64,
     ) -> OvergoalPlayer {
         // Validate inputs
         assert(id != 0, 'Player ID cannot be zero');
@@ -52,6 +60,7 @@ pub impl OvergoalPlayerImpl of OvergoalPlayerTrait {
             is_injured: false,          // Start not injured
             visor_type,
             visor_color,
+            energy_updated_at: created_at,
         }
     }
 
@@ -73,6 +82,47 @@ pub impl OvergoalPlayerImpl of OvergoalPlayerTrait {
         self.energy = self.energy - amount;
     }
 
+    // Whole regeneration periods elapsed since `energy_updated_at`: calendar days with
+    // ENERGY_REGEN_BY_DAY, ENERGY_REGEN_PERIOD seconds otherwise.
+    fn energy_regen_periods(self: @OvergoalPlayer, now: u64) -> u64 {
+        let updated_at = *self.energy_updated_at;
+        if now <= updated_at {
+            return 0;
+        }
+        if ENERGY_REGEN_BY_DAY {
+            (Timestamp::unix_timestamp_to_day(now) - Timestamp::unix_timestamp_to_day(updated_at)).into()
+        } else {
+            (now - updated_at) / ENERGY_REGEN_PERIOD
+        }
+    }
+
+    // Energy at `now`: the stored energy plus what was regenerated since, up to MAX_ENERGY.
+    // Energy already above MAX_ENERGY is kept as is.
+    fn effective_energy(self: @OvergoalPlayer, now: u64) -> u16 {
+        let energy = *self.energy;
+        if energy >= MAX_ENERGY {
+            return energy;
+        }
+        let regen = self.energy_regen_periods(now) * ENERGY_REGEN_AMOUNT.into();
+        let missing: u64 = (MAX_ENERGY - energy).into();
+        if regen >= missing { MAX_ENERGY } else { energy + regen.try_into().unwrap() }
+    }
+
+    // Write the regenerated energy into `energy`. The progress towards the next period is kept,
+    // except at MAX_ENERGY where regeneration restarts from `now`.
+    fn sync_energy(ref self: OvergoalPlayer, now: u64) {
+        let periods = self.energy_regen_periods(now);
+        self.energy = self.effective_energy(now);
+        if now <= self.energy_updated_at {
+            return;
+        }
+        if ENERGY_REGEN_BY_DAY || self.energy >= MAX_ENERGY {
+            self.energy_updated_at = now;
+        } else {
+            self.energy_updated_at += periods * ENERGY_REGEN_PERIOD;
+        }
+    }
+
     fn set_injured(ref self: OvergoalPlayer, injured: bool) {
         self.is_injured = injured;
     }
@@ -100,9 +150,10 @@ pub impl OvergoalPlayerAssert of OvergoalPlayerAssertTrait {
         assert(!self.is_injured, 'Player is injured');
     }
 
+    // Checks the energy regenerated as of `now`, not only the stored one
     #[inline(always)]
-    fn assert_has_energy(self: OvergoalPlayer, required: u16) {
-        assert(self.energy >= required, 'Insufficient energy');
+    fn assert_has_energy(self: OvergoalPlayer, required: u16, now: u64) {
+        assert(self.effective_energy(now) >= required, 'Insufficient energy');
     }
 }
 
@@ -122,6 +173,7 @@ pub impl ZeroableOvergoalPlayerTrait of Zero<OvergoalPlayer> {
             is_injured: false,
             visor_type: 0,
             visor_color: 0,
+            energy_updated_at: 0,
         }
     }
 
@@ -142,6 +194,7 @@ pub impl ZeroableOvergoalPlayerTrait of Zero<OvergoalPlayer> {
 #[cfg(test)]
 mod tests {
     use super::{OvergoalPlayer, ZeroableOvergoalPlayerTrait, OvergoalPlayerImpl, OvergoalPlayerTrait, OvergoalPlayerAssert};
+    use overgoal::constants::{MAX_ENERGY, ENERGY_REGEN_AMOUNT, ENERGY_REGEN_PERIOD};
 
     #[test]
     #[available_gas(1000000)]
@@ -157,6 +210,7 @@ mod tests {
             75,         // freekick
             1,          // visor_type
             2,          // visor_color
+            1000,       // created_at
         );
 
         assert_eq!(player.id, 0x123, "Player ID should match");
@@ -171,18 +225,19 @@ mod tests {
         assert!(!player.is_injured, "Should not be injured");
         assert_eq!(player.visor_type, 1, "Visor type should match");
         assert_eq!(player.visor_color, 2, "Visor color should match");
+        assert_eq!(player.energy_updated_at, 1000, "Energy timestamp should be creation time");
     }
 
     #[test]
     #[should_panic(expected: ('Player ID cannot be zero',))]
     fn test_overgoal_player_creation_invalid_id() {
-        OvergoalPlayerTrait::new(0, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2);
+        OvergoalPlayerTrait::new(0, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0);
     }
 
     #[test]
     #[should_panic(expected: ('Universe player ID required',))]
     fn test_overgoal_player_creation_invalid_universe_id() {
-        OvergoalPlayerTrait::new(0x123, 0, 100, 80, 70, 85, 90, 75, 1, 2);
+        OvergoalPlayerTrait::new(0x123, 0, 100, 80, 70, 85, 90, 75, 1, 2, 0);
     }
 
     #[test]
@@ -208,7 +263,7 @@ mod tests {
     #[available_gas(1000000)]
     fn test_overgoal_player_currency_operations() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         player.add_currency(500);
@@ -222,7 +277,7 @@ mod tests {
     #[should_panic(expected: ('Insufficient currency',))]
     fn test_overgoal_player_insufficient_currency() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         player.add_currency(100);
@@ -233,7 +288,7 @@ mod tests {
     #[available_gas(1000000)]
     fn test_overgoal_player_energy_operations() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         player.add_energy(50);
@@ -247,17 +302,97 @@ mod tests {
     #[should_panic(expected: ('Insufficient energy',))]
     fn test_overgoal_player_insufficient_energy() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 50, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 50, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         player.reduce_energy(100); // Should panic
     }
 
+    #[test]
+    #[available_gas(1000000)]
+    fn test_overgoal_player_effective_energy() {
+        let player = OvergoalPlayerTrait::new(
+            0x123, 0xabc, 50, 80, 70, 85, 90, 75, 1, 2, 1000
+        );
+
+        assert_eq!(player.effective_energy(1000), 50, "No regen at creation");
+        assert_eq!(player.effective_energy(500), 50, "No regen before the timestamp");
+        assert_eq!(player.effective_energy(1000 + ENERGY_REGEN_PERIOD - 1), 50, "No regen within a period");
+        assert_eq!(
+            player.effective_energy(1000 + 2 * ENERGY_REGEN_PERIOD + 1), 50 + 2 * ENERGY_REGEN_AMOUNT,
+            "Two periods of regen"
+        );
+        assert_eq!(player.effective_energy(1000 + 1000 * ENERGY_REGEN_PERIOD), MAX_ENERGY, "Regen is capped");
+        assert_eq!(player.energy, 50, "Stored energy is untouched");
+    }
+
+    #[test]
+    #[available_gas(1000000)]
+    fn test_overgoal_player_assert_has_energy_counts_regen() {
+        let player = OvergoalPlayerTrait::new(
+            0x123, 0xabc, 0, 80, 70, 85, 90, 75, 1, 2, 1000
+        );
+
+        player.assert_has_energy(ENERGY_REGEN_AMOUNT, 1000 + ENERGY_REGEN_PERIOD); // Should not panic
+    }
+
+    #[test]
+    #[should_panic(expected: ('Insufficient energy',))]
+    fn test_overgoal_player_assert_has_energy_before_regen() {
+        let player = OvergoalPlayerTrait::new(
+            0x123, 0xabc, 0, 80, 70, 85, 90, 75, 1, 2, 1000
+        );
+
+        player.assert_has_energy(ENERGY_REGEN_AMOUNT, 1000 + ENERGY_REGEN_PERIOD - 1);
+    }
+
+    #[test]
+    #[available_gas(1000000)]
+    fn test_overgoal_player_effective_energy_above_max() {
+        let player = OvergoalPlayerTrait::new(
+            0x123, 0xabc, MAX_ENERGY + 20, 80, 70, 85, 90, 75, 1, 2, 1000
+        );
+
+        assert_eq!(
+            player.effective_energy(1000 + 10 * ENERGY_REGEN_PERIOD), MAX_ENERGY + 20,
+            "Energy above the cap is kept"
+        );
+    }
+
+    #[test]
+    #[available_gas(1000000)]
+    fn test_overgoal_player_sync_energy() {
+        let mut player = OvergoalPlayerTrait::new(
+            0x123, 0xabc, 0, 80, 70, 85, 90, 75, 1, 2, 1000
+        );
+
+        // The partial period is kept for the next sync
+        player.sync_energy(1000 + ENERGY_REGEN_PERIOD + 10);
+        assert_eq!(player.energy, ENERGY_REGEN_AMOUNT, "One period materialized");
+        assert_eq!(player.energy_updated_at, 1000 + ENERGY_REGEN_PERIOD, "Progress kept");
+
+        player.sync_energy(1000 + 2 * ENERGY_REGEN_PERIOD);
+        assert_eq!(player.energy, 2 * ENERGY_REGEN_AMOUNT, "Second period materialized");
+
+        // Syncing twice at the same time changes nothing
+        player.sync_energy(1000 + 2 * ENERGY_REGEN_PERIOD);
+        assert_eq!(player.energy, 2 * ENERGY_REGEN_AMOUNT, "Sync is idempotent");
+
+        // At the cap, regeneration restarts from the sync time
+        let now = 1000 + 1000 * ENERGY_REGEN_PERIOD;
+        player.sync_energy(now);
+        assert_eq!(player.energy, MAX_ENERGY, "Energy capped");
+        assert_eq!(player.energy_updated_at, now, "Restarted at the cap");
+
+        player.reduce_energy(MAX_ENERGY);
+        assert_eq!(player.effective_energy(now + ENERGY_REGEN_PERIOD), ENERGY_REGEN_AMOUNT, "No banked regen");
+    }
+
     #[test]
     #[available_gas(1000000)]
     fn test_overgoal_player_injury_status() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         assert!(!player.is_injured, "Should not be injured initially");
@@ -273,7 +408,7 @@ mod tests {
     #[available_gas(1000000)]
     fn test_overgoal_player_visor_update() {
         let mut player = OvergoalPlayerTrait::new(
-            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2
+            0x123, 0xabc, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         player.update_visor(3, 4);
@@ -285,12 +420,12 @@ mod tests {
     #[available_gas(1000000)]
     fn test_overgoal_player_assert_traits() {
         let existing_player = OvergoalPlayerTrait::new(
-            0x456, 0xdef, 100, 80, 70, 85, 90, 75, 1, 2
+            0x456, 0xdef, 100, 80, 70, 85, 90, 75, 1, 2, 0
         );
 
         existing_player.assert_exists(); // Should not panic
         existing_player.assert_not_injured(); // Should not panic
-        existing_player.assert_has_energy(50); // Should not panic
+        existing_player.assert_has_energy(50, 0); // Should not panic
 
         let zero_player: OvergoalPlayer = ZeroableOvergoalPlayerTrait::zero();
         zero_player.assert_not_exists(); // Should not panic
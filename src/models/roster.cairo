@@ -0,0 +1,83 @@
+// Roster index models: list the season players of a Season or a SeasonClub,
+// and the season clubs of a Season, without probing ids. Entries are kept dense (0..count) so a roster of N
+// members is exactly N reads; removals swap the last entry into the hole.
+
+// Roster header: number of entries in a (scope, scope_id) roster
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct Roster {
+    #[key]
+    pub scope: u8,                      // ROSTER_SCOPE_* constant
+    #[key]
+    pub scope_id: felt252,              // season_id or season_club_id
+    pub count: u32,                     // Number of entries (indices 0..count)
+}
+
+// One roster entry: (scope, scope_id, index) -> member_id, a season_player_id
+// (a season_club_id in ROSTER_SCOPE_SEASON_CLUBS rosters)
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct RosterEntry {
+    #[key]
+    pub scope: u8,
+    #[key]
+    pub scope_id: felt252,
+    #[key]
+    pub index: u32,
+    pub member_id: felt252,             // season_player_id, or season_club_id (ROSTER_SCOPE_SEASON_CLUBS)
+}
+
+// Position of a season player in its current club roster, for O(1) removal on transfer
+#[derive(Copy, Drop, Serde, IntrospectPacked, Debug)]
+#[dojo::model]
+pub struct RosterSlot {
+    #[key]
+    pub member_id: felt252,             // season_player_id
+    pub club_index: u32,                // Index in the ROSTER_SCOPE_CLUB_PLAYERS roster
+}
+
+// Traits Implementations
+#[generate_trait]
+pub impl RosterImpl of RosterTrait {
+    // Index the next entry will take, and grow the roster by one
+    fn push(ref self: Roster) -> u32 {
+        let index = self.count;
+        self.count += 1;
+        index
+    }
+
+    // Shrink the roster by one, returns the index of the (former) last entry
+    fn pop(ref self: Roster) -> u32 {
+        assert(self.count > 0, 'Roster is empty');
+        self.count -= 1;
+        self.count
+    }
+}
+
+// ===============================================
+// Unit Tests
+// ===============================================
+
+#[cfg(test)]
+mod tests {
+    use super::{Roster, RosterTrait};
+
+    #[test]
+    fn test_roster_push_and_pop() {
+        let mut roster = Roster { scope: 1, scope_id: 1, count: 0 };
+
+        assert(roster.push() == 0, 'First index should be 0');
+        assert(roster.push() == 1, 'Second index should be 1');
+        assert(roster.count == 2, 'Count should be 2');
+
+        assert(roster.pop() == 1, 'Last index should be 1');
+        assert(roster.count == 1, 'Count should be 1');
+    }
+
+    #[test]
+    #[should_panic(expected: ('Roster is empty',))]
+    fn test_roster_pop_empty() {
+        let mut roster = Roster { scope: 1, scope_id: 1, count: 0 };
+        roster.pop();
+    }
+}
@@ -17,6 +17,15 @@ pub struct SeasonPlayer {
     pub trophies_won: u16,              // Trophies/awards won
 }
 
+// Per-player changes of one match, applied by `record_match`
+#[derive(Copy, Drop, Serde, Debug)]
+pub struct PlayerMatchDelta {
+    pub season_player_id: felt252,
+    pub points: u32,                    // Season points earned in the match
+    pub team_relationship_change: i16,
+    pub fans_relationship_change: i16,
+}
+
 // Traits Implementations
 #[generate_trait]
 pub impl SeasonPlayerImpl of SeasonPlayerTrait {
@@ -1,9 +1,11 @@
 // Starknet imports
 use starknet::{ContractAddress, get_caller_address, get_block_timestamp};
+use core::dict::{Felt252Dict, Felt252DictTrait};
 
 // Dojo imports
 use dojo::world::WorldStorage;
 use dojo::model::ModelStorage;
+use dojo::event::EventStorage;
 
 // Models imports
 use overgoal::models::user::{User, UserTrait, UserAssert, ZeroableUserTrait};
@@ -11,7 +13,25 @@ use overgoal::models::overgoal_player::{OvergoalPlayer, OvergoalPlayerTrait, Ove
 use overgoal::models::club::{Club, ClubTrait, AssertClubTrait};
 use overgoal::models::season::{Season, SeasonTrait, AssertSeasonTrait};
 use overgoal::models::season_club::{SeasonClub, SeasonClubTrait, AssertSeasonClubTrait};
-use overgoal::models::season_player::{SeasonPlayer, SeasonPlayerTrait, AssertSeasonPlayerTrait};
+use overgoal::models::season_player::{
+    SeasonPlayer, SeasonPlayerTrait, AssertSeasonPlayerTrait, ZeroableSeasonPlayerTrait, PlayerMatchDelta,
+};
+use overgoal::models::roster::{Roster, RosterTrait, RosterEntry, RosterSlot};
+use overgoal::models::fixture::{FixtureSchedule, FixtureScheduleTrait, Matchday, Fixture};
+use overgoal::models::leaderboard::{Leaderboard, LeaderboardTrait, LeaderboardEntry, leaderboard_score};
+
+// Events imports
+use overgoal::events::{
+    OvergoalPlayerCreated, OvergoalPlayerUpdated, GoalCurrencyChanged, SeasonPlayerCreated,
+    SeasonPlayerTransferred, SeasonPlayerPointsAdded, SeasonPlayerMatchRecorded, SeasonPlayerRelationshipsChanged,
+    SeasonClubMatchRecorded,
+};
+
+// Constants imports
+use overgoal::constants::{
+    ROSTER_SCOPE_SEASON_PLAYERS, ROSTER_SCOPE_CLUB_PLAYERS, ROSTER_SCOPE_SEASON_CLUBS, MATCH_WIN_POINTS,
+    MATCH_DRAW_POINTS, LEADERBOARD_CLUBS, LEADERBOARD_PLAYERS, MAX_LEADERBOARD_SIZE,
+};
 
 // Helpers import
 use overgoal::helpers::timestamp::Timestamp;
@@ -111,7 +131,41 @@ pub impl StoreImpl of StoreTrait {
         player.is_non_zero()
     }
 
+    // Read many OvergoalPlayers at once, missing ids come back as zero() (id 0)
+    fn read_overgoal_players(self: Store, overgoal_player_ids: Span<felt252>) -> Array<OvergoalPlayer> {
+        let players: Array<OvergoalPlayer> = self.world.read_models(overgoal_player_ids);
+        let mut result = array![];
+        for player in players {
+            result.append(if player.is_non_zero() { player } else { ZeroableOvergoalPlayerTrait::zero() });
+        };
+        result
+    }
+
+    // OvergoalPlayer with its regenerated energy materialized as of the current block (not written)
+    fn read_overgoal_player_synced(self: Store, overgoal_player_id: felt252) -> OvergoalPlayer {
+        let mut player = self.read_overgoal_player_from_id(overgoal_player_id);
+        if player.is_non_zero() {
+            player.sync_energy(get_block_timestamp());
+        }
+        player
+    }
+
+    // read_overgoal_players with the regenerated energy materialized as of the current block (not written)
+    fn read_overgoal_players_synced(self: Store, overgoal_player_ids: Span<felt252>) -> Array<OvergoalPlayer> {
+        let now = get_block_timestamp();
+        let mut result = array![];
+        for player in self.read_overgoal_players(overgoal_player_ids) {
+            let mut player = player;
+            if player.is_non_zero() {
+                player.sync_energy(now);
+            }
+            result.append(player);
+        };
+        result
+    }
+
     // --------- OvergoalPlayer Setters ---------
+    // Written as is: the mutators below sync the regenerated energy before writing
     fn write_overgoal_player(mut self: Store, player: @OvergoalPlayer) {
         self.world.write_model(player)
     }
@@ -144,10 +198,26 @@ pub impl StoreImpl of StoreTrait {
             shoot,
             freekick,
             visor_type,
-            visor_color
+            visor_color,
+            get_block_timestamp()
         );
 
         self.world.write_model(@new_player);
+        self.world.emit_event(
+            @OvergoalPlayerCreated {
+                id: overgoal_player_id,
+                universe_player_id,
+                energy,
+                speed,
+                leadership,
+                pass,
+                shoot,
+                freekick,
+                visor_type,
+                visor_color,
+                energy_updated_at: new_player.energy_updated_at,
+            }
+        );
     }
 
     // --------- OvergoalPlayer Management ---------
@@ -162,6 +232,7 @@ pub impl StoreImpl of StoreTrait {
     ) {
         let mut player = self.read_overgoal_player_from_id(overgoal_player_id);
         player.assert_exists();
+        player.sync_energy(get_block_timestamp());
         
         // Update stats by creating a new player with updated values
         // Note: In a real implementation, you might want individual update methods
@@ -179,36 +250,132 @@ pub impl StoreImpl of StoreTrait {
             is_injured: player.is_injured,
             visor_type: player.visor_type,
             visor_color: player.visor_color,
+            energy_updated_at: player.energy_updated_at,
         };
         
         self.world.write_model(@updated_player);
+        self.emit_overgoal_player_updated(@updated_player);
     }
 
+    // Currency changes sync the regenerated energy too. Syncing keeps effective_energy unchanged,
+    // so GoalCurrencyChanged is enough for followers.
     fn add_overgoal_player_currency(mut self: Store, overgoal_player_id: felt252, amount: u128) {
         let mut player = self.read_overgoal_player_from_id(overgoal_player_id);
         player.assert_exists();
+        player.sync_energy(get_block_timestamp());
         
         player.add_currency(amount);
         
         self.world.write_model(@player);
+        self.world.emit_event(
+            @GoalCurrencyChanged {
+                id: overgoal_player_id, amount, is_credit: true, goal_currency: player.goal_currency,
+            }
+        );
     }
 
     fn spend_overgoal_player_currency(mut self: Store, overgoal_player_id: felt252, amount: u128) {
         let mut player = self.read_overgoal_player_from_id(overgoal_player_id);
         player.assert_exists();
+        player.sync_energy(get_block_timestamp());
         
         player.spend_currency(amount);
         
         self.world.write_model(@player);
+        self.world.emit_event(
+            @GoalCurrencyChanged {
+                id: overgoal_player_id, amount, is_credit: false, goal_currency: player.goal_currency,
+            }
+        );
+    }
+
+    // Apply signed currency changes to many players at once. Deltas of the same player are netted,
+    // each player is read and written once, and every balance is checked before anything is
+    // written, so the batch fails as a whole on 'Insufficient currency'.
+    fn apply_currency_deltas(mut self: Store, deltas: Span<(felt252, i128)>) {
+        // 1. Net credits and debits per player, in order of first appearance
+        let mut ids: Array<felt252> = array![];
+        let mut seen: Felt252Dict<u8> = Default::default();
+        let mut credits: Felt252Dict<u128> = Default::default();
+        let mut debits: Felt252Dict<u128> = Default::default();
+        for delta in deltas {
+            let (overgoal_player_id, change) = *delta;
+            if seen.get(overgoal_player_id) == 0 {
+                seen.insert(overgoal_player_id, 1);
+                ids.append(overgoal_player_id);
+            }
+            if change >= 0 {
+                let amount: u128 = change.try_into().unwrap();
+                credits.insert(overgoal_player_id, credits.get(overgoal_player_id) + amount);
+            } else {
+                // Through felt252 so that i128's minimum negates too
+                let change: felt252 = change.into();
+                let amount: u128 = (-change).try_into().unwrap();
+                debits.insert(overgoal_player_id, debits.get(overgoal_player_id) + amount);
+            }
+        };
+
+        // 2. Check every balance before writing anything
+        let players = self.read_overgoal_players(ids.span());
+        let now = get_block_timestamp();
+        let mut updated = array![];
+        for player in players {
+            let mut player = player;
+            player.assert_exists();
+            player.sync_energy(now);
+            let credit = credits.get(player.id);
+            let debit = debits.get(player.id);
+            if credit >= debit {
+                player.add_currency(credit - debit);
+            } else {
+                player.spend_currency(debit - credit);
+            }
+            if credit != debit {
+                updated.append((player, credit, debit));
+            }
+        };
+
+        // 3. One write and one event per player whose balance changed
+        for entry in updated {
+            let (player, credit, debit) = entry;
+            self.world.write_model(@player);
+            let is_credit = credit > debit;
+            self.world.emit_event(
+                @GoalCurrencyChanged {
+                    id: player.id,
+                    amount: if is_credit { credit - debit } else { debit - credit },
+                    is_credit,
+                    goal_currency: player.goal_currency,
+                }
+            );
+        };
     }
 
     fn set_overgoal_player_injury(mut self: Store, overgoal_player_id: felt252, is_injured: bool) {
         let mut player = self.read_overgoal_player_from_id(overgoal_player_id);
         player.assert_exists();
+        player.sync_energy(get_block_timestamp());
         
         player.set_injured(is_injured);
         
         self.world.write_model(@player);
+        self.emit_overgoal_player_updated(@player);
+    }
+
+    fn emit_overgoal_player_updated(mut self: Store, player: @OvergoalPlayer) {
+        self.world.emit_event(
+            @OvergoalPlayerUpdated {
+                id: *player.id,
+                energy: *player.energy,
+                speed: *player.speed,
+                leadership: *player.leadership,
+                pass: *player.pass,
+                shoot: *player.shoot,
+                freekick: *player.freekick,
+                is_injured: *player.is_injured,
+                energy_updated_at: *player.energy_updated_at,
+            }
+        );
     }
 
     // ========================================
@@ -308,6 +475,7 @@ pub impl StoreImpl of StoreTrait {
             offense, defense, intensity, chemistry
         );
         self.world.write_model(@season_club);
+        self.roster_append(ROSTER_SCOPE_SEASON_CLUBS, season_id, season_club_id);
     }
 
     fn update_season_club_manager(mut self: Store, season_club_id: felt252, new_manager_id: felt252) {
@@ -343,6 +511,8 @@ pub impl StoreImpl of StoreTrait {
         season_club.assert_exists();
         season_club.record_match_win(points);
         self.world.write_model(@season_club);
+        self.emit_season_club_match_recorded(@season_club, points);
+        self.rank_season_club(@season_club);
     }
 
     fn record_season_club_match_loss(mut self: Store, season_club_id: felt252) {
@@ -350,6 +520,8 @@ pub impl StoreImpl of StoreTrait {
         season_club.assert_exists();
         season_club.record_match_loss();
         self.world.write_model(@season_club);
+        self.emit_season_club_match_recorded(@season_club, 0);
+        self.rank_season_club(@season_club);
     }
 
     fn record_season_club_match_draw(mut self: Store, season_club_id: felt252, points: u32) {
@@ -357,6 +529,119 @@ pub impl StoreImpl of StoreTrait {
         season_club.assert_exists();
         season_club.record_match_draw(points);
         self.world.write_model(@season_club);
+        self.emit_season_club_match_recorded(@season_club, points);
+        self.rank_season_club(@season_club);
+    }
+
+    // Record a match between two clubs of a season and the changes of the players who took part.
+    // Each SeasonClub and SeasonPlayer is read once, updated in memory and written once (a player
+    // listed twice in `player_deltas` reverts with 'Duplicate player delta').
+    fn record_match(
+        mut self: Store,
+        season_id: felt252,
+        home_season_club_id: felt252,
+        away_season_club_id: felt252,
+        home_goals: u8,
+        away_goals: u8,
+        player_deltas: Span<PlayerMatchDelta>
+    ) {
+        assert(home_season_club_id != away_season_club_id, 'Clubs must be different');
+        let mut home = self.read_season_club(home_season_club_id);
+        let mut away = self.read_season_club(away_season_club_id);
+        home.assert_exists();
+        away.assert_exists();
+        assert(home.season_id == season_id && away.season_id == season_id, 'SeasonClub in another season');
+
+        // 1. Clubs
+        let (home_points, away_points) = if home_goals > away_goals {
+            home.record_match_win(MATCH_WIN_POINTS);
+            away.record_match_loss();
+            (MATCH_WIN_POINTS, 0)
+        } else if home_goals < away_goals {
+            home.record_match_loss();
+            away.record_match_win(MATCH_WIN_POINTS);
+            (0, MATCH_WIN_POINTS)
+        } else {
+            home.record_match_draw(MATCH_DRAW_POINTS);
+            away.record_match_draw(MATCH_DRAW_POINTS);
+            (MATCH_DRAW_POINTS, MATCH_DRAW_POINTS)
+        };
+        self.world.write_model(@home);
+        self.world.write_model(@away);
+        self.emit_season_club_match_recorded(@home, home_points);
+        self.emit_season_club_match_recorded(@away, away_points);
+        self.update_leaderboard(
+            LEADERBOARD_CLUBS,
+            season_id,
+            array![
+                (home.id, leaderboard_score(home.season_points, home.matches_won)),
+                (away.id, leaderboard_score(away.season_points, away.matches_won)),
+            ].span()
+        );
+
+        // 2. Players: win/loss follows their club (a draw counts as neither), then points and relationships
+        let mut player_scores = array![];
+        let mut seen: Felt252Dict<u8> = Default::default();
+        for delta in player_deltas {
+            let delta = *delta;
+            assert(seen.get(delta.season_player_id) == 0, 'Duplicate player delta');
+            seen.insert(delta.season_player_id, 1);
+            let mut season_player = self.read_season_player(delta.season_player_id);
+            season_player.assert_exists();
+            let is_home = season_player.season_club_id == home_season_club_id;
+            assert(is_home || season_player.season_club_id == away_season_club_id, 'Player not in this match');
+
+            let decided = home_goals != away_goals;
+            let won = is_home == (home_goals > away_goals);
+            if decided {
+                if won {
+                    season_player.record_match_win();
+                } else {
+                    season_player.record_match_loss();
+                }
+            }
+            season_player.add_season_points(delta.points);
+            season_player.update_team_relationship(delta.team_relationship_change);
+            season_player.update_fans_relationship(delta.fans_relationship_change);
+            self.world.write_model(@season_player);
+            player_scores.append(
+                (season_player.id, leaderboard_score(season_player.season_points, season_player.matches_won))
+            );
+
+            if decided {
+                self.emit_season_player_match_recorded(@season_player, won);
+            }
+            if delta.team_relationship_change != 0 || delta.fans_relationship_change != 0 {
+                self.emit_season_player_relationships_changed(@season_player);
+            }
+            if delta.points > 0 {
+                self.world.emit_event(
+                    @SeasonPlayerPointsAdded {
+                        id: season_player.id, points: delta.points, season_points: season_player.season_points,
+                    }
+                );
+            }
+        };
+        self.update_leaderboard(LEADERBOARD_PLAYERS, season_id, player_scores.span());
+    }
+
+    // Re-rank a single SeasonClub on its season's club board (record_match ranks both clubs at once)
+    fn rank_season_club(mut self: Store, season_club: @SeasonClub) {
+        let score = leaderboard_score(*season_club.season_points, *season_club.matches_won);
+        self.update_leaderboard(LEADERBOARD_CLUBS, *season_club.season_id, array![(*season_club.id, score)].span());
+    }
+
+    fn emit_season_club_match_recorded(mut self: Store, season_club: @SeasonClub, points: u32) {
+        self.world.emit_event(
+            @SeasonClubMatchRecorded {
+                id: *season_club.id,
+                points,
+                season_points: *season_club.season_points,
+                matches_won: *season_club.matches_won,
+                matches_lost: *season_club.matches_lost,
+                matches_drawn: *season_club.matches_drawn,
+            }
+        );
     }
 
     // ========================================
@@ -372,6 +657,18 @@ pub impl StoreImpl of StoreTrait {
         season_player.is_non_zero()
     }
 
+    // Read many SeasonPlayers at once, missing ids come back as zero() (id 0)
+    fn read_season_players(self: Store, season_player_ids: Span<felt252>) -> Array<SeasonPlayer> {
+        let season_players: Array<SeasonPlayer> = self.world.read_models(season_player_ids);
+        let mut result = array![];
+        for season_player in season_players {
+            result.append(
+                if season_player.is_non_zero() { season_player } else { ZeroableSeasonPlayerTrait::zero() }
+            );
+        };
+        result
+    }
+
     fn create_season_player(
         mut self: Store,
         season_player_id: felt252,
@@ -387,13 +684,51 @@ pub impl StoreImpl of StoreTrait {
             team_relationship, fans_relationship
         );
         self.world.write_model(@season_player);
+        self.world.emit_event(
+            @SeasonPlayerCreated {
+                id: season_player_id,
+                season_id,
+                season_club_id,
+                overgoal_player_id,
+                team_relationship,
+                fans_relationship,
+            }
+        );
+
+        self.index_season_player(@season_player);
     }
 
     fn transfer_season_player(mut self: Store, season_player_id: felt252, new_season_club_id: felt252) {
         let mut season_player = self.read_season_player(season_player_id);
         season_player.assert_exists();
+        let indexed = self.is_season_player_indexed(@season_player);
+        let old_season_club_id = season_player.season_club_id;
         season_player.transfer_to_club(new_season_club_id);
         self.world.write_model(@season_player);
+
+        self.world.emit_event(
+            @SeasonPlayerTransferred {
+                id: season_player_id,
+                previous_season_club_id: old_season_club_id,
+                season_club_id: new_season_club_id,
+            }
+        );
+
+        // Season players created before the roster index existed are in no roster yet: index them
+        // in the season roster and their new club roster
+        if !indexed {
+            self.index_season_player(@season_player);
+            return;
+        }
+        if old_season_club_id == new_season_club_id {
+            return;
+        }
+
+        // Move the player between club rosters: swap-remove from the old one, append to the new one
+        let slot: RosterSlot = self.world.read_model(season_player_id);
+        self.roster_remove_club_player(old_season_club_id, season_player_id, slot.club_index);
+        let club_index = self.roster_append(ROSTER_SCOPE_CLUB_PLAYERS, new_season_club_id, season_player_id);
+        self.world.write_model(@RosterSlot { member_id: season_player_id, club_index });
     }
 
     fn update_season_player_team_relationship(mut self: Store, season_player_id: felt252, change: i16) {
@@ -401,6 +736,7 @@ pub impl StoreImpl of StoreTrait {
         season_player.assert_exists();
         season_player.update_team_relationship(change);
         self.world.write_model(@season_player);
+        self.emit_season_player_relationships_changed(@season_player);
     }
 
     fn update_season_player_fans_relationship(mut self: Store, season_player_id: felt252, change: i16) {
@@ -408,6 +744,7 @@ pub impl StoreImpl of StoreTrait {
         season_player.assert_exists();
         season_player.update_fans_relationship(change);
         self.world.write_model(@season_player);
+        self.emit_season_player_relationships_changed(@season_player);
     }
 
     fn add_season_player_points(mut self: Store, season_player_id: felt252, points: u32) {
@@ -415,6 +752,12 @@ pub impl StoreImpl of StoreTrait {
         season_player.assert_exists();
         season_player.add_season_points(points);
         self.world.write_model(@season_player);
+        self.world.emit_event(
+            @SeasonPlayerPointsAdded {
+                id: season_player_id, points, season_points: season_player.season_points,
+            }
+        );
+        self.rank_season_player(@season_player);
     }
 
     fn record_season_player_match_win(mut self: Store, season_player_id: felt252) {
@@ -422,6 +765,8 @@ pub impl StoreImpl of StoreTrait {
         season_player.assert_exists();
         season_player.record_match_win();
         self.world.write_model(@season_player);
+        self.emit_season_player_match_recorded(@season_player, true);
+        self.rank_season_player(@season_player);
     }
 
     fn record_season_player_match_loss(mut self: Store, season_player_id: felt252) {
@@ -429,6 +774,37 @@ pub impl StoreImpl of StoreTrait {
         season_player.assert_exists();
         season_player.record_match_loss();
         self.world.write_model(@season_player);
+        self.emit_season_player_match_recorded(@season_player, false);
+        self.rank_season_player(@season_player);
+    }
+
+    // Re-rank a single SeasonPlayer on its season's player board
+    fn rank_season_player(mut self: Store, season_player: @SeasonPlayer) {
+        let score = leaderboard_score(*season_player.season_points, *season_player.matches_won);
+        self.update_leaderboard(
+            LEADERBOARD_PLAYERS, *season_player.season_id, array![(*season_player.id, score)].span()
+        );
+    }
+
+    fn emit_season_player_match_recorded(mut self: Store, season_player: @SeasonPlayer, won: bool) {
+        self.world.emit_event(
+            @SeasonPlayerMatchRecorded {
+                id: *season_player.id,
+                won,
+                matches_won: *season_player.matches_won,
+                matches_lost: *season_player.matches_lost,
+            }
+        );
+    }
+
+    fn emit_season_player_relationships_changed(mut self: Store, season_player: @SeasonPlayer) {
+        self.world.emit_event(
+            @SeasonPlayerRelationshipsChanged {
+                id: *season_player.id,
+                team_relationship: *season_player.team_relationship,
+                fans_relationship: *season_player.fans_relationship,
+            }
+        );
     }
 
     fn award_season_player_trophy(mut self: Store, season_player_id: felt252) {
@@ -437,5 +813,269 @@ pub impl StoreImpl of StoreTrait {
         season_player.award_trophy();
         self.world.write_model(@season_player);
     }
-    
+
+    // ========================================
+    // Roster Index Operations
+    // ========================================
+
+    fn read_roster(self: Store, scope: u8, scope_id: felt252) -> Roster {
+        self.world.read_model((scope, scope_id))
+    }
+
+    fn read_roster_entry(self: Store, scope: u8, scope_id: felt252, index: u32) -> RosterEntry {
+        self.world.read_model((scope, scope_id, index))
+    }
+
+    fn read_roster_slot(self: Store, season_player_id: felt252) -> RosterSlot {
+        self.world.read_model(season_player_id)
+    }
+
+    // Index a season player in its season roster and its current club roster
+    fn index_season_player(mut self: Store, season_player: @SeasonPlayer) {
+        let season_player_id = *season_player.id;
+        self.roster_append(ROSTER_SCOPE_SEASON_PLAYERS, *season_player.season_id, season_player_id);
+        let club_index = self.roster_append(
+            ROSTER_SCOPE_CLUB_PLAYERS, *season_player.season_club_id, season_player_id
+        );
+        self.world.write_model(@RosterSlot { member_id: season_player_id, club_index });
+    }
+
+    // Whether a season player is in its current club roster (and so in its season roster too):
+    // false for season players created before the roster index existed and not backfilled yet
+    fn is_season_player_indexed(self: Store, season_player: @SeasonPlayer) -> bool {
+        let season_club_id = *season_player.season_club_id;
+        let slot = self.read_roster_slot(*season_player.id);
+        if slot.club_index >= self.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, season_club_id).count {
+            return false;
+        }
+        let entry = self.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, season_club_id, slot.club_index);
+        entry.member_id == *season_player.id
+    }
+
+    // Index the season clubs and season players of a season created before the roster index
+    // existed. Ids already indexed are skipped, so the ids can be sent in chunks and re-sent.
+    // Returns the number of season clubs and season players added.
+    fn backfill_rosters(
+        mut self: Store, season_id: felt252, season_club_ids: Span<felt252>, season_player_ids: Span<felt252>
+    ) -> (u32, u32) {
+        let season = self.read_season(season_id);
+        season.assert_exists();
+
+        // 1. Season clubs: a season has few, so its clubs roster is read whole into a seen-set
+        let mut indexed: Felt252Dict<u8> = Default::default();
+        let clubs_roster = self.read_roster(ROSTER_SCOPE_SEASON_CLUBS, season_id);
+        for index in 0..clubs_roster.count {
+            indexed.insert(self.read_roster_entry(ROSTER_SCOPE_SEASON_CLUBS, season_id, index).member_id, 1);
+        };
+        let mut clubs_added = 0;
+        for season_club_id in season_club_ids {
+            let season_club_id = *season_club_id;
+            let season_club = self.read_season_club(season_club_id);
+            season_club.assert_exists();
+            assert(season_club.season_id == season_id, 'SeasonClub in another season');
+            if indexed.get(season_club_id) == 0 {
+                indexed.insert(season_club_id, 1);
+                self.roster_append(ROSTER_SCOPE_SEASON_CLUBS, season_id, season_club_id);
+                clubs_added += 1;
+            }
+        };
+
+        // 2. Season players: their RosterSlot tells whether they are indexed
+        let mut players_added = 0;
+        for season_player in self.read_season_players(season_player_ids) {
+            season_player.assert_exists();
+            assert(season_player.season_id == season_id, 'SeasonPlayer in another season');
+            if !self.is_season_player_indexed(@season_player) {
+                self.index_season_player(@season_player);
+                players_added += 1;
+            }
+        };
+        (clubs_added, players_added)
+    }
+
+    // Append a season player (or a season club, for ROSTER_SCOPE_SEASON_CLUBS) to a roster, returns its index
+    fn roster_append(mut self: Store, scope: u8, scope_id: felt252, member_id: felt252) -> u32 {
+        let mut roster = self.read_roster(scope, scope_id);
+        let index = roster.push();
+        self.world.write_model(@RosterEntry { scope, scope_id, index, member_id });
+        self.world.write_model(@roster);
+        index
+    }
+
+    // Remove a season player from a club roster by moving the last entry into its index
+    fn roster_remove_club_player(
+        mut self: Store, season_club_id: felt252, season_player_id: felt252, index: u32
+    ) {
+        let scope = ROSTER_SCOPE_CLUB_PLAYERS;
+        let mut roster = self.read_roster(scope, season_club_id);
+        let entry = self.read_roster_entry(scope, season_club_id, index);
+
+        // Season players created before the roster index existed have no entry to remove
+        if index >= roster.count || entry.member_id != season_player_id {
+            return;
+        }
+
+        let last_index = roster.pop();
+        let last_entry = self.read_roster_entry(scope, season_club_id, last_index);
+        if index != last_index {
+            self.world.write_model(
+                @RosterEntry { scope, scope_id: season_club_id, index, member_id: last_entry.member_id }
+            );
+            self.world.write_model(@RosterSlot { member_id: last_entry.member_id, club_index: index });
+        }
+        self.world.erase_model(@last_entry);
+        self.world.write_model(@roster);
+    }
+
+    // ========================================
+    // Fixture Operations
+    // ========================================
+
+    fn read_fixture_schedule(self: Store, season_id: felt252) -> FixtureSchedule {
+        self.world.read_model(season_id)
+    }
+
+    fn read_matchday(self: Store, season_id: felt252, matchday: u32) -> Matchday {
+        self.world.read_model((season_id, matchday))
+    }
+
+    // All fixtures of a matchday, in index order
+    fn read_matchday_fixtures(self: Store, season_id: felt252, matchday: u32) -> Array<Fixture> {
+        let header = self.read_matchday(season_id, matchday);
+        let mut keys = array![];
+        for index in 0..header.fixture_count {
+            keys.append((season_id, matchday, index));
+        };
+        self.world.read_models(keys.span())
+    }
+
+    // Generate the next `max_matchdays` matchdays of the season's double round-robin calendar,
+    // returns the number of matchdays scheduled so far. The clubs are those of the season clubs
+    // roster when the first chunk is generated; they can't change until the calendar is complete.
+    fn create_fixtures(mut self: Store, season_id: felt252, max_matchdays: u32) -> u32 {
+        assert(max_matchdays > 0, 'Invalid matchday count');
+        let season = self.read_season(season_id);
+        season.assert_exists();
+        let clubs_roster = self.read_roster(ROSTER_SCOPE_SEASON_CLUBS, season_id);
+
+        let mut schedule = self.read_fixture_schedule(season_id);
+        if schedule.matchday_count == 0 {
+            schedule = FixtureScheduleTrait::new(season_id, clubs_roster.count);
+        } else {
+            assert(!schedule.is_complete(), 'Fixtures already scheduled');
+            assert(schedule.club_count == clubs_roster.count, 'Season clubs changed');
+        }
+
+        // Season club ids by roster index, read once for the whole chunk
+        let mut keys = array![];
+        for index in 0..clubs_roster.count {
+            keys.append((ROSTER_SCOPE_SEASON_CLUBS, season_id, index));
+        };
+        let entries: Array<RosterEntry> = self.world.read_models(keys.span());
+        let clubs = entries.span();
+
+        let start_day = Timestamp::unix_timestamp_to_day(season.start_date);
+        let end_day = Timestamp::unix_timestamp_to_day(season.end_date);
+        let first = schedule.scheduled_matchdays;
+        let last = if schedule.matchday_count - first > max_matchdays {
+            first + max_matchdays
+        } else {
+            schedule.matchday_count
+        };
+
+        for matchday in first..last {
+            let mut fixture_count: u32 = 0;
+            for pair in schedule.pairings(matchday) {
+                let (home, away) = pair;
+                self.world.write_model(
+                    @Fixture {
+                        season_id,
+                        matchday,
+                        index: fixture_count,
+                        home_season_club_id: *clubs.at(home).member_id,
+                        away_season_club_id: *clubs.at(away).member_id,
+                    }
+                );
+                fixture_count += 1;
+            };
+            self.world.write_model(
+                @Matchday {
+                    season_id, matchday, day: schedule.matchday_day(matchday, start_day, end_day), fixture_count,
+                }
+            );
+        };
+
+        schedule.scheduled_matchdays = last;
+        self.world.write_model(@schedule);
+        last
+    }
+
+    // ========================================
+    // Leaderboard Operations
+    // ========================================
+
+    fn read_leaderboard(self: Store, board: u8, season_id: felt252) -> Leaderboard {
+        self.world.read_model((board, season_id))
+    }
+
+    // Ranked entries of a board, best first
+    fn read_leaderboard_entries(self: Store, board: u8, season_id: felt252) -> Array<LeaderboardEntry> {
+        let leaderboard = self.read_leaderboard(board, season_id);
+        let mut keys = array![];
+        for rank in 0..leaderboard.count {
+            keys.append((board, season_id, rank));
+        };
+        self.world.read_models(keys.span())
+    }
+
+    // Enable (size > 0), resize or disable (size 0) a board. The board starts empty and fills as
+    // matches are recorded, so enable it before the season's first match.
+    fn set_leaderboard_size(mut self: Store, board: u8, season_id: felt252, size: u32) {
+        assert(board == LEADERBOARD_CLUBS || board == LEADERBOARD_PLAYERS, 'Invalid leaderboard');
+        assert(size <= MAX_LEADERBOARD_SIZE, 'Leaderboard too large');
+        let season = self.read_season(season_id);
+        season.assert_exists();
+
+        for entry in self.read_leaderboard_entries(board, season_id) {
+            self.world.erase_model(@entry);
+        };
+        self.world.write_model(@Leaderboard { board, season_id, size, count: 0 });
+    }
+
+    // Apply new (id, score) pairs to an enabled board: the entries are read once, re-ranked in
+    // memory and only the ranks whose entry changed are written
+    fn update_leaderboard(mut self: Store, board: u8, season_id: felt252, scores: Span<(felt252, u64)>) {
+        let mut leaderboard = self.read_leaderboard(board, season_id);
+        if !leaderboard.is_enabled() {
+            return;
+        }
+
+        let entries = self.read_leaderboard_entries(board, season_id);
+        let mut current = array![];
+        for entry in entries.span() {
+            current.append((*entry.id, *entry.score));
+        };
+        let mut ranked = current.span();
+        for score in scores {
+            let (id, score) = *score;
+            ranked = leaderboard.place(ranked, id, score).span();
+        };
+
+        for rank in 0..ranked.len() {
+            let (id, score) = *ranked.at(rank);
+            let changed = if rank < entries.len() {
+                let entry = entries.at(rank);
+                *entry.id != id || *entry.score != score
+            } else {
+                true
+            };
+            if changed {
+                self.world.write_model(@LeaderboardEntry { board, season_id, rank, id, score });
+            }
+        };
+        if ranked.len() != leaderboard.count {
+            leaderboard.count = ranked.len();
+            self.world.write_model(@leaderboard);
+        }
+    }
 }
\ No newline at end of file
@@ -1,5 +1,74 @@
 // Admin system for seeding and managing game data
 
+// Models imports
+use overgoal::models::season::{Season};
+use overgoal::models::season_club::{SeasonClub};
+use overgoal::models::season_player::{SeasonPlayer, PlayerMatchDelta};
+use overgoal::models::overgoal_player::{OvergoalPlayer};
+use overgoal::models::fixture::{FixtureSchedule, Matchday, Fixture};
+use overgoal::models::leaderboard::{LeaderboardEntry};
+
+// Player record used by `seed_players_batch` (same fields as `seed_player`)
+#[derive(Copy, Drop, Serde, Debug)]
+pub struct PlayerSeed {
+    pub player_id: felt252,
+    pub user_id: felt252,
+    // Universe player attributes
+    pub body_type: u8,
+    pub skin_color: u8,
+    pub beard_type: u8,
+    pub hair_type: u8,
+    pub hair_color: u8,
+    // Overgoal player attributes
+    pub energy: u16,
+    pub speed: u16,
+    pub leadership: u16,
+    pub pass: u16,
+    pub shoot: u16,
+    pub freekick: u16,
+    pub visor_type: u8,
+    pub visor_color: u8,
+}
+
+// SeasonPlayer record used by `seed_players_batch` (same fields as `seed_season_player`)
+#[derive(Copy, Drop, Serde, Debug)]
+pub struct SeasonPlayerSeed {
+    pub season_player_id: felt252,
+    pub season_id: felt252,
+    pub season_club_id: felt252,
+    pub overgoal_player_id: felt252,
+}
+
+// SeasonClub with its Club name, returned by `get_season_snapshot`
+#[derive(Drop, Serde, Debug)]
+pub struct SeasonClubSnapshot {
+    pub season_club: SeasonClub,
+    pub club_name: ByteArray,
+}
+
+// SeasonPlayer with its OvergoalPlayer stats, returned by `get_season_snapshot`
+#[derive(Copy, Drop, Serde, Debug)]
+pub struct SeasonPlayerSnapshot {
+    pub season_player: SeasonPlayer,
+    pub overgoal_player: OvergoalPlayer,
+}
+
+// A season with all of its clubs and one page of its players
+#[derive(Drop, Serde, Debug)]
+pub struct SeasonSnapshot {
+    pub season: Season,
+    pub season_clubs: Array<SeasonClubSnapshot>,
+    pub season_players: Array<SeasonPlayerSnapshot>,   // Season roster entries offset..offset + limit
+    pub total_players: u32,                            // Size of the season roster, for paging
+}
+
+// A matchday with its fixtures, returned by `get_matchday_fixtures`
+#[derive(Drop, Serde, Debug)]
+pub struct MatchdayFixtures {
+    pub matchday: Matchday,
+    pub fixtures: Array<Fixture>,
+}
+
 #[starknet::interface]
 pub trait IAdmin<T> {
     // Seed Season 1 with initial data
@@ -36,24 +105,64 @@ pub trait IAdmin<T> {
         overgoal_player_id: felt252
     );
     
-    // Get all Season 1 data for verification
-    fn get_season_1_data(self: @T) -> (
-        // Season data
-        felt252, // season_id
-        ByteArray, // season_name
-        u64, // start_date
-        u64, // end_date
-        u128, // prize_pool
-        // Clubs data (4 clubs)
-        Span<(felt252, ByteArray)>, // (club_id, club_name)
-        // SeasonClubs data (4 season_clubs)
-        Span<felt252>, // season_club_ids
+    // Move a season player to another club of the same season (updates both club rosters)
+    fn transfer_season_player(ref self: T, season_player_id: felt252, new_season_club_id: felt252);
+    
+    // Index season clubs and season players created before the roster index existed (worlds seeded
+    // before it) in the season and club rosters. Ids already indexed are skipped, so the ids can be
+    // sent in chunks and re-sent.
+    fn backfill_rosters(
+        ref self: T, season_id: felt252, season_club_ids: Span<felt252>, season_player_ids: Span<felt252>
     );
+    
+    // Record a match between two clubs of a season (3 points for a win, 1 for a draw) and the
+    // points / relationship changes of the players who took part (one delta per player). Writes
+    // each entity once.
+    fn record_match(
+        ref self: T,
+        season_id: felt252,
+        home_season_club_id: felt252,
+        away_season_club_id: felt252,
+        home_goals: u8,
+        away_goals: u8,
+        player_deltas: Span<PlayerMatchDelta>
+    );
+    
+    // Seed many players and season players in a single transaction.
+    // Players are created first, so `season_players` may reference them.
+    fn seed_players_batch(
+        ref self: T,
+        players: Span<PlayerSeed>,
+        season_players: Span<SeasonPlayerSeed>
+    );
+    
+    // Get a season, all of its clubs (with Club names) and a page of its players
+    // (with OvergoalPlayer stats) in one call. `limit` is capped at MAX_SNAPSHOT_PAGE.
+    fn get_season_snapshot(self: @T, season_id: felt252, offset: u32, limit: u32) -> SeasonSnapshot;
+    
+    // Generate the next `max_matchdays` matchdays of the season's double round-robin calendar
+    // (call repeatedly until the schedule is complete). Returns the matchdays scheduled so far.
+    fn create_fixtures(ref self: T, season_id: felt252, max_matchdays: u32) -> u32;
+    
+    // Calendar generation progress of a season
+    fn get_fixture_schedule(self: @T, season_id: felt252) -> FixtureSchedule;
+    
+    // A matchday (day slot) and all of its fixtures
+    fn get_matchday_fixtures(self: @T, season_id: felt252, matchday: u32) -> MatchdayFixtures;
+    
+    // Enable (size > 0, at most MAX_LEADERBOARD_SIZE) or disable (size 0) the top-N cache of a
+    // season's clubs or players (LEADERBOARD_* board), kept up to date by `record_match`.
+    // Changing the size empties the board.
+    fn set_leaderboard_size(ref self: T, season_id: felt252, board: u8, size: u32);
+    
+    // Ranked entries of a board, best first (empty when disabled)
+    fn get_leaderboard(self: @T, season_id: felt252, board: u8) -> Span<LeaderboardEntry>;
 }
 
 #[dojo::contract]
 pub mod admin {
-    use super::IAdmin;
+    use super::{IAdmin, PlayerSeed, SeasonPlayerSeed, SeasonSnapshot, SeasonClubSnapshot, SeasonPlayerSnapshot};
+    use super::{MatchdayFixtures, FixtureSchedule, LeaderboardEntry};
     
     // Dojo imports
     use dojo::model::ModelStorage;
@@ -61,15 +170,18 @@ pub mod admin {
     use dojo::world::{WorldStorageTrait};
     
     // Store import
-    use overgoal::store::{StoreTrait};
+    use overgoal::store::{Store, StoreTrait};
     
     // Models imports
     use overgoal::models::club::{Club};
-    use overgoal::models::season::{Season};
-    use overgoal::models::season_club::{SeasonClub};
-    use overgoal::models::season_player::{SeasonPlayer};
+    use overgoal::models::season::{Season, AssertSeasonTrait};
+    use overgoal::models::season_club::{SeasonClub, AssertSeasonClubTrait};
+    use overgoal::models::season_player::{SeasonPlayer, PlayerMatchDelta, AssertSeasonPlayerTrait};
     use overgoal::models::overgoal_player::{OvergoalPlayer};
     
+    // Constants imports
+    use overgoal::constants::{ROSTER_SCOPE_SEASON_PLAYERS, ROSTER_SCOPE_SEASON_CLUBS, MAX_SNAPSHOT_PAGE};
+    
     // Universe contract interaction
     use overgoal::systems::overgoal_game::{IUniverseSafeDispatcher, IUniverseSafeDispatcherTrait};
     
@@ -177,55 +289,42 @@ pub mod admin {
             );
         }
         
-        fn get_season_1_data(self: @ContractState) -> (
-            felt252, // season_id
-            ByteArray, // season_name
-            u64, // start_date
-            u64, // end_date
-            u128, // prize_pool
-            Span<(felt252, ByteArray)>, // clubs
-            Span<felt252>, // season_club_ids
-        ) {
+        fn get_season_snapshot(
+            self: @ContractState, season_id: felt252, offset: u32, limit: u32
+        ) -> SeasonSnapshot {
             let world = self.world(@"overgoal");
             let store = StoreTrait::new(world);
             
-            // Read Season 1
-            let season_id: felt252 = 1;
             let season = store.read_season(season_id);
+            season.assert_exists();
             
-            // Read Clubs
-            let club_1 = store.read_club(1);
-            let club_2 = store.read_club(2);
-            let club_3 = store.read_club(3);
-            let club_4 = store.read_club(4);
+            // All season clubs, from the season clubs roster
+            let mut season_clubs = array![];
+            let clubs_roster = store.read_roster(ROSTER_SCOPE_SEASON_CLUBS, season_id);
+            for index in 0..clubs_roster.count {
+                let entry = store.read_roster_entry(ROSTER_SCOPE_SEASON_CLUBS, season_id, index);
+                let season_club = store.read_season_club(entry.member_id);
+                let club = store.read_club(season_club.club_id);
+                season_clubs.append(SeasonClubSnapshot { season_club, club_name: club.name });
+            };
             
-            let mut clubs_array = array![
-                (club_1.id, club_1.name),
-                (club_2.id, club_2.name),
-                (club_3.id, club_3.name),
-                (club_4.id, club_4.name),
-            ];
+            // One page of the season players roster
+            let players_roster = store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, season_id);
+            let limit = if limit > MAX_SNAPSHOT_PAGE { MAX_SNAPSHOT_PAGE } else { limit };
+            let start = if offset > players_roster.count { players_roster.count } else { offset };
+            let end = if players_roster.count - start > limit { start + limit } else { players_roster.count };
             
-            // Read SeasonClubs
-            let mut season_clubs_array = array![
-                101, // season_club_1_id
-                102, // season_club_2_id
-                103, // season_club_3_id
-                104, // season_club_4_id
-            ];
+            let mut season_players = array![];
+            for index in start..end {
+                let entry = store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, season_id, index);
+                let season_player = store.read_season_player(entry.member_id);
+                let overgoal_player = store.read_overgoal_player_synced(season_player.overgoal_player_id);
+                season_players.append(SeasonPlayerSnapshot { season_player, overgoal_player });
+            };
             
-            (
-                season.id,
-                season.name,
-                season.start_date,
-                season.end_date,
-                season.prize_pool,
-                clubs_array.span(),
-                season_clubs_array.span(),
-            )
+            SeasonSnapshot { season, season_clubs, season_players, total_players: players_roster.count }
         }
         
-        #[feature("safe_dispatcher")]
         fn seed_player(
             ref self: ContractState,
             player_id: felt252,
@@ -246,49 +345,27 @@ pub mod admin {
             visor_type: u8,
             visor_color: u8
         ) {
-            // Get the Universe contract address from storage
-            let universe_address = self.universe_contract_address.read();
-            
-            // Create safe dispatcher for Universe contract
-            let universe_dispatcher = IUniverseSafeDispatcher { 
-                contract_address: universe_address 
-            };
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
             
-            // Create player in Universe contract
-            let result = universe_dispatcher.create_player(
+            let seed = PlayerSeed {
                 player_id,
                 user_id,
                 body_type,
                 skin_color,
                 beard_type,
                 hair_type,
-                hair_color
-            );
-            
-            // Handle result
-            match result {
-                Result::Ok(_) => {
-                    // Universe player created successfully, now create overgoal player
-                    let mut world = self.world(@"overgoal");
-                    let store = StoreTrait::new(world);
-                    
-                    store.create_overgoal_player(
-                        player_id,
-                        player_id, // universe_player_id is same as player_id
-                        energy,
-                        speed,
-                        leadership,
-                        pass,
-                        shoot,
-                        freekick,
-                        visor_type,
-                        visor_color
-                    );
-                },
-                Result::Err(_panic_data) => {
-                    panic!("Failed to create universe player");
-                },
-            }
+                hair_color,
+                energy,
+                speed,
+                leadership,
+                pass,
+                shoot,
+                freekick,
+                visor_type,
+                visor_color,
+            };
+            self.seed_single_player(store, seed);
         }
         
         fn seed_season_player(
@@ -311,6 +388,164 @@ pub mod admin {
                 50  // fans_relationship (starting at 50)
             );
         }
+        
+        fn transfer_season_player(
+            ref self: ContractState,
+            season_player_id: felt252,
+            new_season_club_id: felt252
+        ) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            let season_player = store.read_season_player(season_player_id);
+            season_player.assert_exists();
+            let new_season_club = store.read_season_club(new_season_club_id);
+            new_season_club.assert_exists();
+            assert(new_season_club.season_id == season_player.season_id, 'SeasonClub in another season');
+            
+            store.transfer_season_player(season_player_id, new_season_club_id);
+        }
+        
+        fn backfill_rosters(
+            ref self: ContractState,
+            season_id: felt252,
+            season_club_ids: Span<felt252>,
+            season_player_ids: Span<felt252>
+        ) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.backfill_rosters(season_id, season_club_ids, season_player_ids);
+        }
+        
+        fn record_match(
+            ref self: ContractState,
+            season_id: felt252,
+            home_season_club_id: felt252,
+            away_season_club_id: felt252,
+            home_goals: u8,
+            away_goals: u8,
+            player_deltas: Span<PlayerMatchDelta>
+        ) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.record_match(
+                season_id, home_season_club_id, away_season_club_id, home_goals, away_goals, player_deltas
+            );
+        }
+        
+        fn seed_players_batch(
+            ref self: ContractState,
+            players: Span<PlayerSeed>,
+            season_players: Span<SeasonPlayerSeed>
+        ) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            // 1. Universe + Overgoal players
+            for seed in players {
+                self.seed_single_player(store, *seed);
+            };
+            
+            // 2. Season players with default relationship values
+            for seed in season_players {
+                store.create_season_player(
+                    *seed.season_player_id,
+                    *seed.season_id,
+                    *seed.season_club_id,
+                    *seed.overgoal_player_id,
+                    50, // team_relationship (starting at 50)
+                    50  // fans_relationship (starting at 50)
+                );
+            };
+        }
+        
+        fn create_fixtures(ref self: ContractState, season_id: felt252, max_matchdays: u32) -> u32 {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.create_fixtures(season_id, max_matchdays)
+        }
+        
+        fn get_fixture_schedule(self: @ContractState, season_id: felt252) -> FixtureSchedule {
+            let world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.read_fixture_schedule(season_id)
+        }
+        
+        fn get_matchday_fixtures(self: @ContractState, season_id: felt252, matchday: u32) -> MatchdayFixtures {
+            let world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            MatchdayFixtures {
+                matchday: store.read_matchday(season_id, matchday),
+                fixtures: store.read_matchday_fixtures(season_id, matchday),
+            }
+        }
+        
+        fn set_leaderboard_size(ref self: ContractState, season_id: felt252, board: u8, size: u32) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.set_leaderboard_size(board, season_id, size);
+        }
+        
+        fn get_leaderboard(self: @ContractState, season_id: felt252, board: u8) -> Span<LeaderboardEntry> {
+            let world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.read_leaderboard_entries(board, season_id).span()
+        }
+    }
+    
+    #[generate_trait]
+    impl InternalImpl of InternalTrait {
+        // Create the UniversePlayer through the Universe contract, then the OvergoalPlayer
+        #[feature("safe_dispatcher")]
+        fn seed_single_player(self: @ContractState, store: Store, seed: PlayerSeed) {
+            // Get the Universe contract address from storage
+            let universe_address = self.universe_contract_address.read();
+            
+            // Create safe dispatcher for Universe contract
+            let universe_dispatcher = IUniverseSafeDispatcher { 
+                contract_address: universe_address 
+            };
+            
+            // Create player in Universe contract
+            let result = universe_dispatcher.create_player(
+                seed.player_id,
+                seed.user_id,
+                seed.body_type,
+                seed.skin_color,
+                seed.beard_type,
+                seed.hair_type,
+                seed.hair_color
+            );
+            
+            // Handle result
+            match result {
+                Result::Ok(_) => {
+                    // Universe player created successfully, now create overgoal player
+                    store.create_overgoal_player(
+                        seed.player_id,
+                        seed.player_id, // universe_player_id is same as player_id
+                        seed.energy,
+                        seed.speed,
+                        seed.leadership,
+                        seed.pass,
+                        seed.shoot,
+                        seed.freekick,
+                        seed.visor_type,
+                        seed.visor_color
+                    );
+                },
+                Result::Err(_panic_data) => {
+                    panic!("Failed to create universe player");
+                },
+            }
+        }
     }
 }
 
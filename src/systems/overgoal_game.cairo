@@ -1,3 +1,7 @@
+// Models imports
+use overgoal::models::overgoal_player::{OvergoalPlayer};
+use overgoal::models::season_player::{SeasonPlayer};
+
 // Interface definition for Overgoal Game System
 #[starknet::interface]
 pub trait IOvergoalGame<T> {
@@ -55,6 +59,10 @@ pub trait IOvergoalGame<T> {
     // Spend currency from overgoal player
     fn spend_goal_currency(ref self: T, overgoal_player_id: felt252, amount: u128);
     
+    // Apply (overgoal_player_id, signed amount) currency changes in one transaction: changes of the
+    // same player are netted and the whole batch reverts if any balance would go negative
+    fn apply_currency_deltas(ref self: T, deltas: Span<(felt252, i128)>);
+    
     // Set injury status
     fn set_injury_status(ref self: T, overgoal_player_id: felt252, is_injured: bool);
     
@@ -65,6 +73,14 @@ pub trait IOvergoalGame<T> {
         user_id: felt252,
         club_id: felt252
     );
+    
+    // Get many OvergoalPlayers in one call, in the order of `ids`.
+    // Missing ids come back as zeroed entries (id 0), so existence is explicit.
+    // Energy is returned as regenerated up to the current block.
+    fn get_overgoal_players(self: @T, ids: Span<felt252>) -> Span<OvergoalPlayer>;
+    
+    // Get many SeasonPlayers in one call, zeroed entries for missing ids
+    fn get_season_players(self: @T, ids: Span<felt252>) -> Span<SeasonPlayer>;
 }
 
 // Interface for Universe contract (for safe cross-contract calls)
@@ -85,7 +101,7 @@ pub trait IUniverse<T> {
 
 #[dojo::contract]
 pub mod overgoal_game {
-    use super::{IOvergoalGame};
+    use super::{IOvergoalGame, OvergoalPlayer, SeasonPlayer};
     use super::{IUniverseSafeDispatcher, IUniverseSafeDispatcherTrait};
     
     // Store import
@@ -108,7 +124,7 @@ pub mod overgoal_game {
         universe_contract_address: starknet::ContractAddress,
     }
     
-    // Events removed for simplicity - can be added later if needed
+    // Model change events are emitted by the Store (see overgoal::events)
     
     // Constructor
     fn dojo_init(ref self: ContractState, universe_address: starknet::ContractAddress) {
@@ -255,6 +271,13 @@ pub mod overgoal_game {
             store.spend_overgoal_player_currency(overgoal_player_id, amount);
         }
         
+        fn apply_currency_deltas(ref self: ContractState, deltas: Span<(felt252, i128)>) {
+            let mut world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.apply_currency_deltas(deltas);
+        }
+        
         fn set_injury_status(ref self: ContractState, overgoal_player_id: felt252, is_injured: bool) {
             let mut world = self.world(@"overgoal");
             let store = StoreTrait::new(world);
@@ -312,6 +335,20 @@ pub mod overgoal_game {
                 },
             }
         }
+        
+        fn get_overgoal_players(self: @ContractState, ids: Span<felt252>) -> Span<OvergoalPlayer> {
+            let world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.read_overgoal_players_synced(ids).span()
+        }
+        
+        fn get_season_players(self: @ContractState, ids: Span<felt252>) -> Span<SeasonPlayer> {
+            let world = self.world(@"overgoal");
+            let store = StoreTrait::new(world);
+            
+            store.read_season_players(ids).span()
+        }
     }
     
 }
@@ -0,0 +1,27 @@
+// Test doubles shared by the test modules.
+
+// Empty Universe contract: the cross-contract calls of the admin and overgoal_game systems
+// succeed without creating anything in a Universe world.
+#[starknet::contract]
+pub mod mock_universe {
+    use overgoal::systems::overgoal_game::IUniverse;
+
+    #[storage]
+    struct Storage {}
+
+    #[abi(embed_v0)]
+    impl UniverseImpl of IUniverse<ContractState> {
+        fn create_player(
+            ref self: ContractState,
+            player_id: felt252,
+            user_id: felt252,
+            body_type: u8,
+            skin_color: u8,
+            beard_type: u8,
+            hair_type: u8,
+            hair_color: u8
+        ) {}
+
+        fn assign_user(ref self: ContractState, player_id: felt252, user_id: felt252) {}
+    }
+}
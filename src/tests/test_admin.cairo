@@ -1,7 +1,9 @@
 #[cfg(test)]
 mod tests {
     // Starknet imports
-    use starknet::{ContractAddress, contract_address_const, testing::{set_block_timestamp, set_caller_address}};
+    use starknet::{
+        ContractAddress, SyscallResultTrait, contract_address_const, testing::{set_block_timestamp, set_caller_address}
+    };
     
     // Dojo imports
     use dojo::world::{WorldStorage, WorldStorageTrait};
@@ -15,11 +17,41 @@ mod tests {
     use overgoal::store::{StoreTrait};
     use overgoal::models::club::{m_Club, Club};
     use overgoal::models::season::{m_Season, Season};
-    use overgoal::models::season_club::{m_SeasonClub, SeasonClub};
-    use overgoal::systems::admin::{admin, IAdminDispatcher, IAdminDispatcherTrait};
+    use overgoal::models::season_club::{m_SeasonClub, SeasonClub, SeasonClubTrait};
+    use overgoal::models::season_player::{m_SeasonPlayer, SeasonPlayerTrait, PlayerMatchDelta};
+    use overgoal::models::overgoal_player::{m_OvergoalPlayer};
+    use overgoal::models::roster::{m_Roster, m_RosterEntry, m_RosterSlot};
+    use overgoal::models::fixture::{m_FixtureSchedule, m_Matchday, m_Fixture};
+    use overgoal::models::leaderboard::{m_Leaderboard, m_LeaderboardEntry, leaderboard_score};
+    use overgoal::events::{
+        e_OvergoalPlayerCreated, e_OvergoalPlayerUpdated, e_GoalCurrencyChanged, e_SeasonPlayerCreated,
+        e_SeasonPlayerTransferred, e_SeasonPlayerPointsAdded, e_SeasonPlayerMatchRecorded,
+        e_SeasonPlayerRelationshipsChanged, e_SeasonClubMatchRecorded,
+    };
+    use overgoal::constants::{
+        ROSTER_SCOPE_SEASON_PLAYERS, ROSTER_SCOPE_CLUB_PLAYERS, ROSTER_SCOPE_SEASON_CLUBS, LEADERBOARD_CLUBS,
+        LEADERBOARD_PLAYERS,
+    };
+    use overgoal::systems::admin::{
+        admin, IAdminDispatcher, IAdminDispatcherTrait, PlayerSeed, SeasonPlayerSeed
+    };
+    use overgoal::tests::mocks::mock_universe;
 
     // Helper function to set up the test world
     fn setup() -> (WorldStorage, IAdminDispatcher, ContractAddress) {
+        // Dummy Universe contract address for testing (admin won't actually call it in these tests)
+        setup_with_universe(contract_address_const::<0x999>())
+    }
+    
+    // Same world with the empty mock Universe contract deployed
+    fn setup_with_mock_universe() -> (WorldStorage, IAdminDispatcher, ContractAddress) {
+        let (universe_address, _) = starknet::syscalls::deploy_syscall(
+            mock_universe::TEST_CLASS_HASH.try_into().unwrap(), 0, array![].span(), false
+        ).unwrap_syscall();
+        setup_with_universe(universe_address)
+    }
+    
+    fn setup_with_universe(universe_address: ContractAddress) -> (WorldStorage, IAdminDispatcher, ContractAddress) {
         // Set caller address
         let caller = contract_address_const::<0x1337>();
         
@@ -30,6 +62,25 @@ mod tests {
                 TestResource::Model(m_Club::TEST_CLASS_HASH),
                 TestResource::Model(m_Season::TEST_CLASS_HASH),
                 TestResource::Model(m_SeasonClub::TEST_CLASS_HASH),
+                TestResource::Model(m_SeasonPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_OvergoalPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_Roster::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterEntry::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterSlot::TEST_CLASS_HASH),
+                TestResource::Model(m_FixtureSchedule::TEST_CLASS_HASH),
+                TestResource::Model(m_Matchday::TEST_CLASS_HASH),
+                TestResource::Model(m_Fixture::TEST_CLASS_HASH),
+                TestResource::Model(m_Leaderboard::TEST_CLASS_HASH),
+                TestResource::Model(m_LeaderboardEntry::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerUpdated::TEST_CLASS_HASH),
+                TestResource::Event(e_GoalCurrencyChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerTransferred::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerPointsAdded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerMatchRecorded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerRelationshipsChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonClubMatchRecorded::TEST_CLASS_HASH),
                 TestResource::Contract(admin::TEST_CLASS_HASH),
             ].span()
         };
@@ -37,13 +88,10 @@ mod tests {
         // Spawn test world
         let mut world = spawn_test_world(dojo::world::world::TEST_CLASS_HASH, array![ndef].span());
         
-        // Dummy Universe contract address for testing (admin won't actually call it in these tests)
-        let dummy_universe_address = contract_address_const::<0x999>();
-        
         world.sync_perms_and_inits(array![
             ContractDefTrait::new(@"overgoal", @"admin")
                 .with_writer_of([dojo::utils::bytearray_hash(@"overgoal")].span())
-                .with_init_calldata(array![dummy_universe_address.into()].span())
+                .with_init_calldata(array![universe_address.into()].span())
         ].span());
         
         // Get the admin contract dispatcher
@@ -124,55 +172,66 @@ mod tests {
 
     #[test]
     #[available_gas(100000000)]
-    fn test_get_season_1_data() {
-        let (mut world, admin_system, _caller) = setup();
+    fn test_get_season_snapshot() {
+        let (mut _world, admin_system, _caller) = setup();
         
-        // Seed Season 1
         admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 103, 2);
         
-        // Get Season 1 data
-        let (
-            season_id,
-            season_name,
-            start_date,
-            end_date,
-            prize_pool,
-            clubs,
-            season_clubs
-        ) = admin_system.get_season_1_data();
+        let snapshot = admin_system.get_season_snapshot(1, 0, 10);
         
         // Verify Season data
-        assert(season_id == 1, 'Season ID should be 1');
-        assert(season_name == "Season 0: Where everything starts", 'Season name mismatch');
-        assert(start_date == 1700352000, 'Start date mismatch');
-        assert(end_date == 1701993599, 'End date mismatch');
-        assert(prize_pool == 0, 'Prize pool should be 0');
-        
-        // Verify Clubs data
-        assert(clubs.len() == 4, 'Should have 4 clubs');
+        assert(snapshot.season.id == 1, 'Season ID should be 1');
+        assert(snapshot.season.name == "Season 0: Where everything starts", 'Season name mismatch');
+        assert(snapshot.season.start_date == 1700352000, 'Start date mismatch');
+        assert(snapshot.season.end_date == 1701993599, 'End date mismatch');
+        
+        // Verify SeasonClubs come with their Club names
+        assert(snapshot.season_clubs.len() == 4, 'Should have 4 season_clubs');
+        assert(*snapshot.season_clubs.at(0).season_club.id == 101, 'SeasonClub 1 ID mismatch');
+        assert(*snapshot.season_clubs.at(0).season_club.club_id == 1, 'SeasonClub 1 club_id');
+        assert(snapshot.season_clubs.at(0).club_name == @"Cartridge Athletic", 'Club 1 name mismatch');
+        assert(*snapshot.season_clubs.at(3).season_club.id == 104, 'SeasonClub 4 ID mismatch');
+        assert(snapshot.season_clubs.at(3).club_name == @"Drakon Core", 'Club 4 name mismatch');
+        
+        // Verify SeasonPlayers
+        assert(snapshot.total_players == 2, 'Should have 2 season players');
+        assert(snapshot.season_players.len() == 2, 'Page should hold 2 players');
+        assert(*snapshot.season_players.at(0).season_player.id == 10001, 'SP 1 ID mismatch');
+        assert(*snapshot.season_players.at(1).season_player.season_club_id == 103, 'SP 2 club mismatch');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_get_season_snapshot_pages() {
+        let (mut _world, admin_system, _caller) = setup();
         
-        let club_1 = clubs.at(0);
-        let (club_1_id, _club_1_name) = club_1;
-        assert(*club_1_id == 1, 'Club 1 ID mismatch');
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 102, 2);
+        admin_system.seed_season_player(10003, 1, 103, 3);
         
-        let club_2 = clubs.at(1);
-        let (club_2_id, _club_2_name) = club_2;
-        assert(*club_2_id == 2, 'Club 2 ID mismatch');
+        let first = admin_system.get_season_snapshot(1, 0, 2);
+        assert(first.season_players.len() == 2, 'First page should hold 2');
+        assert(*first.season_players.at(1).season_player.id == 10002, 'First page last entry');
         
-        let club_3 = clubs.at(2);
-        let (club_3_id, _club_3_name) = club_3;
-        assert(*club_3_id == 3, 'Club 3 ID mismatch');
+        let second = admin_system.get_season_snapshot(1, 2, 2);
+        assert(second.season_players.len() == 1, 'Second page should hold 1');
+        assert(*second.season_players.at(0).season_player.id == 10003, 'Second page entry');
+        assert(second.total_players == 3, 'Total should be 3');
         
-        let club_4 = clubs.at(3);
-        let (club_4_id, _club_4_name) = club_4;
-        assert(*club_4_id == 4, 'Club 4 ID mismatch');
+        let past_end = admin_system.get_season_snapshot(1, 5, 2);
+        assert(past_end.season_players.len() == 0, 'Past the end should be empty');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic]
+    fn test_get_season_snapshot_unknown_season() {
+        let (mut _world, admin_system, _caller) = setup();
         
-        // Verify SeasonClubs data
-        assert(season_clubs.len() == 4, 'Should have 4 season_clubs');
-        assert(*season_clubs.at(0) == 101, 'SeasonClub 1 ID mismatch');
-        assert(*season_clubs.at(1) == 102, 'SeasonClub 2 ID mismatch');
-        assert(*season_clubs.at(2) == 103, 'SeasonClub 3 ID mismatch');
-        assert(*season_clubs.at(3) == 104, 'SeasonClub 4 ID mismatch');
+        admin_system.get_season_snapshot(2, 0, 10);
     }
 
     #[test]
@@ -210,5 +269,458 @@ mod tests {
         assert(season_club_104.manager_id == 0, 'Manager should be 0');
         assert(season_club_104.season_points == 0, 'Points should be 0');
     }
-}
 
+    #[test]
+    #[available_gas(100000000)]
+    fn test_seed_players_batch_season_players() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        
+        // Only season players: the dummy Universe contract can't create players
+        let season_players = array![
+            SeasonPlayerSeed {
+                season_player_id: 10001, season_id: 1, season_club_id: 101, overgoal_player_id: 1
+            },
+            SeasonPlayerSeed {
+                season_player_id: 10002, season_id: 1, season_club_id: 102, overgoal_player_id: 2
+            },
+            SeasonPlayerSeed {
+                season_player_id: 10003, season_id: 1, season_club_id: 104, overgoal_player_id: 3
+            },
+        ];
+        admin_system.seed_players_batch(array![].span(), season_players.span());
+        
+        let store = StoreTrait::new(world);
+        
+        let season_player_1 = store.read_season_player(10001);
+        assert(season_player_1.season_id == 1, 'SP 1 season_id');
+        assert(season_player_1.season_club_id == 101, 'SP 1 season_club_id');
+        assert(season_player_1.overgoal_player_id == 1, 'SP 1 player id');
+        assert(season_player_1.team_relationship == 50, 'SP 1 team rel should be 50');
+        assert(season_player_1.fans_relationship == 50, 'SP 1 fans rel should be 50');
+        
+        let season_player_2 = store.read_season_player(10002);
+        assert(season_player_2.season_club_id == 102, 'SP 2 season_club_id');
+        
+        let season_player_3 = store.read_season_player(10003);
+        assert(season_player_3.season_club_id == 104, 'SP 3 season_club_id');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic]
+    fn test_seed_players_batch_duplicate_reverts_whole_batch() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        
+        let season_players = array![
+            SeasonPlayerSeed {
+                season_player_id: 10001, season_id: 1, season_club_id: 101, overgoal_player_id: 1
+            },
+            SeasonPlayerSeed {
+                season_player_id: 10001, season_id: 1, season_club_id: 102, overgoal_player_id: 1
+            },
+        ];
+        admin_system.seed_players_batch(array![].span(), season_players.span());
+    }
+
+    fn player_seed(player_id: felt252) -> PlayerSeed {
+        PlayerSeed {
+            player_id,
+            user_id: player_id,
+            body_type: 0,
+            skin_color: 0,
+            beard_type: 1,
+            hair_type: 0,
+            hair_color: 0,
+            energy: 49,
+            speed: 51,
+            leadership: 46,
+            pass: 49,
+            shoot: 49,
+            freekick: 49,
+            visor_type: 2,
+            visor_color: 0,
+        }
+    }
+
+    #[test]
+    #[available_gas(300000000)]
+    fn test_seed_players_batch_creates_players_and_season_players() {
+        let (mut world, admin_system, _caller) = setup_with_mock_universe();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_players_batch(
+            array![player_seed(1), player_seed(2), player_seed(3)].span(),
+            array![
+                SeasonPlayerSeed { season_player_id: 10001, season_id: 1, season_club_id: 101, overgoal_player_id: 1 },
+                SeasonPlayerSeed { season_player_id: 10002, season_id: 1, season_club_id: 102, overgoal_player_id: 2 },
+            ].span()
+        );
+        
+        let store = StoreTrait::new(world);
+        
+        // OvergoalPlayers with the seeded stats
+        let player_1 = store.read_overgoal_player_from_id(1);
+        assert(player_1.universe_player_id == 1, 'Player 1 universe id');
+        assert(player_1.energy == 49, 'Player 1 energy');
+        assert(player_1.speed == 51, 'Player 1 speed');
+        assert(player_1.leadership == 46, 'Player 1 leadership');
+        assert(player_1.visor_type == 2, 'Player 1 visor type');
+        assert(player_1.goal_currency == 0, 'Player 1 currency');
+        assert(store.overgoal_player_exists(2), 'Player 2 should exist');
+        assert(store.overgoal_player_exists(3), 'Player 3 should exist');
+        assert(!store.overgoal_player_exists(4), 'Player 4 should not exist');
+        
+        // SeasonPlayers with the default relationships, indexed in the rosters
+        let season_player_1 = store.read_season_player(10001);
+        assert(season_player_1.season_id == 1, 'SP 1 season_id');
+        assert(season_player_1.season_club_id == 101, 'SP 1 season_club_id');
+        assert(season_player_1.overgoal_player_id == 1, 'SP 1 player id');
+        assert(season_player_1.team_relationship == 50, 'SP 1 team rel should be 50');
+        assert(season_player_1.fans_relationship == 50, 'SP 1 fans rel should be 50');
+        assert(store.read_season_player(10002).season_club_id == 102, 'SP 2 season_club_id');
+        assert(!store.season_player_exists(10003), 'SP 3 should not exist');
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1).count == 2, 'Season roster count');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_seed_season_player_indexes_rosters() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 101, 2);
+        admin_system.seed_season_player(10003, 1, 102, 3);
+        
+        let store = StoreTrait::new(world);
+        
+        // Season roster lists every season player in creation order
+        let season_roster = store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1);
+        assert(season_roster.count == 3, 'Season roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 0).member_id == 10001, 'Season entry 0');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 1).member_id == 10002, 'Season entry 1');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 2).member_id == 10003, 'Season entry 2');
+        
+        // Club rosters only list their own players
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 101).count == 2, 'Club 101 roster count');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 102).count == 1, 'Club 102 roster count');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 103).count == 0, 'Club 103 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 102, 0).member_id == 10003, 'Club 102 entry 0');
+        assert(store.read_roster_slot(10002).club_index == 1, 'SP 2 club index');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_transfer_season_player_updates_rosters() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 101, 2);
+        admin_system.seed_season_player(10003, 1, 101, 3);
+        
+        // Move the first player: the last entry of club 101 takes its index
+        admin_system.transfer_season_player(10001, 102);
+        
+        let store = StoreTrait::new(world);
+        assert(store.read_season_player(10001).season_club_id == 102, 'SP 1 should be in 102');
+        
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 101).count == 2, 'Club 101 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 101, 0).member_id == 10003, 'Club 101 entry 0');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 101, 1).member_id == 10002, 'Club 101 entry 1');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 101, 2).member_id == 0, 'Old last entry erased');
+        assert(store.read_roster_slot(10003).club_index == 0, 'SP 3 club index');
+        
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 102).count == 1, 'Club 102 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 102, 0).member_id == 10001, 'Club 102 entry 0');
+        assert(store.read_roster_slot(10001).club_index == 0, 'SP 1 club index');
+        
+        // The season roster is unchanged by transfers
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1).count == 3, 'Season roster count');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic]
+    fn test_transfer_season_player_unknown_club() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.transfer_season_player(10001, 999);
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic(expected: ('SeasonPlayer does not exist', 'ENTRYPOINT_FAILED'))]
+    fn test_transfer_season_player_unknown_player() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.transfer_season_player(10001, 102);
+    }
+
+    // Season club and season players written without the roster index, as on worlds seeded before it
+    fn write_legacy_records(ref world: WorldStorage) {
+        world.write_model_test(@SeasonClubTrait::new(105, 1, 1, 0, 0, 0, 0, 0, 0));
+        world.write_model_test(@SeasonPlayerTrait::new(20001, 1, 101, 1, 50, 50));
+        world.write_model_test(@SeasonPlayerTrait::new(20002, 1, 105, 2, 50, 50));
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_backfill_rosters_indexes_legacy_records() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        write_legacy_records(ref world);
+        
+        // Already indexed and repeated ids are skipped
+        admin_system.backfill_rosters(1, array![101, 105, 105].span(), array![10001, 20001, 20002, 20001].span());
+        
+        let store = StoreTrait::new(world);
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_CLUBS, 1).count == 5, 'Season clubs roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_CLUBS, 1, 4).member_id == 105, 'Season club 105 entry');
+        
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1).count == 3, 'Season roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 1).member_id == 20001, 'Season entry 1');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 2).member_id == 20002, 'Season entry 2');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 101).count == 2, 'Club 101 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 101, 1).member_id == 20001, 'Club 101 entry 1');
+        assert(store.read_roster_slot(20001).club_index == 1, 'SP 20001 club index');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 105).count == 1, 'Club 105 roster count');
+        
+        // A second pass changes nothing
+        admin_system.backfill_rosters(1, array![105].span(), array![20001, 20002].span());
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_CLUBS, 1).count == 5, 'Season clubs count after rerun');
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1).count == 3, 'Season count after rerun');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_transfer_legacy_season_player_indexes_rosters() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        write_legacy_records(ref world);
+        
+        admin_system.transfer_season_player(20001, 102);
+        
+        let store = StoreTrait::new(world);
+        assert(store.read_season_player(20001).season_club_id == 102, 'SP 20001 should be in 102');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 101).count == 1, 'Club 101 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 101, 0).member_id == 10001, 'Club 101 entry 0');
+        assert(store.read_roster(ROSTER_SCOPE_CLUB_PLAYERS, 102).count == 1, 'Club 102 roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_CLUB_PLAYERS, 102, 0).member_id == 20001, 'Club 102 entry 0');
+        
+        // Indexed in the season roster too, so both indexes stay in step
+        assert(store.read_roster(ROSTER_SCOPE_SEASON_PLAYERS, 1).count == 2, 'Season roster count');
+        assert(store.read_roster_entry(ROSTER_SCOPE_SEASON_PLAYERS, 1, 1).member_id == 20001, 'Season entry 1');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_record_match_home_win() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 102, 2);
+        
+        let deltas = array![
+            PlayerMatchDelta {
+                season_player_id: 10001, points: 5, team_relationship_change: 10, fans_relationship_change: -20
+            },
+            PlayerMatchDelta {
+                season_player_id: 10002, points: 1, team_relationship_change: -5, fans_relationship_change: 0
+            },
+        ];
+        admin_system.record_match(1, 101, 102, 2, 1, deltas.span());
+        
+        let store = StoreTrait::new(world);
+        
+        // Clubs: 3 points for the win
+        let home = store.read_season_club(101);
+        assert(home.matches_won == 1, 'Home should have won');
+        assert(home.season_points == 3, 'Home should have 3 points');
+        let away = store.read_season_club(102);
+        assert(away.matches_lost == 1, 'Away should have lost');
+        assert(away.season_points == 0, 'Away should have 0 points');
+        
+        // Players follow their club's result
+        let home_player = store.read_season_player(10001);
+        assert(home_player.matches_won == 1, 'Home player should have won');
+        assert(home_player.season_points == 5, 'Home player points');
+        assert(home_player.team_relationship == 60, 'Home player team rel');
+        assert(home_player.fans_relationship == 30, 'Home player fans rel');
+        
+        let away_player = store.read_season_player(10002);
+        assert(away_player.matches_lost == 1, 'Away player should have lost');
+        assert(away_player.season_points == 1, 'Away player points');
+        assert(away_player.team_relationship == 45, 'Away player team rel');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_record_match_draw() {
+        let (mut world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 103, 1);
+        
+        let deltas = array![
+            PlayerMatchDelta {
+                season_player_id: 10001, points: 2, team_relationship_change: 0, fans_relationship_change: 0
+            },
+        ];
+        admin_system.record_match(1, 103, 104, 0, 0, deltas.span());
+        
+        let store = StoreTrait::new(world);
+        assert(store.read_season_club(103).matches_drawn == 1, 'Home should have drawn');
+        assert(store.read_season_club(103).season_points == 1, 'Home should have 1 point');
+        assert(store.read_season_club(104).season_points == 1, 'Away should have 1 point');
+        
+        // A draw is neither a win nor a loss for the players
+        let player = store.read_season_player(10001);
+        assert(player.matches_won == 0 && player.matches_lost == 0, 'Draw is not a win or loss');
+        assert(player.season_points == 2, 'Player points');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic]
+    fn test_record_match_player_not_in_match() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 103, 1);
+        
+        let deltas = array![
+            PlayerMatchDelta {
+                season_player_id: 10001, points: 0, team_relationship_change: 0, fans_relationship_change: 0
+            },
+        ];
+        admin_system.record_match(1, 101, 102, 1, 0, deltas.span());
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic(expected: ('Duplicate player delta', 'ENTRYPOINT_FAILED'))]
+    fn test_record_match_duplicate_player_delta() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        
+        let delta = PlayerMatchDelta {
+            season_player_id: 10001, points: 2, team_relationship_change: 0, fans_relationship_change: 0
+        };
+        admin_system.record_match(1, 101, 102, 1, 0, array![delta, delta].span());
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_create_fixtures_in_chunks() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        
+        // 4 clubs: 6 matchdays of 2 fixtures, generated in two chunks
+        assert(admin_system.create_fixtures(1, 4) == 4, 'First chunk should stop at 4');
+        let schedule = admin_system.get_fixture_schedule(1);
+        assert(schedule.club_count == 4, 'Should have 4 clubs');
+        assert(schedule.matchday_count == 6, 'Should have 6 matchdays');
+        assert(schedule.scheduled_matchdays == 4, 'Should have 4 scheduled');
+        assert(admin_system.create_fixtures(1, 4) == 6, 'Second chunk should finish');
+        
+        // Every club plays once per matchday
+        for matchday in 0..6_u32 {
+            let listed = admin_system.get_matchday_fixtures(1, matchday);
+            assert(listed.matchday.fixture_count == 2, 'Should have 2 fixtures');
+            assert(listed.fixtures.len() == 2, 'Should list 2 fixtures');
+            let first = *listed.fixtures.at(0);
+            let second = *listed.fixtures.at(1);
+            assert(
+                first.home_season_club_id + first.away_season_club_id + second.home_season_club_id
+                    + second.away_season_club_id == 101 + 102 + 103 + 104,
+                'Each club should play once'
+            );
+        };
+        
+        // Matchdays spread over the 19 days of the season (days 19680..19698)
+        assert(admin_system.get_matchday_fixtures(1, 0).matchday.day == 19680, 'Matchday 0 on start day');
+        assert(admin_system.get_matchday_fixtures(1, 1).matchday.day == 19683, 'Matchday 1 day');
+        assert(admin_system.get_matchday_fixtures(1, 5).matchday.day == 19695, 'Matchday 5 day');
+        
+        // The second half mirrors the first
+        let first_leg = *admin_system.get_matchday_fixtures(1, 0).fixtures.at(0);
+        let second_leg = *admin_system.get_matchday_fixtures(1, 3).fixtures.at(0);
+        assert(first_leg.home_season_club_id == second_leg.away_season_club_id, 'Second leg swaps home');
+        assert(first_leg.away_season_club_id == second_leg.home_season_club_id, 'Second leg swaps away');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    #[should_panic]
+    fn test_create_fixtures_already_scheduled() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.create_fixtures(1, 6);
+        admin_system.create_fixtures(1, 1);
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_record_match_updates_leaderboards() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.seed_season_player(10001, 1, 101, 1);
+        admin_system.seed_season_player(10002, 1, 102, 2);
+        admin_system.set_leaderboard_size(1, LEADERBOARD_CLUBS, 3);
+        admin_system.set_leaderboard_size(1, LEADERBOARD_PLAYERS, 10);
+        
+        let deltas = array![
+            PlayerMatchDelta {
+                season_player_id: 10001, points: 2, team_relationship_change: 0, fans_relationship_change: 0
+            },
+            PlayerMatchDelta {
+                season_player_id: 10002, points: 5, team_relationship_change: 0, fans_relationship_change: 0
+            },
+        ];
+        admin_system.record_match(1, 101, 102, 2, 1, deltas.span());
+        admin_system.record_match(1, 103, 104, 0, 0, array![].span());
+        
+        // 101 won (3 pts), then the 103 / 104 draw (1 pt each) ranks ahead of 102's loss;
+        // the board keeps 3 entries
+        let clubs = admin_system.get_leaderboard(1, LEADERBOARD_CLUBS);
+        assert(clubs.len() == 3, 'Should keep 3 clubs');
+        assert(*clubs.at(0).id == 101, '101 should be first');
+        assert(*clubs.at(0).score == leaderboard_score(3, 1), '101 score');
+        assert(*clubs.at(1).id == 103 && *clubs.at(2).id == 104, 'Drawn clubs next');
+        
+        // Player points decide, whatever the club result
+        let players = admin_system.get_leaderboard(1, LEADERBOARD_PLAYERS);
+        assert(players.len() == 2, 'Should rank 2 players');
+        assert(*players.at(0).id == 10002, '10002 should be first');
+        assert(*players.at(1).id == 10001, '10001 should be second');
+    }
+
+    #[test]
+    #[available_gas(100000000)]
+    fn test_leaderboard_disabled_by_default() {
+        let (mut _world, admin_system, _caller) = setup();
+        
+        admin_system.seed_season_1();
+        admin_system.record_match(1, 101, 102, 1, 0, array![].span());
+        
+        assert(admin_system.get_leaderboard(1, LEADERBOARD_CLUBS).len() == 0, 'Board should stay empty');
+    }
+}
@@ -5,6 +5,7 @@ mod tests {
     
     // Dojo imports
     use dojo::world::{WorldStorage, WorldStorageTrait};
+    use dojo::model::ModelStorageTest;
     use dojo_cairo_test::{
         spawn_test_world, NamespaceDef, TestResource, ContractDefTrait,
         WorldStorageTestTrait
@@ -12,10 +13,18 @@ mod tests {
     
     // Internal imports
     use overgoal::store::{StoreTrait};
-    use overgoal::models::overgoal_player::{m_OvergoalPlayer};
+    use overgoal::models::overgoal_player::{m_OvergoalPlayer, OvergoalPlayer};
+    use overgoal::models::season_player::{m_SeasonPlayer, SeasonPlayer};
+    use overgoal::models::roster::{m_Roster, m_RosterEntry, m_RosterSlot};
+    use overgoal::events::{
+        e_OvergoalPlayerCreated, e_OvergoalPlayerUpdated, e_GoalCurrencyChanged, e_SeasonPlayerCreated,
+        e_SeasonPlayerTransferred, e_SeasonPlayerPointsAdded, e_SeasonPlayerMatchRecorded,
+        e_SeasonPlayerRelationshipsChanged, e_SeasonClubMatchRecorded,
+    };
     use overgoal::systems::overgoal_game::{
         overgoal_game, IOvergoalGameDispatcher, IOvergoalGameDispatcherTrait
     };
+    use overgoal::constants::{MAX_ENERGY, ENERGY_REGEN_AMOUNT, ENERGY_REGEN_PERIOD};
     
     
     // Helper function to set up the test world (simple setup without Universe)
@@ -28,6 +37,19 @@ mod tests {
             namespace: "overgoal",
             resources: [
                 TestResource::Model(m_OvergoalPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_SeasonPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_Roster::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterEntry::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterSlot::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerUpdated::TEST_CLASS_HASH),
+                TestResource::Event(e_GoalCurrencyChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerTransferred::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerPointsAdded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerMatchRecorded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerRelationshipsChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonClubMatchRecorded::TEST_CLASS_HASH),
                 TestResource::Contract(overgoal_game::TEST_CLASS_HASH),
             ].span()
         };
@@ -295,5 +317,137 @@ mod tests {
             club_id
         );
     }
+    
+    #[test]
+    #[available_gas(30000000)]
+    fn test_get_overgoal_players() {
+        let (mut _world, overgoal_game_system, _caller) = setup();
+        
+        overgoal_game_system.create_overgoal_player(0x1, 0x1, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.create_overgoal_player(0x3, 0x3, 60, 50, 40, 30, 20, 10, 0, 0);
+        
+        let players = overgoal_game_system.get_overgoal_players(array![0x1, 0x2, 0x3].span());
+        
+        // Entries follow the order of the ids
+        assert(players.len() == 3, 'Should return 3 entries');
+        assert(*players.at(0).id == 0x1, 'Player 1 ID should match');
+        assert(*players.at(0).energy == 100, 'Player 1 energy');
+        assert(*players.at(2).id == 0x3, 'Player 3 ID should match');
+        assert(*players.at(2).speed == 50, 'Player 3 speed');
+        
+        // Missing ids come back zeroed
+        assert(*players.at(1).id == 0, 'Missing player should be zero');
+        assert(*players.at(1).universe_player_id == 0, 'Missing universe id');
+    }
+    
+    #[test]
+    #[available_gas(100000000)]
+    fn test_energy_regenerates_lazily() {
+        let (mut world, overgoal_game_system, _caller) = setup();
+        let created_at: u64 = 1736559000;
+        
+        overgoal_game_system.create_overgoal_player(0x1, 0x1, 5, 80, 70, 85, 90, 75, 1, 2);
+        
+        // Two periods later the view shows the regenerated energy, storage is untouched
+        set_block_timestamp(created_at + 2 * ENERGY_REGEN_PERIOD + 5);
+        let players = overgoal_game_system.get_overgoal_players(array![0x1].span());
+        assert(*players.at(0).energy == 5 + 2 * ENERGY_REGEN_AMOUNT, 'View energy should regenerate');
+        
+        let store = StoreTrait::new(world);
+        let player = store.read_overgoal_player_from_id(0x1);
+        assert(player.energy == 5, 'Stored energy should be 5');
+        assert(player.energy_updated_at == created_at, 'Stored timestamp unchanged');
+        
+        // Updating the player materializes it, keeping the progress of the current period
+        overgoal_game_system.set_injury_status(0x1, true);
+        let player = store.read_overgoal_player_from_id(0x1);
+        assert(player.energy == 5 + 2 * ENERGY_REGEN_AMOUNT, 'Energy should be materialized');
+        assert(player.energy_updated_at == created_at + 2 * ENERGY_REGEN_PERIOD, 'Period progress kept');
+        
+        // Regeneration stops at MAX_ENERGY
+        set_block_timestamp(created_at + 1000 * ENERGY_REGEN_PERIOD);
+        let players = overgoal_game_system.get_overgoal_players(array![0x1].span());
+        assert(*players.at(0).energy == MAX_ENERGY, 'Energy should be capped');
+    }
+    
+    #[test]
+    #[available_gas(100000000)]
+    fn test_currency_change_materializes_energy() {
+        let (mut world, overgoal_game_system, _caller) = setup();
+        let created_at: u64 = 1736559000;
+        
+        overgoal_game_system.create_overgoal_player(0x1, 0x1, 5, 80, 70, 85, 90, 75, 1, 2);
+        set_block_timestamp(created_at + ENERGY_REGEN_PERIOD);
+        overgoal_game_system.add_goal_currency(0x1, 100);
+        
+        let store = StoreTrait::new(world);
+        let player = store.read_overgoal_player_from_id(0x1);
+        assert(player.goal_currency == 100, 'Currency should be credited');
+        assert(player.energy == 5 + ENERGY_REGEN_AMOUNT, 'Energy should be materialized');
+        assert(player.energy_updated_at == created_at + ENERGY_REGEN_PERIOD, 'Timestamp should advance');
+    }
+    
+    #[test]
+    #[available_gas(30000000)]
+    fn test_get_season_players() {
+        let (mut world, overgoal_game_system, _caller) = setup();
+        
+        world.write_model_test(
+            @SeasonPlayer {
+                id: 10001,
+                season_id: 1,
+                season_club_id: 101,
+                overgoal_player_id: 1,
+                team_relationship: 50,
+                fans_relationship: 50,
+                season_points: 0,
+                matches_won: 0,
+                matches_lost: 0,
+                trophies_won: 0,
+            }
+        );
+        
+        let season_players = overgoal_game_system.get_season_players(array![10002, 10001].span());
+        
+        assert(season_players.len() == 2, 'Should return 2 entries');
+        assert(*season_players.at(0).id == 0, 'Missing SP should be zero');
+        assert(*season_players.at(1).id == 10001, 'SP 1 ID should match');
+        assert(*season_players.at(1).season_club_id == 101, 'SP 1 club should match');
+    }
+    
+    #[test]
+    #[available_gas(60000000)]
+    fn test_apply_currency_deltas() {
+        let (mut world, overgoal_game_system, _caller) = setup();
+        
+        overgoal_game_system.create_overgoal_player(0x1, 0x11, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.create_overgoal_player(0x2, 0x22, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.create_overgoal_player(0x3, 0x33, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.add_goal_currency(0x2, 100);
+        overgoal_game_system.add_goal_currency(0x3, 50);
+        
+        // Player 1 goes through zero within the batch, player 2 nets to a debit, player 3 nets to 0
+        overgoal_game_system.apply_currency_deltas(
+            array![(0x1, 500), (0x2, -150), (0x3, 20), (0x1, -300), (0x2, 80), (0x3, -20)].span()
+        );
+        
+        let store = StoreTrait::new(world);
+        assert(store.read_overgoal_player_from_id(0x1).goal_currency == 200, 'Player 1 should have 200');
+        assert(store.read_overgoal_player_from_id(0x2).goal_currency == 30, 'Player 2 should have 30');
+        assert(store.read_overgoal_player_from_id(0x3).goal_currency == 50, 'Player 3 should keep 50');
+    }
+    
+    #[test]
+    #[available_gas(60000000)]
+    #[should_panic]
+    fn test_apply_currency_deltas_insufficient_reverts_whole_batch() {
+        let (mut _world, overgoal_game_system, _caller) = setup();
+        
+        overgoal_game_system.create_overgoal_player(0x1, 0x11, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.create_overgoal_player(0x2, 0x22, 100, 80, 70, 85, 90, 75, 1, 2);
+        overgoal_game_system.add_goal_currency(0x2, 100);
+        
+        // Player 1 is credited first, but player 2's net -120 fails the batch before any write
+        overgoal_game_system.apply_currency_deltas(array![(0x1, 500), (0x2, -70), (0x2, -50)].span());
+    }
 }
-
@@ -0,0 +1,462 @@
+// Profiling scenarios: every test runs one of three setups and then exactly one IAdmin /
+// IOvergoalGame entrypoint or Store helper, so `profile_baseline_<setup>` subtracted from
+// `profile_<setup>_<admin|game|store>_<name>` is the cost of that call alone. Run with
+// `sozo test --print-resource-usage --filter profile_` (see scripts/profile_entrypoints.py).
+//
+// The Universe contract is replaced by an empty mock, so the cross-contract calls of
+// create_full_player, seed_player and assign_player_to_club are measured without its own cost.
+
+#[cfg(test)]
+mod tests {
+    // Starknet imports
+    use starknet::{SyscallResultTrait, contract_address_const};
+
+    // Dojo imports
+    use dojo::world::{WorldStorageTrait, IWorldDispatcherTrait};
+    use dojo_cairo_test::{
+        spawn_test_world, NamespaceDef, TestResource, ContractDefTrait,
+        WorldStorageTestTrait
+    };
+
+    // Internal imports
+    use overgoal::store::{Store, StoreTrait};
+    use overgoal::models::club::{m_Club};
+    use overgoal::models::season::{m_Season};
+    use overgoal::models::season_club::{m_SeasonClub};
+    use overgoal::models::season_player::{m_SeasonPlayer, PlayerMatchDelta};
+    use overgoal::models::overgoal_player::{m_OvergoalPlayer};
+    use overgoal::models::roster::{m_Roster, m_RosterEntry, m_RosterSlot};
+    use overgoal::models::fixture::{m_FixtureSchedule, m_Matchday, m_Fixture};
+    use overgoal::models::leaderboard::{m_Leaderboard, m_LeaderboardEntry, leaderboard_score};
+    use overgoal::events::{
+        e_OvergoalPlayerCreated, e_OvergoalPlayerUpdated, e_GoalCurrencyChanged, e_SeasonPlayerCreated,
+        e_SeasonPlayerTransferred, e_SeasonPlayerPointsAdded, e_SeasonPlayerMatchRecorded,
+        e_SeasonPlayerRelationshipsChanged, e_SeasonClubMatchRecorded,
+    };
+    use overgoal::constants::{ROSTER_SCOPE_CLUB_PLAYERS, LEADERBOARD_CLUBS, LEADERBOARD_PLAYERS};
+    use overgoal::systems::admin::{
+        admin, IAdminDispatcher, IAdminDispatcherTrait, PlayerSeed, SeasonPlayerSeed
+    };
+    use overgoal::systems::overgoal_game::{
+        overgoal_game, IOvergoalGameDispatcher, IOvergoalGameDispatcherTrait
+    };
+    use overgoal::tests::mocks::mock_universe;
+
+    #[derive(Copy, Drop)]
+    struct Profile {
+        store: Store,
+        admin: IAdminDispatcher,
+        game: IOvergoalGameDispatcher,
+    }
+
+    fn player_seed(player_id: felt252) -> PlayerSeed {
+        PlayerSeed {
+            player_id,
+            user_id: player_id,
+            body_type: 1,
+            skin_color: 2,
+            beard_type: 3,
+            hair_type: 4,
+            hair_color: 5,
+            energy: 100,
+            speed: 80,
+            leadership: 70,
+            pass: 85,
+            shoot: 90,
+            freekick: 75,
+            visor_type: 1,
+            visor_color: 2,
+        }
+    }
+
+    fn match_deltas() -> Span<PlayerMatchDelta> {
+        array![
+            PlayerMatchDelta {
+                season_player_id: 10001, points: 2, team_relationship_change: 1, fans_relationship_change: 2
+            },
+            PlayerMatchDelta {
+                season_player_id: 10002, points: 5, team_relationship_change: -1, fans_relationship_change: 0
+            },
+        ].span()
+    }
+
+    // Setup "world": both systems deployed against the mock Universe, nothing seeded
+    fn setup_world() -> Profile {
+        let caller = contract_address_const::<0x1337>();
+
+        let ndef = NamespaceDef {
+            namespace: "overgoal",
+            resources: [
+                TestResource::Model(m_Club::TEST_CLASS_HASH),
+                TestResource::Model(m_Season::TEST_CLASS_HASH),
+                TestResource::Model(m_SeasonClub::TEST_CLASS_HASH),
+                TestResource::Model(m_SeasonPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_OvergoalPlayer::TEST_CLASS_HASH),
+                TestResource::Model(m_Roster::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterEntry::TEST_CLASS_HASH),
+                TestResource::Model(m_RosterSlot::TEST_CLASS_HASH),
+                TestResource::Model(m_FixtureSchedule::TEST_CLASS_HASH),
+                TestResource::Model(m_Matchday::TEST_CLASS_HASH),
+                TestResource::Model(m_Fixture::TEST_CLASS_HASH),
+                TestResource::Model(m_Leaderboard::TEST_CLASS_HASH),
+                TestResource::Model(m_LeaderboardEntry::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_OvergoalPlayerUpdated::TEST_CLASS_HASH),
+                TestResource::Event(e_GoalCurrencyChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerCreated::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerTransferred::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerPointsAdded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerMatchRecorded::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonPlayerRelationshipsChanged::TEST_CLASS_HASH),
+                TestResource::Event(e_SeasonClubMatchRecorded::TEST_CLASS_HASH),
+                TestResource::Contract(admin::TEST_CLASS_HASH),
+                TestResource::Contract(overgoal_game::TEST_CLASS_HASH),
+            ].span()
+        };
+
+        let mut world = spawn_test_world(dojo::world::world::TEST_CLASS_HASH, array![ndef].span());
+
+        let (universe_address, _) = starknet::syscalls::deploy_syscall(
+            mock_universe::TEST_CLASS_HASH.try_into().unwrap(), 0, array![].span(), false
+        ).unwrap_syscall();
+
+        world.sync_perms_and_inits(array![
+            ContractDefTrait::new(@"overgoal", @"admin")
+                .with_writer_of([dojo::utils::bytearray_hash(@"overgoal")].span())
+                .with_init_calldata(array![universe_address.into()].span()),
+            ContractDefTrait::new(@"overgoal", @"overgoal_game")
+                .with_writer_of([dojo::utils::bytearray_hash(@"overgoal")].span())
+                .with_init_calldata(array![universe_address.into()].span()),
+        ].span());
+
+        // The Store helper scenarios write from the test itself
+        world.dispatcher.grant_writer(dojo::utils::bytearray_hash(@"overgoal"), caller);
+
+        let (admin_address, _) = world.dns(@"admin").unwrap();
+        let (game_address, _) = world.dns(@"overgoal_game").unwrap();
+
+        starknet::testing::set_contract_address(caller);
+        starknet::testing::set_account_contract_address(caller);
+        starknet::testing::set_block_timestamp(1736559000);
+
+        Profile {
+            store: StoreTrait::new(world),
+            admin: IAdminDispatcher { contract_address: admin_address },
+            game: IOvergoalGameDispatcher { contract_address: game_address },
+        }
+    }
+
+    // Setup "season": season 1 seeded, players 1-4 in season clubs 101-104, player 5 without a
+    // season player, 1000 currency on player 1 and both leaderboards enabled
+    fn setup_season() -> Profile {
+        let profile = setup_world();
+        profile.admin.seed_season_1();
+        profile.admin.seed_players_batch(
+            array![player_seed(1), player_seed(2), player_seed(3), player_seed(4), player_seed(5)].span(),
+            array![
+                SeasonPlayerSeed { season_player_id: 10001, season_id: 1, season_club_id: 101, overgoal_player_id: 1 },
+                SeasonPlayerSeed { season_player_id: 10002, season_id: 1, season_club_id: 102, overgoal_player_id: 2 },
+                SeasonPlayerSeed { season_player_id: 10003, season_id: 1, season_club_id: 103, overgoal_player_id: 3 },
+                SeasonPlayerSeed { season_player_id: 10004, season_id: 1, season_club_id: 104, overgoal_player_id: 4 },
+            ].span()
+        );
+        profile.game.add_goal_currency(1, 1000);
+        profile.admin.set_leaderboard_size(1, LEADERBOARD_CLUBS, 10);
+        profile.admin.set_leaderboard_size(1, LEADERBOARD_PLAYERS, 10);
+        profile
+    }
+
+    // Setup "fixtures": the "season" setup with its whole calendar scheduled
+    fn setup_fixtures() -> Profile {
+        let profile = setup_season();
+        profile.admin.create_fixtures(1, 6);
+        profile
+    }
+
+    // ===============================================
+    // Baselines
+    // ===============================================
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_baseline_world() {
+        setup_world();
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_baseline_season() {
+        setup_season();
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_baseline_fixtures() {
+        setup_fixtures();
+    }
+
+    // ===============================================
+    // IAdmin
+    // ===============================================
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_world_admin_seed_season_1() {
+        let profile = setup_world();
+        profile.admin.seed_season_1();
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_seed_player() {
+        let profile = setup_season();
+        let seed = player_seed(6);
+        profile.admin.seed_player(
+            seed.player_id, seed.user_id, seed.body_type, seed.skin_color, seed.beard_type, seed.hair_type,
+            seed.hair_color, seed.energy, seed.speed, seed.leadership, seed.pass, seed.shoot, seed.freekick,
+            seed.visor_type, seed.visor_color
+        );
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_seed_season_player() {
+        let profile = setup_season();
+        profile.admin.seed_season_player(10005, 1, 101, 5);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_transfer_season_player() {
+        let profile = setup_season();
+        profile.admin.transfer_season_player(10001, 102);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_record_match() {
+        let profile = setup_season();
+        profile.admin.record_match(1, 101, 102, 2, 1, match_deltas());
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_seed_players_batch() {
+        let profile = setup_season();
+        profile.admin.seed_players_batch(
+            array![player_seed(6), player_seed(7)].span(),
+            array![
+                SeasonPlayerSeed { season_player_id: 10006, season_id: 1, season_club_id: 101, overgoal_player_id: 6 },
+                SeasonPlayerSeed { season_player_id: 10007, season_id: 1, season_club_id: 102, overgoal_player_id: 7 },
+            ].span()
+        );
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_get_season_snapshot() {
+        let profile = setup_season();
+        profile.admin.get_season_snapshot(1, 0, 10);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_create_fixtures() {
+        let profile = setup_season();
+        profile.admin.create_fixtures(1, 6);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_fixtures_admin_get_fixture_schedule() {
+        let profile = setup_fixtures();
+        profile.admin.get_fixture_schedule(1);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_fixtures_admin_get_matchday_fixtures() {
+        let profile = setup_fixtures();
+        profile.admin.get_matchday_fixtures(1, 0);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_set_leaderboard_size() {
+        let profile = setup_season();
+        profile.admin.set_leaderboard_size(1, LEADERBOARD_PLAYERS, 20);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_admin_get_leaderboard() {
+        let profile = setup_season();
+        profile.admin.get_leaderboard(1, LEADERBOARD_CLUBS);
+    }
+
+    // ===============================================
+    // IOvergoalGame
+    // ===============================================
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_create_full_player() {
+        let profile = setup_season();
+        profile.game.create_full_player(6, 6, 1, 2, 3, 4, 5, 100, 80, 70, 85, 90, 75, 1, 2);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_create_overgoal_player() {
+        let profile = setup_season();
+        profile.game.create_overgoal_player(6, 6, 100, 80, 70, 85, 90, 75, 1, 2);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_update_overgoal_player_stats() {
+        let profile = setup_season();
+        profile.game.update_overgoal_player_stats(1, 95, 85, 90, 95, 80);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_add_goal_currency() {
+        let profile = setup_season();
+        profile.game.add_goal_currency(1, 100);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_spend_goal_currency() {
+        let profile = setup_season();
+        profile.game.spend_goal_currency(1, 100);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_apply_currency_deltas() {
+        let profile = setup_season();
+        profile.game.apply_currency_deltas(
+            array![(1, -100), (2, 50), (3, 50), (1, 20), (4, 0)].span()
+        );
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_set_injury_status() {
+        let profile = setup_season();
+        profile.game.set_injury_status(1, true);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_assign_player_to_club() {
+        let profile = setup_season();
+        profile.game.assign_player_to_club(5, 500, 1);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_get_overgoal_players() {
+        let profile = setup_season();
+        profile.game.get_overgoal_players(array![1, 2, 3, 4].span());
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_game_get_season_players() {
+        let profile = setup_season();
+        profile.game.get_season_players(array![10001, 10002, 10003, 10004].span());
+    }
+
+    // ===============================================
+    // Store helpers
+    // ===============================================
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_world_store_create_season() {
+        let profile = setup_world();
+        profile.store.create_season(2, "Profile season", 1700352000, 1701993599, 0);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_world_store_create_club() {
+        let profile = setup_world();
+        profile.store.create_club(5, "Profile United");
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_read_overgoal_player_from_id() {
+        let profile = setup_season();
+        profile.store.read_overgoal_player_from_id(1);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_read_season_players() {
+        let profile = setup_season();
+        profile.store.read_season_players(array![10001, 10002, 10003, 10004].span());
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_create_overgoal_player() {
+        let profile = setup_season();
+        profile.store.create_overgoal_player(6, 6, 100, 80, 70, 85, 90, 75, 1, 2);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_update_overgoal_player_stats() {
+        let profile = setup_season();
+        profile.store.update_overgoal_player_stats(1, 95, 85, 90, 95, 80);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_add_overgoal_player_currency() {
+        let profile = setup_season();
+        profile.store.add_overgoal_player_currency(1, 100);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_create_season_player() {
+        let profile = setup_season();
+        profile.store.create_season_player(10005, 1, 101, 5, 50, 50);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_transfer_season_player() {
+        let profile = setup_season();
+        profile.store.transfer_season_player(10001, 102);
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_record_match() {
+        let profile = setup_season();
+        profile.store.record_match(1, 101, 102, 2, 1, match_deltas());
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_update_leaderboard() {
+        let profile = setup_season();
+        profile.store.update_leaderboard(
+            LEADERBOARD_CLUBS, 1, array![(101, leaderboard_score(3, 1)), (102, leaderboard_score(0, 0))].span()
+        );
+    }
+
+    #[test]
+    #[available_gas(1000000000)]
+    fn profile_season_store_roster_append() {
+        let profile = setup_season();
+        profile.store.roster_append(ROSTER_SCOPE_CLUB_PLAYERS, 101, 10005);
+    }
+}